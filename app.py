@@ -1,13 +1,203 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import os
 import tempfile
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Dict, Iterator
 from utils.ai_helpers import AIJobAssistant
-from utils.file_processor import FileProcessor
+from utils.analysis_context import AnalysisContext
+from utils.analysis_cache import analysis_cache
+from utils.application_tracker import DEFAULT_PAGE_SIZE, application_tracker
+from utils.export import EXPORT_FORMATS, MIME_TYPES, DocumentExporter
+from utils.extraction_cache import content_hash
+from utils.file_processor import FileProcessor, extraction_cache
+from utils.generation_pipeline import DOCUMENT_TITLES, DOCUMENTS, DocumentResult, GenerationPipeline, document_tasks
+from utils.instrumentation import metrics
+from utils.job_index import JOB_INDEX_PATH, JobIndex
+from utils.output_store import get_output_store
+from utils.skill_matcher import TAXONOMY_VERSION
+
+# Characters shown in document previews; extraction stops once they are available
+PREVIEW_CHARS = 500
+
+# Generated materials are shared across sessions for an hour, up to this many input combinations
+GENERATION_CACHE_TTL = 3600
+GENERATION_CACHE_ENTRIES = 128
+
+# Rendered downloads kept per distinct document content
+EXPORT_CACHE_ENTRIES = 64
+
+# Date ranges offered by the Applications tab, in days (None keeps every application)
+APPLICATION_PERIODS = {"All time": None, "Last 7 days": 7, "Last 30 days": 30, "Last 365 days": 365}
+
+@st.cache_resource(show_spinner=False)
+def get_assistant() -> AIJobAssistant:
+    """Create the assistant once per process instead of on every rerun"""
+    return AIJobAssistant(analysis_cache=analysis_cache)
+
+@st.cache_resource(show_spinner=False)
+def get_file_processor() -> FileProcessor:
+    return FileProcessor()
+
+@st.cache_resource(show_spinner=False)
+def get_job_index() -> JobIndex:
+    return JobIndex.load(JOB_INDEX_PATH, get_assistant())
 
 # Initialize assistants
-assistant = AIJobAssistant()
-file_processor = FileProcessor()
+assistant = get_assistant()
+file_processor = get_file_processor()
+job_index = get_job_index()
+
+def generation_cache_key(cv_text: str, jd_text: str, linkedin_url: str, linkedin_about: str) -> str:
+    """Key generated materials by hashes of their inputs and the taxonomy they were matched against"""
+    hashes = [content_hash(part.encode('utf-8')) for part in (cv_text, jd_text, linkedin_url, linkedin_about)]
+    return ':'.join(hashes + [TAXONOMY_VERSION])
+
+@st.cache_data(ttl=GENERATION_CACHE_TTL, max_entries=GENERATION_CACHE_ENTRIES * len(DOCUMENTS), show_spinner=False)
+def generate_document(cache_key: str, name: str, _generate: Callable[[], str]) -> str:
+    """Generate one document; only cache_key and name are hashed, the generator is not"""
+    metrics.count('generation_cache.misses')
+    return _generate()
+
+def cached_document(cache_key: str, name: str, generate: Callable[[], str]) -> str:
+    """Return one document from the generation cache, generating it on a miss"""
+    metrics.count('generation_cache.lookups')
+    return generate_document(cache_key, name, generate)
+
+def generate_documents(context: AnalysisContext, linkedin_url: str) -> Iterator[DocumentResult]:
+    """Generate all four documents concurrently, yielding each as soon as it is ready"""
+    # Identical inputs from any session reuse the cached documents
+    cache_key = generation_cache_key(context.cv_text, context.job_description, linkedin_url, context.linkedin_about)
+    
+    # The analysis is shared between all generators
+    tasks = document_tasks(assistant, context, linkedin_url)
+    cached_tasks = {
+        name: partial(cached_document, cache_key, name, task)
+        for name, task in tasks.items()
+    }
+    
+    # Worker threads need the script context to use st.cache_data
+    script_context = get_script_run_ctx()
+    pipeline = GenerationPipeline(
+        thread_initializer=lambda: add_script_run_ctx(threading.current_thread(), script_context)
+    )
+    return pipeline.run(cached_tasks)
+
+@st.cache_resource(show_spinner=False)
+def get_exporter() -> DocumentExporter:
+    return DocumentExporter(get_assistant().pdf_generator)
+
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES, show_spinner=False)
+def export_document(content: str, extension: str) -> bytes:
+    """Render a download once per distinct content instead of on every rerun"""
+    return get_exporter().to_bytes(content, extension)
+
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES, show_spinner=False)
+def export_bundle(documents: Dict[str, str], timestamp: datetime) -> bytes:
+    """Zip all documents in every format in one pass, in memory"""
+    return get_exporter().to_zip(documents, timestamp)
+
+def current_session_id() -> str:
+    """Return the Streamlit session id, which owns the files a session saves to the output store"""
+    script_context = get_script_run_ctx()
+    return script_context.session_id if script_context else "default"
+
+def render_download_buttons(name: str):
+    """Offer the edited document as in-memory TXT and PDF downloads"""
+    content = st.session_state.edited_content[name]
+    timestamp = st.session_state.generated_materials['timestamp']
+    for column, extension in zip(st.columns(len(EXPORT_FORMATS)), EXPORT_FORMATS):
+        with column:
+            try:
+                st.download_button(
+                    f"💾 Download {DOCUMENT_TITLES[name]} as {extension.upper()}",
+                    data=export_document(content, extension),
+                    file_name=DocumentExporter.export_filename(name, extension, timestamp),
+                    mime=MIME_TYPES[extension],
+                    key=f"download_{name}_{extension}"
+                )
+            except Exception as e:
+                st.error(f"Error exporting {extension.upper()}: {str(e)}")
+
+def remove_application():
+    """Delete the selected application before the rerun draws the table without it"""
+    application_id = st.session_state.application_to_remove
+    application_tracker.delete(application_id)
+    st.session_state.application_removed = application_id
+
+def render_applications():
+    """Browse tracked applications one page at a time, newest first"""
+    st.subheader("Tracked Applications")
+    try:
+        st.write(f"**Applications recorded:** {len(application_tracker)}")
+    except Exception as e:
+        st.warning(f"Application tracker unavailable: {e}")
+        return
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    company = col1.text_input("Company", key="applications_company").strip()
+    skill = col2.text_input("Missing skill", key="applications_skill").strip()
+    period = col3.selectbox("Period", list(APPLICATION_PERIODS), key="applications_period")
+    min_match = col4.slider("Minimum match %", min_value=0, max_value=100, value=0, key="applications_min_match")
+    page_size = col5.selectbox("Per page", [25, DEFAULT_PAGE_SIZE, 100], index=1, key="applications_page_size")
+    
+    days = APPLICATION_PERIODS[period]
+    filters = {
+        'company': company or None,
+        'skill': skill or None,
+        'since': (datetime.now() - timedelta(days=days)).timestamp() if days else None,
+        'min_match': min_match or None,
+        'limit': page_size
+    }
+    
+    # Cursors of the pages visited so far; any change of filter starts again from the newest page
+    filter_key = (company.lower(), skill.lower(), period, min_match, page_size)
+    if st.session_state.get('applications_filter') != filter_key:
+        st.session_state.applications_filter = filter_key
+        st.session_state.applications_cursors = [None]
+    cursors = st.session_state.applications_cursors
+    
+    try:
+        page = application_tracker.page(after=cursors[-1], **filters)
+    except Exception as e:
+        st.error(f"Error reading applications: {str(e)}")
+        return
+    
+    if page['applications']:
+        st.dataframe([
+            {
+                'ID': application['id'],
+                'Date': datetime.fromtimestamp(application['created']).strftime("%Y-%m-%d %H:%M"),
+                'Company': application['company'],
+                'Position': application['position'],
+                'Match %': application['match_percentage'],
+                'Missing Skills': ', '.join(application['missing_skills'][:10]),
+                'Saved Files': ', '.join(
+                    file_id for file_ids in application['file_ids'].values() for file_id in file_ids.values()
+                )
+            }
+            for application in page['applications']
+        ], use_container_width=True, hide_index=True)
+    else:
+        st.info("No applications match these filters. Generated materials are recorded here automatically.")
+    
+    # The callbacks move the cursor before the rerun they trigger
+    col1, col2, col3 = st.columns([1, 2, 1])
+    col1.button("⬅️ Previous", key="applications_previous", disabled=len(cursors) == 1, on_click=cursors.pop)
+    col2.caption(f"Page {len(cursors)}")
+    col3.button("Next ➡️", key="applications_next", disabled=page['next_cursor'] is None,
+                on_click=cursors.append, args=(page['next_cursor'],))
+    
+    removed = st.session_state.pop('application_removed', None)
+    if removed is not None:
+        st.success(f"Removed application {removed}")
+    if page['applications']:
+        application_ids = [application['id'] for application in page['applications']]
+        st.selectbox("Remove an application", application_ids, key="application_to_remove")
+        st.button("🗑️ Remove Application", key="remove_application", on_click=remove_application)
 
 def main():
     st.set_page_config(
@@ -72,20 +262,14 @@ def main():
             'interview_preparation': ''
         }
     
-    if 'last_saved_files' not in st.session_state:
-        st.session_state.last_saved_files = {
-            'cv_improvements_txt': None,
-            'cv_improvements_pdf': None,
-            'linkedin_suggestions_txt': None,
-            'linkedin_suggestions_pdf': None,
-            'motivation_letter_txt': None,
-            'motivation_letter_pdf': None,
-            'interview_preparation_txt': None,
-            'interview_preparation_pdf': None
-        }
+    # Output store file ids of saved documents, by document and format
+    if 'saved_outputs' not in st.session_state:
+        st.session_state.saved_outputs = {}
     
     # Main content
-    tab1, tab2, tab3 = st.tabs(["📄 Document Upload", "🛠️ Improvement Suggestions", "⚙️ Settings"])
+    tab1, tab2, tab3, tab_applications, tab4 = st.tabs([
+        "📄 Document Upload", "🛠️ Improvement Suggestions", "🔎 Job Search", "📋 Applications", "⚙️ Settings"
+    ])
     
     with tab1:
         col1, col2 = st.columns([1, 1])
@@ -150,9 +334,9 @@ def main():
             if cv_file:
                 st.write(f"**CV Uploaded:** {cv_file.name}")
                 try:
-                    cv_preview = file_processor.process_uploaded_file(cv_file)
-                    with st.expander("CV Preview (First 500 characters)"):
-                        st.text(cv_preview[:500] + "..." if len(cv_preview) > 500 else cv_preview)
+                    cv_preview = file_processor.process_uploaded_file(cv_file, max_chars=PREVIEW_CHARS + 1)
+                    with st.expander(f"CV Preview (First {PREVIEW_CHARS} characters)"):
+                        st.text(cv_preview[:PREVIEW_CHARS] + "..." if len(cv_preview) > PREVIEW_CHARS else cv_preview)
                 except Exception as e:
                     st.error(f"Error reading CV: {str(e)}")
             
@@ -160,15 +344,15 @@ def main():
                 if jd_file:
                     st.write(f"**JD Uploaded:** {jd_file.name}")
                     try:
-                        jd_preview = file_processor.process_uploaded_file(jd_file)
-                        with st.expander("Job Description Preview (First 500 characters)"):
-                            st.text(jd_preview[:500] + "..." if len(jd_preview) > 500 else jd_preview)
+                        jd_preview = file_processor.process_uploaded_file(jd_file, max_chars=PREVIEW_CHARS + 1)
+                        with st.expander(f"Job Description Preview (First {PREVIEW_CHARS} characters)"):
+                            st.text(jd_preview[:PREVIEW_CHARS] + "..." if len(jd_preview) > PREVIEW_CHARS else jd_preview)
                     except Exception as e:
                         st.error(f"Error reading job description: {str(e)}")
                 else:
                     st.write("**Job Description:** Text input")
-                    with st.expander("Job Description Preview (First 500 characters)"):
-                        st.text(jd_text[:500] + "..." if len(jd_text) > 500 else jd_text)
+                    with st.expander(f"Job Description Preview (First {PREVIEW_CHARS} characters)"):
+                        st.text(jd_text[:PREVIEW_CHARS] + "..." if len(jd_text) > PREVIEW_CHARS else jd_text)
             
             if linkedin_url:
                 st.write(f"**LinkedIn URL:** {linkedin_url}")
@@ -182,62 +366,90 @@ def main():
         if 'generated_materials' not in st.session_state:
             st.session_state.generated_materials = None
         
-        if generate_btn and (cv_file or jd_file or jd_text):
-            with st.spinner("🔄 Analyzing documents and generating improvement suggestions..."):
-                try:
-                    # Process files
-                    cv_text = ""
-                    jd_text_final = jd_text
-                    
-                    if cv_file:
-                        cv_text = file_processor.process_uploaded_file(cv_file)
-                    
-                    if jd_file and not jd_text:
-                        jd_text_final = file_processor.process_uploaded_file(jd_file)
-                    
-                    # Generate improvement suggestions using NEW methods
-                    cv_improvements = assistant.generate_cv_improvements(cv_text, jd_text_final, linkedin_url)
-                    
-                    # Generate LinkedIn suggestions if About section is provided
-                    if linkedin_about:
-                        linkedin_suggestions = assistant.generate_linkedin_suggestions(linkedin_about, jd_text_final, cv_text)
-                    else:
-                        linkedin_suggestions = assistant.generate_linkedin_improvements(cv_text, jd_text_final, linkedin_url)
-                    
-                    motivation_letter = assistant.generate_motivation_letter(cv_text, jd_text_final, linkedin_url)
-                    interview_preparation = assistant.generate_interview_preparation(jd_text_final, cv_text)
-                    
-                    # Store in session state
-                    st.session_state.generated_materials = {
-                        'cv_improvements': cv_improvements,
-                        'linkedin_suggestions': linkedin_suggestions,
-                        'motivation_letter': motivation_letter,
-                        'interview_preparation': interview_preparation,
-                        'timestamp': datetime.now()
-                    }
-                    
-                    # Initialize edited content with generated materials
-                    st.session_state.edited_content = {
-                        'cv_improvements': cv_improvements,
-                        'linkedin_suggestions': linkedin_suggestions,
-                        'motivation_letter': motivation_letter,
-                        'interview_preparation': interview_preparation
-                    }
-                    
-                    st.success("✅ Improvement suggestions generated successfully!")
-                    
-                except Exception as e:
-                    st.error(f"Error generating materials: {str(e)}")
+        generating = generate_btn and (cv_file or jd_file or jd_text)
+        if generating:
+            message_slot = st.empty()
+            progress = st.status("🔄 Analyzing documents and generating improvement suggestions...", expanded=True)
         
-        # Display improvement suggestions with editing capability
-        if st.session_state.generated_materials:
+        if generating or st.session_state.generated_materials:
             doc_tab1, doc_tab2, doc_tab3, doc_tab4 = st.tabs([
                 "📝 CV Improvements", 
                 "🔗 LinkedIn Suggestions",
                 "💌 Motivation Letter", 
                 "🎯 Interview Prep"
             ])
-            
+        
+        if generating:
+            generation_started = time.perf_counter()
+            try:
+                # Process files
+                cv_text = ""
+                jd_text_final = jd_text
+                
+                if cv_file:
+                    cv_text = file_processor.process_uploaded_file(cv_file)
+                
+                if jd_file and not jd_text:
+                    jd_text_final = file_processor.process_uploaded_file(jd_file)
+                
+                # One status slot per document tab, filled as soon as that document is ready
+                slots = {}
+                for name, doc_tab in zip(DOCUMENTS, (doc_tab1, doc_tab2, doc_tab3, doc_tab4)):
+                    with doc_tab:
+                        slots[name] = st.empty()
+                        slots[name].info(f"⏳ Generating {DOCUMENT_TITLES[name]}...")
+                
+                # Analyze the documents once for the generators and the application tracker
+                context = assistant.analyze(cv_text, jd_text_final, linkedin_about)
+                
+                materials = {name: '' for name in DOCUMENTS}
+                failed = []
+                for result in generate_documents(context, linkedin_url):
+                    title = DOCUMENT_TITLES[result.name]
+                    if result.error:
+                        failed.append(result.name)
+                        progress.write(f"❌ {title} failed after {result.seconds:.2f}s")
+                        slots[result.name].error(f"Error generating {title}: {result.error}")
+                        continue
+                    materials[result.name] = result.content
+                    progress.write(f"✅ {title} ready in {result.seconds:.2f}s")
+                    slots[result.name].markdown(f"✅ *Generated in {result.seconds:.2f}s*\n\n{result.content}")
+                
+                # Store in session state
+                st.session_state.generated_materials = dict(materials, timestamp=datetime.now())
+                
+                # Initialize edited content with generated materials; the editors below replace the previews
+                st.session_state.edited_content = dict(materials)
+                for name in DOCUMENTS:
+                    if name not in failed:
+                        slots[name].empty()
+                
+                if failed:
+                    failed_titles = ', '.join(DOCUMENT_TITLES[name] for name in failed)
+                    progress.update(label=f"Generation finished with errors: {failed_titles}", state="error")
+                    message_slot.error(f"Error generating materials: {failed_titles}")
+                else:
+                    progress.update(label="Generation finished", state="complete", expanded=False)
+                    message_slot.success("✅ Improvement suggestions generated successfully!")
+                metrics.record('generate.total', time.perf_counter() - generation_started)
+                
+                # Track the application once something was generated; saved files are linked to it later
+                st.session_state.application_id = None
+                if len(failed) < len(DOCUMENTS):
+                    try:
+                        st.session_state.application_id = application_tracker.record(
+                            jd_text_final, context.company_name, context.position_name,
+                            context.cv_match['match_percentage'], context.cv_match['skills_missing']
+                        )
+                    except Exception as e:
+                        st.warning(f"Application not tracked: {e}")
+                
+            except Exception as e:
+                progress.update(label="Generation failed", state="error")
+                message_slot.error(f"Error generating materials: {str(e)}")
+        
+        # Display improvement suggestions with editing capability
+        if st.session_state.generated_materials:
             with doc_tab1:
                 st.subheader("CV Improvement Suggestions")
                 
@@ -252,28 +464,7 @@ def main():
                 # Update session state with edited content
                 st.session_state.edited_content['cv_improvements'] = edited_cv_improvements
                 
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("💾 Save CV Improvements as TXT", key="save_cv_improvements_txt"):
-                        filename = f"cv_improvements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                        filepath = assistant.save_as_txt(st.session_state.edited_content['cv_improvements'], filename)
-                        st.session_state.last_saved_files['cv_improvements_txt'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                with col2:
-                    if st.button("💾 Save CV Improvements as PDF", key="save_cv_improvements_pdf"):
-                        filename = f"cv_improvements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                        filepath = assistant.save_as_pdf(st.session_state.edited_content['cv_improvements'], filename)
-                        st.session_state.last_saved_files['cv_improvements_pdf'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                # Show last saved files
-                if st.session_state.last_saved_files['cv_improvements_txt'] or st.session_state.last_saved_files['cv_improvements_pdf']:
-                    with st.expander("📁 Last Saved Files"):
-                        if st.session_state.last_saved_files['cv_improvements_txt']:
-                            st.write(f"TXT: `{st.session_state.last_saved_files['cv_improvements_txt']}`")
-                        if st.session_state.last_saved_files['cv_improvements_pdf']:
-                            st.write(f"PDF: `{st.session_state.last_saved_files['cv_improvements_pdf']}`")
+                render_download_buttons('cv_improvements')
             
             with doc_tab2:
                 st.subheader("LinkedIn Optimization Suggestions")
@@ -289,28 +480,7 @@ def main():
                 # Update session state with edited content
                 st.session_state.edited_content['linkedin_suggestions'] = edited_linkedin_suggestions
                 
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("💾 Save LinkedIn Suggestions as TXT", key="save_linkedin_suggestions_txt"):
-                        filename = f"linkedin_suggestions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                        filepath = assistant.save_as_txt(st.session_state.edited_content['linkedin_suggestions'], filename)
-                        st.session_state.last_saved_files['linkedin_suggestions_txt'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                with col2:
-                    if st.button("💾 Save LinkedIn Suggestions as PDF", key="save_linkedin_suggestions_pdf"):
-                        filename = f"linkedin_suggestions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                        filepath = assistant.save_as_pdf(st.session_state.edited_content['linkedin_suggestions'], filename)
-                        st.session_state.last_saved_files['linkedin_suggestions_pdf'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                # Show last saved files
-                if st.session_state.last_saved_files['linkedin_suggestions_txt'] or st.session_state.last_saved_files['linkedin_suggestions_pdf']:
-                    with st.expander("📁 Last Saved Files"):
-                        if st.session_state.last_saved_files['linkedin_suggestions_txt']:
-                            st.write(f"TXT: `{st.session_state.last_saved_files['linkedin_suggestions_txt']}`")
-                        if st.session_state.last_saved_files['linkedin_suggestions_pdf']:
-                            st.write(f"PDF: `{st.session_state.last_saved_files['linkedin_suggestions_pdf']}`")
+                render_download_buttons('linkedin_suggestions')
             
             with doc_tab3:
                 st.subheader("Tailored Motivation Letter")
@@ -326,28 +496,7 @@ def main():
                 # Update session state with edited content
                 st.session_state.edited_content['motivation_letter'] = edited_letter
                 
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("💾 Save Letter as TXT", key="save_letter_txt"):
-                        filename = f"motivation_letter_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                        filepath = assistant.save_as_txt(st.session_state.edited_content['motivation_letter'], filename)
-                        st.session_state.last_saved_files['motivation_letter_txt'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                with col2:
-                    if st.button("💾 Save Letter as PDF", key="save_letter_pdf"):
-                        filename = f"motivation_letter_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                        filepath = assistant.save_as_pdf(st.session_state.edited_content['motivation_letter'], filename)
-                        st.session_state.last_saved_files['motivation_letter_pdf'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                # Show last saved files
-                if st.session_state.last_saved_files['motivation_letter_txt'] or st.session_state.last_saved_files['motivation_letter_pdf']:
-                    with st.expander("📁 Last Saved Files"):
-                        if st.session_state.last_saved_files['motivation_letter_txt']:
-                            st.write(f"TXT: `{st.session_state.last_saved_files['motivation_letter_txt']}`")
-                        if st.session_state.last_saved_files['motivation_letter_pdf']:
-                            st.write(f"PDF: `{st.session_state.last_saved_files['motivation_letter_pdf']}`")
+                render_download_buttons('motivation_letter')
             
             with doc_tab4:
                 st.subheader("Interview Preparation Guide")
@@ -363,33 +512,49 @@ def main():
                 # Update session state with edited content
                 st.session_state.edited_content['interview_preparation'] = edited_interview_prep
                 
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("💾 Save Interview Prep as TXT", key="save_interview_prep_txt"):
-                        filename = f"interview_preparation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                        filepath = assistant.save_as_txt(st.session_state.edited_content['interview_preparation'], filename)
-                        st.session_state.last_saved_files['interview_preparation_txt'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                with col2:
-                    if st.button("💾 Save Interview Prep as PDF", key="save_interview_prep_pdf"):
-                        filename = f"interview_preparation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                        filepath = assistant.save_as_pdf(st.session_state.edited_content['interview_preparation'], filename)
-                        st.session_state.last_saved_files['interview_preparation_pdf'] = filepath
-                        st.success(f"Saved as: {filepath}")
-                
-                # Show last saved files
-                if st.session_state.last_saved_files['interview_preparation_txt'] or st.session_state.last_saved_files['interview_preparation_pdf']:
-                    with st.expander("📁 Last Saved Files"):
-                        if st.session_state.last_saved_files['interview_preparation_txt']:
-                            st.write(f"TXT: `{st.session_state.last_saved_files['interview_preparation_txt']}`")
-                        if st.session_state.last_saved_files['interview_preparation_pdf']:
-                            st.write(f"PDF: `{st.session_state.last_saved_files['interview_preparation_pdf']}`")
+                render_download_buttons('interview_preparation')
             
-            # Add a reset button to revert to original generated content
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
+                # Download every document in both formats as one zip
+                try:
+                    timestamp = st.session_state.generated_materials['timestamp']
+                    st.download_button(
+                        "📦 Download All Documents (TXT + PDF)",
+                        data=export_bundle(dict(st.session_state.edited_content), timestamp),
+                        file_name=DocumentExporter.export_filename("application_materials", "zip", timestamp),
+                        mime=MIME_TYPES['zip'],
+                        type="primary",
+                        use_container_width=True,
+                        key="download_all"
+                    )
+                except Exception as e:
+                    st.error(f"Error building download bundle: {str(e)}")
+                
+                # Optionally keep a copy on the server, deduplicated by content
+                if st.button("🗄️ Save All to Output Store", use_container_width=True, key="save_to_store"):
+                    try:
+                        session_id = current_session_id()
+                        for name in DOCUMENTS:
+                            content = st.session_state.edited_content[name]
+                            st.session_state.saved_outputs[name] = {
+                                extension: get_output_store().put(export_document(content, extension), extension, session_id)
+                                for extension in EXPORT_FORMATS
+                            }
+                        if st.session_state.get('application_id') is not None:
+                            application_tracker.attach_files(st.session_state.application_id,
+                                                             st.session_state.saved_outputs)
+                        st.success(f"Saved {len(DOCUMENTS) * len(EXPORT_FORMATS)} files to the output store!")
+                    except Exception as e:
+                        st.error(f"Error saving to output store: {str(e)}")
+                
+                if st.session_state.saved_outputs:
+                    with st.expander("📁 Saved Files"):
+                        for name, file_ids in st.session_state.saved_outputs.items():
+                            st.write(f"**{DOCUMENT_TITLES[name]}:** " + ", ".join(f"`{file_id}`" for file_id in file_ids.values()))
+                
+                # Add a reset button to revert to original generated content
                 if st.button("🔄 Reset to Original Generated Content", type="secondary", key="reset_content"):
                     st.session_state.edited_content = {
                         'cv_improvements': st.session_state.generated_materials['cv_improvements'],
@@ -400,6 +565,67 @@ def main():
                     st.success("Content reset to original generated versions!")
     
     with tab3:
+        st.subheader("Find Matching Jobs")
+        st.write(f"**Indexed job descriptions:** {len(job_index)}")
+        
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            # Add postings to the index
+            new_jds = st.file_uploader(
+                "Add job descriptions to the index",
+                type=['pdf', 'docx', 'txt'],
+                accept_multiple_files=True,
+                key="job_index_uploader"
+            )
+            if st.button("➕ Add to Index", key="add_to_job_index", disabled=not new_jds):
+                added = 0
+                for uploaded_jd in new_jds:
+                    try:
+                        job_index.add(uploaded_jd.name, file_processor.process_uploaded_file(uploaded_jd))
+                        added += 1
+                    except Exception as e:
+                        st.error(f"Error reading {uploaded_jd.name}: {str(e)}")
+                job_index.save(JOB_INDEX_PATH)
+                st.success(f"Added {added} job descriptions to the index")
+            
+            # Remove postings from the index
+            indexed_jobs = sorted(job['job_id'] for job in job_index.jobs())
+            if indexed_jobs:
+                job_to_remove = st.selectbox("Remove a job description", indexed_jobs, key="job_to_remove")
+                if st.button("🗑️ Remove from Index", key="remove_from_job_index"):
+                    job_index.remove(job_to_remove)
+                    job_index.save(JOB_INDEX_PATH)
+                    st.success(f"Removed {job_to_remove}")
+        
+        with col2:
+            top_k = st.slider("Number of results", min_value=1, max_value=50, value=10, key="job_search_top_k")
+            if not cv_file:
+                st.info("Upload your CV on the Document Upload tab to search the index.")
+            elif st.button("🔎 Find Best Matching Jobs", type="primary", key="job_search_btn"):
+                try:
+                    cv_text = file_processor.process_uploaded_file(cv_file)
+                    results = job_index.query(cv_text, top_k=top_k)
+                    if results:
+                        st.dataframe([
+                            {
+                                'Job': result['job_id'],
+                                'Position': result['title'],
+                                'Company': result['company'],
+                                'Match %': result['match_percentage'],
+                                'Missing Skills': ', '.join(result['skills_missing'][:10])
+                            }
+                            for result in results
+                        ], use_container_width=True)
+                    else:
+                        st.warning("No indexed job matches the skills in your CV.")
+                except Exception as e:
+                    st.error(f"Error searching jobs: {str(e)}")
+    
+    with tab_applications:
+        render_applications()
+    
+    with tab4:
         st.subheader("Configuration & Enhancements")
         
         col1, col2 = st.columns(2)
@@ -413,6 +639,7 @@ def main():
             - Motivation letter generation
             - Interview preparation guide
             - File export (TXT/PDF)
+            - Application tracking
             """)
         
         with col2:
@@ -421,7 +648,6 @@ def main():
             - AI integration (OpenAI/Ollama)
             - LinkedIn profile scraping
             - Advanced templates
-            - Application tracking
             """)
         
         # File management section
@@ -430,19 +656,11 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("🗑️ Clear Generated Files", key="clear_files"):
-                import shutil
+            if st.button("🗑️ Clear My Saved Files", key="clear_files"):
                 try:
-                    if os.path.exists('generated_files'):
-                        shutil.rmtree('generated_files')
-                    os.makedirs('generated_files', exist_ok=True)
-                    st.session_state.last_saved_files = {
-                        'cv_improvements_txt': None, 'cv_improvements_pdf': None,
-                        'linkedin_suggestions_txt': None, 'linkedin_suggestions_pdf': None,
-                        'motivation_letter_txt': None, 'motivation_letter_pdf': None,
-                        'interview_preparation_txt': None, 'interview_preparation_pdf': None
-                    }
-                    st.success("Generated files cleared!")
+                    removed = get_output_store().clear_session(current_session_id())
+                    st.session_state.saved_outputs = {}
+                    st.success(f"Cleared {removed} saved files! Files other sessions saved are kept.")
                 except Exception as e:
                     st.error(f"Error clearing files: {e}")
         
@@ -450,6 +668,111 @@ def main():
             if st.button("Clear All Data", type="secondary", key="clear_all_data"):
                 st.session_state.clear()
                 st.success("All data cleared!")
+        
+        # Output store statistics
+        st.subheader("Output Store")
+        store_stats = get_output_store().stats()
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Stored Files", store_stats['files'])
+        col2.metric("Disk Usage", f"{store_stats['current_bytes'] / 1024 / 1024:.1f} MB")
+        col3.metric("Deduplicated Saves", store_stats['dedup_hits'])
+        col4.metric("Evictions", store_stats['evictions'])
+        st.caption(
+            f"Limits: {store_stats['max_bytes'] / 1024 / 1024:.0f} MB total, "
+            f"files kept {store_stats['max_age_seconds'] // 3600} hours, "
+            f"{store_stats['session_quota_bytes'] / 1024 / 1024:.0f} MB per session "
+            f"(this session: {get_output_store().session_bytes(current_session_id()) / 1024:.0f} KB)"
+        )
+        
+        # Upload cache statistics
+        st.subheader("Upload Cache")
+        cache_stats = extraction_cache.stats()
+        lookups = cache_stats['hits'] + cache_stats['misses']
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Hits", cache_stats['hits'])
+        col2.metric("Misses", cache_stats['misses'])
+        col3.metric("Hit Rate", f"{cache_stats['hits'] / lookups:.0%}" if lookups else "-")
+        col4.metric("Entries", cache_stats['entries'])
+        st.caption(
+            f"Using {cache_stats['current_bytes'] / 1024 / 1024:.1f} MB of "
+            f"{cache_stats['max_bytes'] / 1024 / 1024:.0f} MB, {cache_stats['evictions']} evictions"
+        )
+        
+        if st.button("Clear Upload Cache", key="clear_upload_cache"):
+            extraction_cache.clear()
+            st.success("Upload cache cleared!")
+        
+        st.subheader("Generation Cache")
+        st.write(f"Generated materials are reused for identical inputs for {GENERATION_CACHE_TTL // 60} minutes "
+                 f"(up to {GENERATION_CACHE_ENTRIES} input combinations, taxonomy {TAXONOMY_VERSION}).")
+        
+        if st.button("Clear Generation Cache", key="clear_generation_cache"):
+            generate_document.clear()
+            st.success("Generation cache cleared!")
+        
+        # Requirement and match analyses persisted across restarts and shared by worker processes
+        st.subheader("Analysis Cache")
+        try:
+            analysis_stats = analysis_cache.stats()
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Job Requirements", analysis_stats['entries_by_kind'].get('requirements', 0))
+            col2.metric("CV Matches", analysis_stats['entries_by_kind'].get('cv_match', 0))
+            col3.metric("Size", f"{analysis_stats['current_bytes'] / 1024 / 1024:.1f} MB")
+            st.caption(
+                f"{analysis_stats['path']}, limit {analysis_stats['max_bytes'] / 1024 / 1024:.0f} MB, "
+                f"engine {analysis_stats['engine_version']}"
+            )
+            
+            if st.button("Clear Analysis Cache", key="clear_analysis_cache"):
+                analysis_cache.clear()
+                st.success("Analysis cache cleared!")
+        except Exception as e:
+            st.warning(f"Analysis cache unavailable: {e}")
+        
+        # Stage timings and counters, recorded only while diagnostics are on
+        st.subheader("Diagnostics")
+        diagnostics_enabled = st.checkbox(
+            "Record stage timings and counters (applies to every session)",
+            value=metrics.enabled,
+            key="diagnostics_enabled"
+        )
+        if diagnostics_enabled != metrics.enabled:
+            if diagnostics_enabled:
+                metrics.enable()
+            else:
+                metrics.disable()
+        
+        snapshot = metrics.snapshot()
+        if snapshot['stages']:
+            st.table([
+                {
+                    'Stage': name,
+                    'Calls': stage['calls'],
+                    'Total (ms)': round(stage['total_seconds'] * 1000, 1),
+                    'Mean (ms)': round(stage['total_seconds'] * 1000 / stage['calls'], 2),
+                    'Max (ms)': round(stage['max_seconds'] * 1000, 2),
+                    'Last (ms)': round(stage['last_seconds'] * 1000, 2)
+                }
+                for name, stage in snapshot['stages'].items()
+            ])
+        if snapshot['counters']:
+            st.table([{'Counter': name, 'Value': value} for name, value in snapshot['counters'].items()])
+        if not snapshot['stages'] and not snapshot['counters']:
+            st.info("Nothing recorded yet. Enable diagnostics and generate materials to collect timings.")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button("Export JSON", data=metrics.to_json(), file_name="diagnostics.json",
+                               mime="application/json", key="export_diagnostics_json")
+        with col2:
+            st.download_button("Export Prometheus", data=metrics.to_prometheus(), file_name="diagnostics.prom",
+                               mime="text/plain", key="export_diagnostics_prometheus")
+        with col3:
+            if st.button("Reset Diagnostics", key="reset_diagnostics"):
+                metrics.reset()
+                st.success("Diagnostics reset!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Achievement extraction time of the segment-bounded engine against per-pattern regexes.
+
+Period-poor inputs mimic PDF text where line breaks were collapsed and
+bullets carry no full stops, so `[^.]*` in the legacy patterns spans pages.
+Without terminators, every verb occurrence makes a legacy pattern scan to
+the end of the text and back, which grows quadratically with length.
+
+Run from the project root:
+    python -m benchmarks.bench_achievements
+"""
+import argparse
+import re
+import time
+from typing import Callable, List
+
+from benchmarks.corpus import synthetic_cv
+from utils.achievements import extract_achievements
+
+LEGACY_PATTERNS = [
+    r'increased\s+[^.]*\s+by\s+(\d+%|\$\d+)',
+    r'reduced\s+[^.]*\s+by\s+(\d+%|\$\d+)',
+    r'improved\s+[^.]*\s+by\s+(\d+%)',
+    r'saved\s+[^.]*\s+(\d+%|\$\d+)',
+    r'achieved\s+[^.]*\s+(\d+%)',
+    r'led\s+[^.]*\s+team',
+    r'managed\s+[^.]*\s+project',
+    r'developed\s+[^.]*\s+system',
+    r'implemented\s+[^.]*\s+solution'
+]
+
+
+def legacy_extract_achievements(cv_text: str) -> List[str]:
+    """Baseline that runs every pattern over the whole lowered text"""
+    achievements = []
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, cv_text.lower()):
+            achievement = match.group(0).capitalize()
+            if achievement not in achievements:
+                achievements.append(achievement)
+    return achievements[:10]
+
+
+def period_poor(text: str) -> str:
+    """Drop full stops and collapse line breaks, as PDF extraction often leaves CV text"""
+    return ' '.join(text.replace('.', '').split())
+
+
+def without_terminators(text: str) -> str:
+    """Period-poor text with the words and metrics that close an achievement removed"""
+    return re.sub(r'team|project|system|solution|by|%|\$', '', period_poor(text))
+
+
+def best_time(func: Callable[[str], List[str]], text: str, repeat: int) -> float:
+    """Return the best of repeat call times in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'pages':>5} {'input':>14} {'size (KB)':>10} {'legacy (ms)':>12} {'engine (ms)':>12} "
+          f"{'engine us/KB':>13} {'speedup':>8}")
+    for pages in args.pages:
+        cv_text = synthetic_cv(pages)
+        inputs = (('punctuated', cv_text), ('period-poor', period_poor(cv_text)),
+                  ('no-terminators', without_terminators(cv_text)))
+        for label, text in inputs:
+            size_kb = len(text) / 1024
+            legacy = best_time(legacy_extract_achievements, text, args.repeat)
+            engine = best_time(extract_achievements, text, args.repeat)
+            print(f"{pages:>5} {label:>14} {size_kb:>10.0f} {legacy * 1000:>12.1f} {engine * 1000:>12.2f} "
+                  f"{engine * 1e6 / size_kb:>13.1f} {legacy / engine:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
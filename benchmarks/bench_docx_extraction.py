@@ -0,0 +1,51 @@
+"""DOCX extraction cost of the streaming and python-docx backends as documents grow.
+
+Run from the project root:
+    python -m benchmarks.bench_docx_extraction
+"""
+import argparse
+import io
+import random
+
+from docx import Document
+
+from benchmarks.bench_pdf_extraction import WORDS, measure
+from utils.file_processor import FileProcessor
+
+
+def synthetic_docx(paragraphs: int, table_rows: int, seed: int = 1) -> bytes:
+    """Return a DOCX with the given number of paragraphs and a 4-column table after every 50"""
+    rng = random.Random(seed)
+    doc = Document()
+    for index in range(paragraphs):
+        doc.add_paragraph(' '.join(rng.choice(WORDS) for _ in range(14)))
+        if index % 50 == 49 or (paragraphs < 50 and index == paragraphs - 1):
+            table = doc.add_table(rows=table_rows, cols=4)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = ' '.join(rng.choice(WORDS) for _ in range(3))
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[50, 500, 2000])
+    parser.add_argument('--table-rows', type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'paragraphs':>10} {'size (KB)':>10} {'python-docx (ms)':>17} {'peak (KB)':>10} "
+          f"{'stream (ms)':>12} {'peak (KB)':>10} {'speedup':>8}")
+    for paragraphs in args.paragraphs:
+        data = synthetic_docx(paragraphs, args.table_rows)
+        model_time, model_peak = measure(
+            lambda: FileProcessor.extract_text_from_docx(io.BytesIO(data), backend='python-docx'))
+        stream_time, stream_peak = measure(
+            lambda: FileProcessor.extract_text_from_docx(io.BytesIO(data), backend='stream'))
+        print(f"{paragraphs:>10} {len(data) / 1024:>10.0f} {model_time * 1000:>17.1f} {model_peak / 1024:>10.0f} "
+              f"{stream_time * 1000:>12.1f} {stream_peak / 1024:>10.0f} {model_time / stream_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
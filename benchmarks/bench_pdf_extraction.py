@@ -0,0 +1,60 @@
+"""PDF extraction cost for full documents and previews as page count grows.
+
+Run from the project root:
+    python -m benchmarks.bench_pdf_extraction
+"""
+import argparse
+import io
+import random
+import time
+import tracemalloc
+
+from fpdf import FPDF
+
+from utils.file_processor import FileProcessor
+
+WORDS = ['python', 'engineer', 'delivered', 'platform', 'customers', 'reduced', 'latency', 'team',
+         'kubernetes', 'pipeline', 'analytics', 'improved', 'revenue', 'design', 'review', 'cloud']
+
+
+def synthetic_pdf(pages: int, seed: int = 1) -> bytes:
+    """Return a PDF with the given number of text-filled pages"""
+    rng = random.Random(seed)
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=10)
+    for _ in range(pages):
+        pdf.add_page()
+        for _ in range(45):
+            pdf.cell(0, 5, ' '.join(rng.choice(WORDS) for _ in range(14)), new_x="LMARGIN", new_y="NEXT")
+    return bytes(pdf.output())
+
+
+def measure(func):
+    """Return (seconds, peak traced bytes) of one call"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 10, 50, 200])
+    parser.add_argument('--preview-chars', type=int, default=501)
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'full (ms)':>10} {'full peak (KB)':>15} {'preview (ms)':>13} {'preview peak (KB)':>18}")
+    for pages in args.pages:
+        data = synthetic_pdf(pages)
+        full_time, full_peak = measure(lambda: FileProcessor.extract_text_from_pdf(io.BytesIO(data)))
+        preview_time, preview_peak = measure(
+            lambda: FileProcessor.extract_text_from_pdf(io.BytesIO(data), max_chars=args.preview_chars))
+        print(f"{pages:>6} {full_time * 1000:>10.1f} {full_peak / 1024:>15.0f} "
+              f"{preview_time * 1000:>13.1f} {preview_peak / 1024:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
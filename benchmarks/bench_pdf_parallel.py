@@ -0,0 +1,44 @@
+"""Parallel PDF extraction speedup against worker count.
+
+Run from the project root:
+    python -m benchmarks.bench_pdf_parallel
+"""
+import argparse
+import io
+import os
+import time
+
+from benchmarks.bench_pdf_extraction import synthetic_pdf
+from utils.file_processor import FileProcessor
+
+
+def time_extraction(data: bytes, parallel: bool, workers: int = None) -> float:
+    start = time.perf_counter()
+    FileProcessor.extract_text_from_pdf(io.BytesIO(data), parallel=parallel, workers=workers)
+    return time.perf_counter() - start
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_workers = sorted({count for count in (2, 4, 8, cores) if count <= max(cores, 2)})
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[10, 100, 500])
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers)
+    args = parser.parse_args()
+
+    print(f"CPU cores: {cores}")
+    header = f"{'pages':>6} {'serial (s)':>11}" + ''.join(f" {f'{w} workers':>11}" for w in args.workers)
+    print(header)
+    for pages in args.pages:
+        data = synthetic_pdf(pages)
+        serial = time_extraction(data, parallel=False)
+        row = f"{pages:>6} {serial:>11.2f}"
+        for workers in args.workers:
+            parallel = time_extraction(data, parallel=True, workers=workers)
+            row += f" {f'{serial / parallel:.2f}x':>11}"
+        print(row)
+    print("Documents under the parallel threshold run serially, so their speedup stays close to 1x.")
+
+
+if __name__ == "__main__":
+    main()
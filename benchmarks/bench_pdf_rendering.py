@@ -0,0 +1,80 @@
+"""PDF rendering time of the unified engine against per-word remeasuring line breaking.
+
+Run from the project root:
+    python -m benchmarks.bench_pdf_rendering
+"""
+import argparse
+import random
+import time
+
+from fpdf import FPDF
+
+from benchmarks.bench_pdf_extraction import WORDS
+from utils.pdf_generator import UnicodePDFGenerator
+
+
+def synthetic_document(pages: int, seed: int = 1) -> str:
+    """Return generated-document text that renders to roughly the given number of pages"""
+    rng = random.Random(seed)
+    lines = []
+    for page in range(pages):
+        lines.append(f"SECTION {page + 1}: ANALYSIS")
+        lines.append("=" * 50)
+        for _ in range(3):
+            # Long paragraphs are where remeasuring the growing line hurts most
+            lines.append(' '.join(rng.choice(WORDS) for _ in range(120)))
+            lines.append("")
+        lines.extend(f"• {' '.join(rng.choice(WORDS) for _ in range(10))}" for _ in range(6))
+        lines.append("")
+    return '\n'.join(lines)
+
+
+class RemeasuringPDFGenerator(UnicodePDFGenerator):
+    """Baseline that measures the whole candidate line again for every word"""
+
+    def wrap_text(self, pdf: FPDF, text: str, max_width: float):
+        lines = []
+        current_line = ""
+        for word in text.split(' '):
+            test_line = current_line + ' ' + word if current_line else word
+            if pdf.get_string_width(test_line) < max_width:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line)
+                current_line = word
+        if current_line:
+            lines.append(current_line)
+        return lines
+
+
+def time_render(generator: UnicodePDFGenerator, content: str, repeat: int) -> float:
+    """Return the best of repeat render times in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        generator.render(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 5, 10, 25, 50])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    engine = UnicodePDFGenerator()
+    baseline = RemeasuringPDFGenerator()
+    print(f"{'pages':>6} {'rendered':>9} {'remeasuring (ms)':>17} {'engine (ms)':>12} {'speedup':>8}")
+    for pages in args.pages:
+        content = synthetic_document(pages)
+        rendered_pages = engine.render(content).count(b'/Type /Page\n')
+        baseline_time = time_render(baseline, content, args.repeat)
+        engine_time = time_render(engine, content, args.repeat)
+        print(f"{pages:>6} {rendered_pages:>9} {baseline_time * 1000:>17.1f} {engine_time * 1000:>12.1f} "
+              f"{baseline_time / engine_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Indexed CV vs JD skill matching against the original pairwise loop.
+
+Run from the project root:
+    python -m benchmarks.bench_skill_index
+"""
+import argparse
+import random
+import string
+import time
+from typing import Dict, List
+
+from utils.ai_helpers import AIJobAssistant
+from utils.skill_matcher import build_taxonomy
+
+
+def synthetic_cv_skills(count: int, taxonomy_share: float = 0.1, seed: int = 3) -> List[str]:
+    """Free-text skills-section phrases with a share of taxonomy terms and variants"""
+    rng = random.Random(seed)
+    terms = [term for group in build_taxonomy().values() for term in group]
+    skills = []
+    while len(skills) < count:
+        kind = rng.random()
+        if kind < taxonomy_share / 2:
+            skills.append(rng.choice(terms).title())
+        elif kind < taxonomy_share:
+            skills.append(f"{rng.choice(terms)} {rng.choice(['development', 'administration', 'pipelines', 'APIs'])}")
+        else:
+            words = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+                     for _ in range(rng.randint(1, 6))]
+            skills.append(' '.join(words))
+    return skills
+
+
+def pairwise_match(jd_skills: List[str], cv_skills: List[str]) -> Dict:
+    """The original O(J x C) loop from analyze_cv_vs_jd"""
+    analysis = {'skills_matched': [], 'skills_partial_match': [], 'skills_missing': []}
+    for jd_skill in jd_skills:
+        jd_skill_lower = jd_skill.lower()
+        matched = False
+        partial_match = False
+        for cv_skill in cv_skills:
+            cv_skill_lower = cv_skill.lower()
+            if jd_skill_lower == cv_skill_lower:
+                analysis['skills_matched'].append({'jd_skill': jd_skill, 'cv_skill': cv_skill, 'match_type': 'exact'})
+                matched = True
+                break
+            elif jd_skill_lower in cv_skill_lower or cv_skill_lower in jd_skill_lower:
+                analysis['skills_partial_match'].append({'jd_skill': jd_skill, 'cv_skill': cv_skill, 'match_type': 'partial'})
+                partial_match = True
+                break
+        if not matched and not partial_match:
+            analysis['skills_missing'].append(jd_skill)
+    return analysis
+
+
+def time_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cv-skills', type=int, nargs='+', default=[100, 500, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    assistant = AIJobAssistant()
+    taxonomy_terms = [term for group in build_taxonomy().values() for term in group]
+    scenarios = [
+        # A typical posting: a few dozen required skills
+        ('typical JD', random.Random(5).sample(taxonomy_terms, 30)),
+        # Worst case for the JD side: every taxonomy term is required
+        ('full taxonomy', taxonomy_terms),
+    ]
+
+    for label, jd_skills in scenarios:
+        requirements = {'all_detected_skills': jd_skills}
+        print(f"\n{label}: {len(jd_skills)} JD skills")
+        print(f"{'CV skills':>10} {'pairwise (ms)':>14} {'indexed (ms)':>13} {'speedup':>9}")
+        for count in args.cv_skills:
+            cv_skills = synthetic_cv_skills(count)
+
+            expected = pairwise_match(jd_skills, cv_skills)
+            actual = assistant._match_cv_skills(requirements, cv_skills)
+            for key in expected:
+                assert expected[key] == actual[key], f"{key} differs from the pairwise loop"
+
+            pairwise_time = time_call(lambda: pairwise_match(jd_skills, cv_skills), args.repeat)
+            indexed_time = time_call(lambda: assistant._match_cv_skills(requirements, cv_skills), args.repeat)
+            print(f"{count:>10} {pairwise_time * 1000:>14.2f} {indexed_time * 1000:>13.2f} {pairwise_time / indexed_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
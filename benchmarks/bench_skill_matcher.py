@@ -0,0 +1,88 @@
+"""Skill matcher throughput as the taxonomy grows.
+
+Run from the project root:
+    python -m benchmarks.bench_skill_matcher
+"""
+import argparse
+import random
+import re
+import string
+import time
+from typing import Dict, List
+
+from utils.skill_matcher import SkillMatcher, build_taxonomy
+
+
+def synthetic_taxonomy(size: int, seed: int = 7) -> Dict[str, List[str]]:
+    """Built-in taxonomy padded with random one- and two-word terms up to size"""
+    rng = random.Random(seed)
+    taxonomy = {category: list(terms) for category, terms in build_taxonomy().items()}
+    existing = {term for terms in taxonomy.values() for term in terms}
+    padding = []
+    while len(existing) + len(padding) < size:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+        if rng.random() < 0.3:
+            word += ' ' + ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 7)))
+        if word not in existing:
+            existing.add(word)
+            padding.append(word)
+    taxonomy['synthetic'] = padding
+    return taxonomy
+
+
+def synthetic_document(taxonomy: Dict[str, List[str]], words: int, seed: int = 11) -> str:
+    """Filler text with roughly one taxonomy term every ten words"""
+    rng = random.Random(seed)
+    terms = [term for group in taxonomy.values() for term in group]
+    filler = ['we', 'are', 'looking', 'for', 'an', 'engineer', 'with', 'experience', 'in', 'and', 'the', 'team']
+    out = []
+    for _ in range(words):
+        out.append(rng.choice(terms) if rng.random() < 0.1 else rng.choice(filler))
+    return ' '.join(out)
+
+
+def regex_loop(taxonomy: Dict[str, List[str]], text: str) -> List[str]:
+    """The original per-term matcher: one compiled search per taxonomy entry"""
+    text_lower = text.lower()
+    found = []
+    for terms in taxonomy.values():
+        for term in terms:
+            if re.search(r'\b' + re.escape(term) + r'\b', text_lower):
+                found.append(term)
+    return found
+
+
+def time_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--words', type=int, default=800, help="words per synthetic job description")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'terms':>8} {'regex loop (docs/s)':>22} {'matcher (docs/s)':>18} {'build (ms)':>12} {'speedup':>9}")
+    for size in args.sizes:
+        taxonomy = synthetic_taxonomy(size)
+        text = synthetic_document(taxonomy, args.words)
+
+        build_start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        expected = sorted(set(regex_loop(taxonomy, text)))
+        actual = sorted({term for _, term in matcher.find_entries(text)})
+        assert expected == actual, "matcher and regex loop disagree"
+
+        loop_time = time_call(lambda: regex_loop(taxonomy, text), max(1, args.repeat // 2))
+        matcher_time = time_call(lambda: matcher.find_entries(text), args.repeat)
+        print(f"{size:>8} {1 / loop_time:>22.1f} {1 / matcher_time:>18.1f} {build_ms:>12.1f} {loop_time / matcher_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Many-to-many CV x JD matching with bit vectors against pair-at-a-time matching.
+
+The pairwise baseline runs _match_cv_skills for a sample of CVs against
+every job and is extrapolated to the full matrix; the sampled pairs are
+also checked against the vectorized counts.
+
+Run from the project root:
+    python -m benchmarks.bench_skill_vectors
+    python -m benchmarks.bench_skill_vectors --cvs 10000 --jds 1000
+"""
+import argparse
+import time
+
+from benchmarks.bench_skill_index import synthetic_cv_skills
+from benchmarks.corpus import synthetic_jd
+from utils.ai_helpers import AIJobAssistant
+from utils.skill_vectors import SkillVocabulary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cvs', type=int, default=10000)
+    parser.add_argument('--jds', type=int, default=1000)
+    parser.add_argument('--cv-skills', type=int, default=40, help="skills listed per CV")
+    parser.add_argument('--sample', type=int, default=50, help="CVs matched pairwise for the baseline")
+    args = parser.parse_args()
+
+    assistant = AIJobAssistant()
+    jobs = [assistant.analyze_job_requirements(synthetic_jd(300, seed=seed)) for seed in range(args.jds)]
+    cv_skills = [synthetic_cv_skills(args.cv_skills, taxonomy_share=0.5, seed=seed) for seed in range(args.cvs)]
+
+    start = time.perf_counter()
+    vocabulary = SkillVocabulary()
+    job_vectors = vocabulary.encode_jobs(jobs)
+    jobs_encoded = time.perf_counter()
+    cv_vectors = vocabulary.encode_cvs(cv_skills)
+    cvs_encoded = time.perf_counter()
+    matches = vocabulary.match_matrix(cv_vectors, job_vectors)
+    matched = time.perf_counter()
+
+    sample = min(args.sample, args.cvs)
+    begin = time.perf_counter()
+    for row in range(sample):
+        for column, job in enumerate(jobs):
+            analysis = assistant._match_cv_skills(job, cv_skills[row])
+            if (matches['match_percentage'][row, column] != analysis['match_percentage']
+                    or matches['missing'][row, column] != len(analysis['skills_missing'])):
+                raise SystemExit(f"CV {row} x JD {column} differs from _match_cv_skills")
+    pairwise = (time.perf_counter() - begin) / (sample * len(jobs)) * args.cvs * len(jobs)
+
+    vectorized = matched - start
+    print(f"{args.cvs} CVs x {args.jds} JDs = {args.cvs * args.jds} pairs, {len(vocabulary)} taxonomy terms")
+    print(f"{'encode JDs (s)':>15} {'encode CVs (s)':>15} {'match (s)':>10} {'total (s)':>10} "
+          f"{'pairwise (s)':>13} {'speedup':>8}")
+    print(f"{jobs_encoded - start:>15.2f} {cvs_encoded - jobs_encoded:>15.2f} {matched - cvs_encoded:>10.2f} "
+          f"{vectorized:>10.2f} {pairwise:>12.0f}* {pairwise / vectorized:>7.0f}x")
+    print(f"* extrapolated from {sample} CVs; packed bits: "
+          f"{(cv_vectors.covered.nbytes + cv_vectors.exact.nbytes) / args.cvs:.0f} bytes per CV, "
+          f"{job_vectors.bits.nbytes / args.jds:.0f} bytes per JD")
+
+
+if __name__ == "__main__":
+    main()
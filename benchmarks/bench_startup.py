@@ -0,0 +1,89 @@
+"""Cold import time of the application modules, checked against a startup budget.
+
+Each module is imported in a fresh interpreter with `python -X importtime`.
+The run fails when a module exceeds the budget or pulls in a format library
+that should only load on first use.
+
+Run from the project root:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget-ms 150
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Set, Tuple
+
+from utils.skill_matcher import SkillMatcher, build_taxonomy
+
+# Modules imported by the Streamlit app, the batch scorer and its worker processes
+STARTUP_MODULES = ['utils.ai_helpers', 'utils.file_processor', 'utils.batch_scoring', 'utils.job_index',
+                   'utils.generation_pipeline', 'utils.export']
+
+# Libraries that must not load until a document of their format is read or written,
+# or until the first text similarity is scored
+LAZY_MODULES = ['PyPDF2', 'docx', 'fpdf', 'pandas', 'numpy', 'scipy']
+
+DEFAULT_BUDGET_MS = 100.0
+
+
+def import_time(module: str) -> Tuple[float, Set[str]]:
+    """Return (cumulative import ms, every module loaded) for module in a fresh interpreter"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    total_us = 0
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        loaded.add(name.strip())
+        if name.strip() == module:
+            total_us = int(cumulative)
+    return total_us / 1000, loaded
+
+
+def matcher_build_ms(repeat: int) -> float:
+    """Median time to build the skill matcher from the taxonomy"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        SkillMatcher(build_taxonomy())
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modules', nargs='+', default=STARTUP_MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="cold import budget per module")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<28} {'import (ms)':>12} {'budget (ms)':>12}  eager format libraries")
+    for module in args.modules:
+        # The first run compiles bytecode, so it is not counted
+        import_time(module)
+        runs = [import_time(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(ms for ms, _ in runs)
+        eager = sorted({lazy for lazy in LAZY_MODULES for _, loaded in runs if lazy in loaded})
+        print(f"{module:<28} {median_ms:>12.1f} {args.budget_ms:>12.1f}  {', '.join(eager) or '-'}")
+        if median_ms > args.budget_ms:
+            failures.append(f"{module} imports in {median_ms:.1f} ms")
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} eagerly")
+
+    # Built once per process; reported so taxonomy growth shows up in the startup numbers
+    print(f"{'SkillMatcher build':<28} {matcher_build_ms(args.repeat):>12.2f}")
+
+    if failures:
+        print("Over budget: " + "; ".join(failures))
+        sys.exit(1)
+    print(f"All modules within {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
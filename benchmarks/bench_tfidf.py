@@ -0,0 +1,79 @@
+"""TF-IDF scoring of one CV against thousands of job descriptions.
+
+Once the job descriptions are vectorized, a single sparse matrix product
+is compared against a dict-based cosine similarity per pair, and both
+are checked to give the same percentages.
+
+Run from the project root:
+    python -m benchmarks.bench_tfidf
+    python -m benchmarks.bench_tfidf --jds 1000 5000 20000
+"""
+import argparse
+import math
+import time
+from collections import Counter
+from typing import Dict, List
+
+from benchmarks.corpus import synthetic_cv, synthetic_jd
+from utils.tfidf import TfidfModel, similarity_percentage, tokenize
+
+
+def weighted_terms(model: TfidfModel, text: str) -> Dict[str, float]:
+    """A document as a dict of L2-normalized TF-IDF weights"""
+    counts = Counter(token for token in tokenize(text) if token in model.vocabulary)
+    vector = {term: (1 + math.log(count)) * model.idf[model.vocabulary[term]] for term, count in counts.items()}
+    norm = math.sqrt(sum(value * value for value in vector.values())) or 1
+    return {term: value / norm for term, value in vector.items()}
+
+
+def pairwise_scores(model: TfidfModel, cv_text: str, jd_vectors: List[Dict[str, float]]) -> List[int]:
+    """Baseline that takes one dict dot product per pair"""
+    cv_vector = weighted_terms(model, cv_text)
+    return [
+        similarity_percentage(sum(value * jd_vector.get(term, 0) for term, value in cv_vector.items()))
+        for jd_vector in jd_vectors
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--jds', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--jd-words', type=int, default=400)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cv_text = synthetic_cv(2)
+    print(f"{'JDs':>6} {'fit (ms)':>9} {'vectorize (ms)':>15} {'product (ms)':>13} {'pairwise (ms)':>14} {'speedup':>8}")
+    for count in args.jds:
+        jd_texts = [synthetic_jd(args.jd_words, seed=seed) for seed in range(count)]
+
+        start = time.perf_counter()
+        model = TfidfModel.fit(jd_texts)
+        fitted = time.perf_counter()
+        jd_vectors = model.transform(jd_texts)
+        vectorized = time.perf_counter()
+
+        # The per-CV cost once the job descriptions are vectorized
+        product = float('inf')
+        for _ in range(args.repeat):
+            begin = time.perf_counter()
+            similarities = TfidfModel.similarities(model.transform([cv_text]), jd_vectors)[0]
+            product = min(product, time.perf_counter() - begin)
+
+        jd_dicts = [weighted_terms(model, jd_text) for jd_text in jd_texts]
+        pairwise = float('inf')
+        for _ in range(args.repeat):
+            begin = time.perf_counter()
+            baseline = pairwise_scores(model, cv_text, jd_dicts)
+            pairwise = min(pairwise, time.perf_counter() - begin)
+
+        scores = [similarity_percentage(similarity) for similarity in similarities]
+        mismatches = sum(abs(score - expected) > 1 for score, expected in zip(scores, baseline))
+        if mismatches:
+            raise SystemExit(f"{mismatches} scores differ from the pairwise baseline")
+        print(f"{count:>6} {(fitted - start) * 1000:>9.0f} {(vectorized - fitted) * 1000:>15.0f} "
+              f"{product * 1000:>13.2f} {pairwise * 1000:>14.0f} {pairwise / product:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
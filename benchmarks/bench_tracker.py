@@ -0,0 +1,103 @@
+"""Page query time of the application tracker at 100k+ recorded applications.
+
+Every filter the Applications tab offers is timed on the first page and on
+a page reached by following cursors deep into the results, with the
+query plan SQLite picked for it.
+
+Run from the project root:
+    python -m benchmarks.bench_tracker
+    python -m benchmarks.bench_tracker --records 500000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.corpus import _skill_terms
+from utils.application_tracker import ApplicationTracker
+
+COMPANIES = 2000
+DAY = 24 * 3600
+
+
+def populate(tracker: ApplicationTracker, records: int, seed: int = 3, batch: int = 10000):
+    """Record synthetic applications spread over the last year"""
+    rng = random.Random(seed)
+    terms = _skill_terms()
+    now = time.time()
+    for start in range(0, records, batch):
+        tracker.record_many({
+            'job_description': f"job description {number}",
+            'company': f"Company {rng.randrange(COMPANIES)}",
+            'position': rng.choice(['Data Engineer', 'Backend Developer', 'ML Engineer', 'Product Manager']),
+            'match_percentage': rng.randrange(101),
+            'missing_skills': rng.sample(terms, rng.randrange(1, 8)),
+            'file_ids': {'cv_improvements': {'txt': f"{number:064x}.txt", 'pdf': f"{number:064x}.pdf"}},
+            'created': now - rng.random() * 365 * DAY
+        } for number in range(start, min(start + batch, records)))
+
+
+def time_pages(tracker: ApplicationTracker, filters: Dict, depth: int, repeat: int) -> List[float]:
+    """Return the best ms of the first page and of the page depth cursors later"""
+    cursor = None
+    for _ in range(depth):
+        cursor = tracker.page(after=cursor, **filters)['next_cursor']
+        if cursor is None:
+            break
+    timings = []
+    for after in (None, cursor):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            tracker.page(after=after, **filters)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best * 1000)
+    return timings
+
+
+def query_plan(tracker: ApplicationTracker, filters: Dict) -> str:
+    """Return the tables and indexes the page query reads, as SQLite explains them"""
+    connection = tracker._connection()
+    captured = []
+    connection.set_trace_callback(captured.append)
+    tracker.page(**filters)
+    connection.set_trace_callback(None)
+    statement = next(sql for sql in captured if sql.lstrip().startswith('SELECT'))
+    plan = connection.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+    return '; '.join(row[-1] for row in plan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--depth', type=int, default=50, help="pages to follow before timing a deep page")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        tracker = ApplicationTracker(os.path.join(directory, 'applications.sqlite3'))
+        start = time.perf_counter()
+        populate(tracker, args.records)
+        print(f"Recorded {len(tracker)} applications in {time.perf_counter() - start:.1f}s")
+
+        skill = _skill_terms()[0]
+        month_ago = time.time() - 30 * DAY
+        cases = [
+            ('newest', {}),
+            ('company', {'company': 'company 7'}),
+            ('missing skill', {'skill': skill}),
+            ('last 30 days', {'since': month_ago}),
+            ('skill + 30 days', {'skill': skill, 'since': month_ago}),
+            ('match >= 80', {'min_match': 80}),
+        ]
+        print(f"{'filter':<16} {'first (ms)':>11} {'deep (ms)':>10}  plan")
+        for label, filters in cases:
+            first, deep = time_pages(tracker, filters, args.depth, args.repeat)
+            print(f"{label:<16} {first:>11.2f} {deep:>10.2f}  {query_plan(tracker, filters)}")
+        tracker.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Synthetic CVs and job descriptions at configurable sizes and skill densities."""
+import io
+import random
+from typing import List
+
+from docx import Document
+
+from utils.pdf_generator import UnicodePDFGenerator
+from utils.skill_matcher import build_taxonomy
+
+# Roughly what one rendered page of CV text holds
+LINES_PER_PAGE = 45
+
+FILLER = ['the', 'platform', 'customers', 'across', 'regions', 'with', 'partners', 'for', 'new', 'products',
+          'daily', 'releases', 'internal', 'tools', 'and', 'stakeholders', 'quarterly', 'roadmap', 'data']
+VERBS = ['Led', 'Developed', 'Implemented', 'Managed', 'Increased', 'Reduced', 'Improved', 'Designed', 'Built']
+OBJECTS = ['team of engineers', 'payment system', 'migration project', 'monitoring solution', 'release pipeline',
+           'customer retention', 'infrastructure costs', 'onboarding flow']
+METRICS = ['by 25%', 'by 40%', 'by $120000', 'by 3x', 'for 2M users', 'across 12 countries']
+
+
+def _skill_terms() -> List[str]:
+    return [term for terms in build_taxonomy().values() for term in terms]
+
+
+def _sentence(rng: random.Random, terms: List[str], words: int, skill_density: float) -> str:
+    """Filler words where each word is a taxonomy term with probability skill_density"""
+    return ' '.join(rng.choice(terms) if rng.random() < skill_density else rng.choice(FILLER)
+                    for _ in range(words))
+
+
+def synthetic_cv(pages: int = 1, skill_density: float = 0.1, seed: int = 1) -> str:
+    """Return a sectioned CV of about the given number of pages"""
+    rng = random.Random(seed)
+    terms = _skill_terms()
+    lines = ["Alex Example", "alex@example.com | +1 555 0100", "",
+             "SUMMARY", _sentence(rng, terms, 40, skill_density), "",
+             "SKILLS", ', '.join(rng.sample(terms, min(len(terms), 12 + int(40 * skill_density)))), ""]
+
+    lines.append("EXPERIENCE")
+    budget = max(pages * LINES_PER_PAGE - len(lines) - 6, 10)
+    role = 0
+    while budget > 0:
+        role += 1
+        lines.append(f"Senior Engineer, Company {role} (20{10 + role % 14}-20{11 + role % 14})")
+        for _ in range(min(6, budget)):
+            lines.append(f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(METRICS)} using "
+                         f"{_sentence(rng, terms, 10, skill_density)}.")
+        lines.append("")
+        budget -= 8
+
+    lines += ["EDUCATION", "BSc Computer Science, Example University", ""]
+    return '\n'.join(lines)
+
+
+def synthetic_jd(words: int = 400, skill_density: float = 0.1, seed: int = 2) -> str:
+    """Return a job description of about the given number of words"""
+    rng = random.Random(seed)
+    terms = _skill_terms()
+    years = rng.choice(['3+ years', '5+ years', 'at least 4 years', 'minimum of 6 years', '3-5 years'])
+    parts = ["Senior Software Engineer at Example Corp",
+             f"We are looking for an engineer with {years} of professional work.", "Requirements:"]
+    remaining = words - sum(len(part.split()) for part in parts)
+    while remaining > 0:
+        length = min(rng.randint(8, 16), remaining)
+        parts.append(f"- {_sentence(rng, terms, length, skill_density)}")
+        remaining -= length
+    parts.append("Leadership and communication are essential.")
+    return '\n'.join(parts)
+
+
+def to_pdf(text: str) -> bytes:
+    """Render text to PDF with the application's own engine"""
+    return UnicodePDFGenerator().render(text)
+
+
+def to_docx(text: str, table_every: int = 20) -> bytes:
+    """Write text as DOCX paragraphs, with a two-column table after every table_every lines"""
+    doc = Document()
+    for index, line in enumerate(text.split('\n')):
+        doc.add_paragraph(line)
+        if table_every and index % table_every == table_every - 1:
+            table = doc.add_table(rows=3, cols=2)
+            for row in table.rows:
+                row.cells[0].text = "Skill"
+                row.cells[1].text = line[:40]
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
@@ -0,0 +1,187 @@
+"""Benchmark suite over every hot path, with JSON results and regression checks.
+
+Run from the project root:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --output after.json --baseline before.json --threshold 0.15
+    python -m benchmarks.suite --compare before.json after.json
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import synthetic_cv, synthetic_jd, to_docx, to_pdf
+from utils.ai_helpers import AIJobAssistant
+from utils.cv_parser import parse_cv
+from utils.file_processor import FileProcessor
+from utils.output_store import get_output_store
+from utils.pdf_generator import UnicodePDFGenerator
+from utils.skill_index import substrings
+from utils.skill_matcher import _find_terms_cached
+from utils.term_index import index_cv
+
+# Median slowdown, relative to the baseline, reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Each case keeps sampling until it has min_rounds and this much total time
+MIN_CASE_SECONDS = 0.2
+MAX_ROUNDS = 200
+
+# Session that owns files the save_as_pdf case writes, removed after the run
+BENCHMARK_SESSION = 'benchmark-suite'
+
+
+def clear_caches():
+    """Reset the memoized parsers and matchers so every round measures a cold call"""
+    for cached in (parse_cv, index_cv, _find_terms_cached, substrings):
+        cached.cache_clear()
+
+
+def build_cases(pages: int, jd_words: int, skill_density: float) -> Dict[str, Callable[[], object]]:
+    """Return the benchmark cases for one corpus size, each a zero-argument callable"""
+    assistant = AIJobAssistant()
+    cv_text = synthetic_cv(pages, skill_density)
+    jd_text = synthetic_jd(jd_words, skill_density)
+    requirements = assistant.analyze_job_requirements(jd_text)
+    cv_pdf = to_pdf(cv_text)
+    cv_docx = to_docx(cv_text)
+    saves = iter(range(sys.maxsize))
+
+    def save_as_pdf():
+        # Distinct content per round, so every call renders and writes a new file
+        assistant.pdf_generator = UnicodePDFGenerator()
+        return assistant.save_as_pdf(f"{cv_text}\n{next(saves)}", "cv.pdf", BENCHMARK_SESSION)
+
+    return {
+        'analyze_job_requirements': lambda: assistant.analyze_job_requirements(jd_text),
+        'analyze_cv_vs_jd': lambda: assistant.analyze_cv_vs_jd(cv_text, jd_text),
+        'analyze_cv_content': lambda: assistant.analyze_cv_content(cv_text, requirements),
+        'parse_cv_sections': lambda: FileProcessor.parse_cv_sections(cv_text),
+        'extract_text_from_pdf': lambda: FileProcessor.extract_text_from_pdf(io.BytesIO(cv_pdf)),
+        'extract_text_from_docx[stream]': lambda: FileProcessor.extract_text_from_docx(io.BytesIO(cv_docx), backend='stream'),
+        'extract_text_from_docx[python-docx]': lambda: FileProcessor.extract_text_from_docx(io.BytesIO(cv_docx), backend='python-docx'),
+        'extract_achievements_from_cv': lambda: assistant.extract_achievements_from_cv(cv_text),
+        # A new generator each round, so word widths are measured again like in a cold render
+        'pdf_render': lambda: UnicodePDFGenerator().render(cv_text),
+        'save_as_pdf': save_as_pdf,
+    }
+
+
+def measure(func: Callable[[], object], min_rounds: int) -> Dict[str, float]:
+    """Time cold calls of func and summarize them in milliseconds"""
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < min_rounds or (time.perf_counter() - started < MIN_CASE_SECONDS and len(timings) < MAX_ROUNDS):
+        clear_caches()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(timings), 4),
+        'min_ms': round(min(timings), 4),
+        'mean_ms': round(statistics.fmean(timings), 4),
+        'rounds': len(timings)
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(pages: List[int], jd_words: int, skill_density: float, min_rounds: int,
+              only: Optional[List[str]] = None) -> Dict:
+    """Run every case at every size and return the results document"""
+    results = {}
+    try:
+        for size in pages:
+            for name, func in build_cases(size, jd_words, skill_density).items():
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                key = f"{name}@{size}p"
+                results[key] = dict(measure(func, min_rounds), case=name, pages=size)
+                print(f"{key:<48} {results[key]['median_ms']:>10.2f} ms  ({results[key]['rounds']} rounds)")
+    finally:
+        get_output_store().clear_session(BENCHMARK_SESSION)
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pages': pages,
+            'jd_words': jd_words,
+            'skill_density': skill_density
+        },
+        'results': results
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Print median changes per case and return the cases slower than the threshold allows"""
+    regressions = []
+    print(f"{'case':<48} {'baseline (ms)':>14} {'current (ms)':>13} {'change':>8}")
+    for key, result in current['results'].items():
+        before = baseline['results'].get(key)
+        if before is None:
+            print(f"{key:<48} {'-':>14} {result['median_ms']:>13.2f} {'new':>8}")
+            continue
+        ratio = result['median_ms'] / before['median_ms'] if before['median_ms'] else 1.0
+        flag = ''
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print(f"{key:<48} {before['median_ms']:>14.2f} {result['median_ms']:>13.2f} {ratio - 1:>+8.1%}{flag}")
+    return regressions
+
+
+def _load(path: str) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 5, 20], help="CV sizes in pages")
+    parser.add_argument('--jd-words', type=int, default=400)
+    parser.add_argument('--skill-density', type=float, default=0.1, help="share of words that are taxonomy skills")
+    parser.add_argument('--rounds', type=int, default=5, help="minimum timed rounds per case")
+    parser.add_argument('--only', nargs='+', help="run only cases whose name contains one of these")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare this run against a saved results file")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help="compare two saved results files")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="median slowdown counted as a regression (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        baseline, current = (_load(path) for path in args.compare)
+    else:
+        current = run_suite(args.pages, args.jd_words, args.skill_density, args.rounds, args.only)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(current, f, indent=2)
+            print(f"Results written to {args.output}")
+        if not args.baseline:
+            return
+        baseline = _load(args.baseline)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import sys
+import threading
+
+from utils.job_index import JobIndex
+from utils.skill_matcher import build_taxonomy
+
+TERMS = list(dict.fromkeys(term for group in build_taxonomy().values() for term in group))
+
+
+def job_description(number: int, skills) -> str:
+    return f"Engineer {number}\nAt Company {number} we need {', '.join(skills)}.\n"
+
+
+def test_query_while_another_thread_adds_jobs():
+    index = JobIndex()
+    for number in range(10):
+        index.add(f"base-{number}", job_description(number, TERMS[number:number + 3]))
+    cv_text = "SKILLS\n" + ', '.join(TERMS[::2]) + "\n"
+
+    errors = []
+    done = threading.Event()
+
+    def add_jobs():
+        try:
+            for _ in range(5):
+                # Each new skill grows the postings table; removing the jobs compacts it again
+                job_ids = [f"job-{position}" for position in range(10, len(TERMS))]
+                for job_id, term in zip(job_ids, TERMS[10:]):
+                    index.add(job_id, job_description(0, [term]))
+                for job_id in job_ids:
+                    index.remove(job_id)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            done.set()
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writer = threading.Thread(target=add_jobs)
+        writer.start()
+        while not done.is_set():
+            try:
+                for result in index.query(cv_text, top_k=5):
+                    assert 0 <= result['match_percentage'] <= 100
+            except Exception as e:
+                errors.append(e)
+                break
+        writer.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert not errors
+    assert [job['job_id'] for job in index.query(cv_text, top_k=1)]
@@ -0,0 +1,83 @@
+import re
+from bisect import bisect_left
+from typing import List
+
+from .instrumentation import metrics
+
+_BY_METRIC = r'by\s+(?:\d+%|\$\d+)'
+_METRIC = r'(?:\d+%|\$\d+)'
+
+# Achievement verbs in reporting order, with the terminator that closes each:
+# "increased <anything> by 25%", "led <anything> team", ...
+ACHIEVEMENT_RULES = {
+    'increased': _BY_METRIC,
+    'reduced': _BY_METRIC,
+    'improved': r'by\s+\d+%',
+    'saved': _METRIC,
+    'achieved': r'\d+%',
+    'led': 'team',
+    'managed': 'project',
+    'developed': 'system',
+    'implemented': 'solution',
+}
+
+# Sentence ends, line breaks and bullet glyphs end a segment
+SEGMENT_BREAKS = '.\n•▪●◦■'
+
+# Longest achievement reported, which also bounds the work per verb occurrence
+MAX_ACHIEVEMENT_CHARS = 300
+
+MAX_ACHIEVEMENTS = 10
+
+_BREAK_PATTERN = re.compile('[' + re.escape(SEGMENT_BREAKS) + ']')
+
+# Literal verb searches, which the regex engine runs without trying every position
+_VERB_PATTERNS = {verb: re.compile(verb + r'(?=\s)') for verb in ACHIEVEMENT_RULES}
+
+# Anchored after the verb, the greedy prefix lands on the last terminator in the window
+_TERMINATOR_PATTERNS = {verb: re.compile(r'.*\s' + terminator, re.DOTALL)
+                        for verb, terminator in ACHIEVEMENT_RULES.items()}
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def extract_achievements(text: str, limit: int = MAX_ACHIEVEMENTS) -> List[str]:
+    """Return up to limit distinct achievements, grouped by verb in rule order.
+
+    Segment breaks are located once. Each verb occurrence then extends to
+    the last terminator of its rule within the same segment and at most
+    MAX_ACHIEVEMENT_CHARS, so the cost stays linear in the text length
+    however few sentence breaks the text has.
+    """
+    lowered = text.lower()
+    breaks = [match.start() for match in _BREAK_PATTERN.finditer(lowered)]
+    metrics.count('regex.evaluations', len(_VERB_PATTERNS) + 1)
+
+    achievements: List[str] = []
+    seen = set()
+    for verb, verb_pattern in _VERB_PATTERNS.items():
+        terminator_pattern = _TERMINATOR_PATTERNS[verb]
+        resume = 0
+        for match in verb_pattern.finditer(lowered):
+            start, end = match.span()
+            # Skip occurrences inside a previous achievement or inside a longer word
+            if start < resume or (start and _is_word_char(lowered[start - 1])):
+                continue
+
+            position = bisect_left(breaks, end)
+            segment_end = breaks[position] if position < len(breaks) else len(lowered)
+            # Needs something between the verb and the terminator, as in "led <x> team"
+            found = terminator_pattern.match(lowered, end + 1, min(segment_end, start + MAX_ACHIEVEMENT_CHARS))
+            if not found:
+                continue
+
+            resume = found.end()
+            achievement = lowered[start:resume].capitalize()
+            if achievement not in seen:
+                seen.add(achievement)
+                achievements.append(achievement)
+                if len(achievements) == limit:
+                    return achievements
+    return achievements
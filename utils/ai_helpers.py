@@ -1,16 +1,40 @@
-import os
 import re
-from typing import Dict, List, Tuple
-from fpdf import FPDF
+from typing import Callable, Dict, List, Optional, Tuple
+from .achievements import extract_achievements
+from .analysis_cache import AnalysisCache
+from .analysis_context import AnalysisContext
+from .cv_parser import ParsedCV
+from .experience import extract_experience_requirements
 from .file_processor import FileProcessor
+from .instrumentation import metrics
+from .output_store import get_output_store
+from .pdf_generator import UnicodePDFGenerator
+from .skill_index import SkillIndex
+from .skill_matcher import SOFT_SKILLS_CATEGORY, get_default_matcher
+from .term_index import index_cv
 from datetime import datetime
 
 class AIJobAssistant:
-    def __init__(self):
+    def __init__(self, analysis_cache: Optional[AnalysisCache] = None):
         self.file_processor = FileProcessor()
+        self.skill_matcher = get_default_matcher()
+        self.pdf_generator = UnicodePDFGenerator()
+        # Persistent cache of requirement and match analyses, shared with other processes
+        self.analysis_cache = analysis_cache
     
-    def analyze_job_requirements(self, job_description: str) -> Dict[str, List[str]]:
+    def cached_analysis(self, kind: str, parts: Tuple[str, ...], compute: Callable[[], Dict]) -> Dict:
+        """Return compute() through the persistent analysis cache when one is configured"""
+        if self.analysis_cache is None:
+            return compute()
+        return self.analysis_cache.get_or_compute(kind, parts, compute)
+    
+    def analyze_job_requirements(self, job_description: str) -> Dict[str, List]:
         """Comprehensive job description analysis"""
+        return self.cached_analysis('requirements', (job_description,),
+                                    lambda: self._analyze_job_requirements(job_description))
+    
+    def _analyze_job_requirements(self, job_description: str) -> Dict[str, List]:
+        """Analyze a job description without consulting the analysis cache"""
         requirements = {
             'skills': [],
             'technologies': [],
@@ -24,69 +48,45 @@ class AIJobAssistant:
         
         text_lower = job_description.lower()
         
-        # Comprehensive skill detection
-        skill_categories = {
-            'programming': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin', 'php', 'ruby', 'scala'],
-            'web_frontend': ['html', 'css', 'react', 'angular', 'vue', 'svelte', 'bootstrap', 'tailwind', 'jquery', 'next.js', 'nuxt.js'],
-            'web_backend': ['node.js', 'django', 'flask', 'spring', 'express', 'laravel', 'ruby on rails', 'asp.net', 'fastapi', 'graphql'],
-            'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'dynamodb', 'cassandra', 'cosmos db', 'firebase'],
-            'cloud': ['aws', 'azure', 'google cloud', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'ci/cd', 'devops', 'serverless'],
-            'data_science': ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'r', 'matplotlib', 'tableau', 'power bi', 'spark'],
-            'mobile': ['android', 'ios', 'react native', 'flutter', 'swift', 'kotlin', 'xamarin'],
-            'tools': ['git', 'jira', 'confluence', 'slack', 'teams', 'docker', 'jenkins', 'ansible', 'puppet', 'chef', 'github', 'gitlab'],
-            'methodologies': ['agile', 'scrum', 'kanban', 'waterfall', 'devops', 'cicd', 'tdd', 'bdd']
-        }
-        
-        soft_skills = ['leadership', 'communication', 'teamwork', 'problem-solving', 'critical thinking', 
-                      'adaptability', 'time management', 'creativity', 'collaboration', 'analytical',
-                      'project management', 'stakeholder management', 'mentoring', 'presentation']
-        
-        # Extract ALL technical skills
+        # Extract ALL technical and soft skills in a single pass
+        skill_hits = list(self.skill_matcher.iter_matches(text_lower))
         all_skills = []
-        for category, skills in skill_categories.items():
-            for skill in skills:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    requirements['skills'].append(skill)
-                    all_skills.append(skill)
-        
-        # Extract ALL soft skills
-        for skill in soft_skills:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
+        for category, skill in self.skill_matcher.entries_from_hits(skill_hits):
+            if category == SOFT_SKILLS_CATEGORY:
                 requirements['soft_skills'].append(skill)
-                all_skills.append(skill)
+            else:
+                requirements['skills'].append(skill)
+        all_skills.extend(requirements['skills'])
+        all_skills.extend(requirements['soft_skills'])
         
         requirements['all_detected_skills'] = all_skills
         
-        # Enhanced experience extraction
-        experience_patterns = [
-            r'(\d+)\+?\s*years?',
-            r'(\d+)[-+]?\s*to\s*(\d+)\s*years?',
-            r'minimum\s+of\s+(\d+)\s*years?',
-            r'at\s+least\s+(\d+)\s*years?',
-            r'(\d+)\s*-\s*(\d+)\s*years?'
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                exp_text = match.group(0)
-                if exp_text not in requirements['experience']:
-                    requirements['experience'].append(exp_text)
+        # Years of experience, structured, from one scan that reuses the skill hits
+        requirements['experience_requirements'] = extract_experience_requirements(text_lower, skill_hits)
+        requirements['experience'] = [requirement['text'] for requirement in requirements['experience_requirements']]
         
         return requirements
     
+    def analyze(self, cv_text: str, job_description: str, linkedin_about: str = "") -> AnalysisContext:
+        """Create a shared analysis context for one CV, job description and LinkedIn About"""
+        return AnalysisContext(self, cv_text, job_description, linkedin_about)
+    
     def analyze_cv_content(self, cv_text: str, requirements: Dict) -> Dict:
         """Analyze CV content against job requirements - COMPATIBILITY METHOD"""
         # This method maintains compatibility with the existing app
-        cv_sections = self.file_processor.parse_cv_sections(cv_text)
-        cv_skills = self._extract_all_skills_from_cv(cv_text)
+        return AnalysisContext(self, cv_text, "", requirements=requirements).cv_content
+    
+    def _analyze_cv_content(self, context: AnalysisContext) -> Dict:
+        """Analyze CV content against the job requirements of a context"""
+        parsed_cv = context.parsed_cv
+        term_index = context.term_index
+        requirements = context.requirements
         
         analysis = {
             'skills_found': [],
             'skills_missing': [],
             'skills_weak': [],
+            'skill_emphasis': {},
             'experience_alignment': [],
             'achievements_found': [],
             'summary_alignment': [],
@@ -96,24 +96,24 @@ class AIJobAssistant:
         
         # Analyze skills
         for skill in requirements['skills']:
-            if self._skill_exists_in_cv(skill, cv_text):
+            if term_index.count(skill):
                 analysis['skills_found'].append(skill)
             else:
                 analysis['skills_missing'].append(skill)
         
-        # Find skills that exist but need emphasis
-        for skill in analysis['skills_found']:
-            if not self._skill_is_strong_in_cv(skill, cv_text):
-                analysis['skills_weak'].append(skill)
+        # Find skills that exist but need emphasis, least emphasized first
+        analysis['skill_emphasis'] = {skill: term_index.emphasis(skill) for skill in analysis['skills_found']}
+        weak_skills = [skill for skill in analysis['skills_found'] if not term_index.is_strong(skill)]
+        analysis['skills_weak'] = sorted(weak_skills, key=lambda skill: analysis['skill_emphasis'][skill]['score'])
         
         # Analyze experience alignment
-        analysis['experience_alignment'] = self._analyze_experience_alignment(cv_sections.get('experience', ''), requirements)
+        analysis['experience_alignment'] = self._analyze_experience_alignment(parsed_cv.section('experience'), requirements)
         
         # Extract achievements
-        analysis['achievements_found'] = self.extract_achievements_from_cv(cv_text)
+        analysis['achievements_found'] = context.achievements
         
         # Analyze summary
-        analysis['summary_alignment'] = self._analyze_summary_alignment(cv_sections.get('summary', ''), requirements)
+        analysis['summary_alignment'] = self._analyze_summary_alignment(parsed_cv.section('summary'), requirements)
         
         # Determine strengths and weaknesses
         analysis['cv_strengths'] = self._identify_strengths(analysis)
@@ -123,9 +123,16 @@ class AIJobAssistant:
     
     def analyze_cv_vs_jd(self, cv_text: str, job_description: str) -> Dict:
         """Comprehensive analysis comparing CV with Job Description"""
-        requirements = self.analyze_job_requirements(job_description)
-        cv_skills = self._extract_all_skills_from_cv(cv_text)
-        
+        return self.analyze(cv_text, job_description).cv_match
+    
+    def text_similarity(self, cv_text: str, job_description: str) -> int:
+        """TF-IDF similarity of the full CV and job description texts, as a percentage"""
+        # NumPy and SciPy load with the first similarity instead of at startup
+        from .tfidf import text_similarity
+        return text_similarity(cv_text, job_description)
+    
+    def _match_cv_skills(self, requirements: Dict, cv_skills: List[str]) -> Dict:
+        """Match the skills required by a job against the skills found in a CV"""
         analysis = {
             'total_jd_skills': len(requirements['all_detected_skills']),
             'skills_matched': [],
@@ -138,35 +145,28 @@ class AIJobAssistant:
         }
         
         # Analyze each JD skill against CV
+        cv_index = SkillIndex(cv_skills)
         for jd_skill in requirements['all_detected_skills']:
-            jd_skill_lower = jd_skill.lower()
-            matched = False
-            partial_match = False
+            match = cv_index.first_match(jd_skill)
+            if match is None:
+                analysis['skills_missing'].append(jd_skill)
+                continue
             
-            for cv_skill in cv_skills:
-                cv_skill_lower = cv_skill.lower()
-                
+            position, is_exact = match
+            if is_exact:
                 # Exact match
-                if jd_skill_lower == cv_skill_lower:
-                    analysis['skills_matched'].append({
-                        'jd_skill': jd_skill,
-                        'cv_skill': cv_skill,
-                        'match_type': 'exact'
-                    })
-                    matched = True
-                    break
+                analysis['skills_matched'].append({
+                    'jd_skill': jd_skill,
+                    'cv_skill': cv_skills[position],
+                    'match_type': 'exact'
+                })
+            else:
                 # Partial match (one contains the other)
-                elif jd_skill_lower in cv_skill_lower or cv_skill_lower in jd_skill_lower:
-                    analysis['skills_partial_match'].append({
-                        'jd_skill': jd_skill,
-                        'cv_skill': cv_skill,
-                        'match_type': 'partial'
-                    })
-                    partial_match = True
-                    break
-            
-            if not matched and not partial_match:
-                analysis['skills_missing'].append(jd_skill)
+                analysis['skills_partial_match'].append({
+                    'jd_skill': jd_skill,
+                    'cv_skill': cv_skills[position],
+                    'match_type': 'partial'
+                })
         
         # Calculate match percentage
         total_matched = len(analysis['skills_matched']) + len(analysis['skills_partial_match'])
@@ -176,9 +176,10 @@ class AIJobAssistant:
     
     def analyze_linkedin_vs_jd(self, linkedin_about: str, job_description: str) -> Dict:
         """Analyze LinkedIn About section against Job Description"""
-        requirements = self.analyze_job_requirements(job_description)
-        linkedin_skills = self._extract_skills_from_text(linkedin_about)
-        
+        return self.analyze("", job_description, linkedin_about).linkedin_match
+    
+    def _match_linkedin_skills(self, requirements: Dict, linkedin_skills: List[str]) -> Dict:
+        """Match the skills required by a job against the skills found in a LinkedIn About section"""
         analysis = {
             'linkedin_skills_found': linkedin_skills,
             'skills_matched': [],
@@ -188,21 +189,16 @@ class AIJobAssistant:
         }
         
         # Analyze skill matching
+        linkedin_index = SkillIndex(linkedin_skills)
         for jd_skill in requirements['all_detected_skills']:
-            jd_skill_lower = jd_skill.lower()
-            matched = False
-            
-            for li_skill in linkedin_skills:
-                if jd_skill_lower in li_skill.lower() or li_skill.lower() in jd_skill_lower:
-                    analysis['skills_matched'].append({
-                        'jd_skill': jd_skill,
-                        'linkedin_skill': li_skill
-                    })
-                    matched = True
-                    break
-            
-            if not matched:
+            match = linkedin_index.first_match(jd_skill)
+            if match is None:
                 analysis['skills_missing'].append(jd_skill)
+            else:
+                analysis['skills_matched'].append({
+                    'jd_skill': jd_skill,
+                    'linkedin_skill': linkedin_skills[match[0]]
+                })
         
         # Calculate match percentage
         analysis['match_percentage'] = int((len(analysis['skills_matched']) / len(requirements['all_detected_skills'])) * 100) if requirements['all_detected_skills'] else 0
@@ -216,15 +212,18 @@ class AIJobAssistant:
         
         return analysis
     
-    def generate_cv_improvements(self, original_cv: str, job_description: str, linkedin_url: str = "") -> str:
+    def generate_cv_improvements(self, original_cv: str, job_description: str, linkedin_url: str = "",
+                                 context: Optional[AnalysisContext] = None) -> str:
         """Generate comprehensive CV improvement suggestions"""
-        analysis = self.analyze_cv_vs_jd(original_cv, job_description)
+        context = context or self.analyze(original_cv, job_description)
+        analysis = context.cv_match
         
         cv_improvements = f"""COMPREHENSIVE CV vs JOB DESCRIPTION ANALYSIS
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 📊 MATCH ANALYSIS:
 • Overall Match: {analysis['match_percentage']}%
+• Text Similarity (TF-IDF): {context.text_similarity}%
 • JD Skills Required: {analysis['total_jd_skills']}
 • Skills Matched: {len(analysis['skills_matched'])}
 • Skills Partially Matched: {len(analysis['skills_partial_match'])}
@@ -258,13 +257,15 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 """
         return cv_improvements
     
-    def generate_linkedin_suggestions(self, linkedin_about: str, job_description: str, cv_text: str = "") -> str:
+    def generate_linkedin_suggestions(self, linkedin_about: str, job_description: str, cv_text: str = "",
+                                      context: Optional[AnalysisContext] = None) -> str:
         """Generate LinkedIn optimization suggestions"""
-        linkedin_analysis = self.analyze_linkedin_vs_jd(linkedin_about, job_description)
-        cv_analysis = self.analyze_cv_vs_jd(cv_text, job_description) if cv_text else None
+        context = context or self.analyze(cv_text, job_description, linkedin_about)
+        linkedin_analysis = context.linkedin_match
+        cv_analysis = context.cv_match if context.cv_text else None
         
         # Generate headline suggestions
-        headline_suggestions = self._generate_linkedin_headlines(cv_analysis, linkedin_analysis, job_description)
+        headline_suggestions = self._generate_linkedin_headlines(cv_analysis, linkedin_analysis, context.requirements)
         
         linkedin_suggestions = f"""LINKEDIN PROFILE OPTIMIZATION
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}
@@ -302,10 +303,12 @@ RECOMMENDED UPDATES:
 """
         return linkedin_suggestions
 
-    def generate_linkedin_improvements(self, cv_text: str, job_description: str, linkedin_url: str = "") -> str:
+    def generate_linkedin_improvements(self, cv_text: str, job_description: str, linkedin_url: str = "",
+                                       context: Optional[AnalysisContext] = None) -> str:
         """Generate LinkedIn improvements when no About section is provided"""
-        analysis = self.analyze_cv_vs_jd(cv_text, job_description)
-        requirements = self.analyze_job_requirements(job_description)
+        context = context or self.analyze(cv_text, job_description)
+        analysis = context.cv_match
+        requirements = context.requirements
         
         linkedin_improvements = f"""LINKEDIN PROFILE OPTIMIZATION
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}
@@ -318,7 +321,7 @@ Based on your CV analysis against the job description:
 • Skills Missing: {len(analysis['skills_missing'])}
 
 🎯 RECOMMENDED HEADLINES:
-{chr(10).join([f'• {headline}' for headline in self._generate_linkedin_headlines(analysis, None, job_description)[:3]])}
+{chr(10).join([f'• {headline}' for headline in self._generate_linkedin_headlines(analysis, None, requirements)[:3]])}
 
 🔧 KEY SKILLS TO FEATURE ON LINKEDIN:
 {chr(10).join([f'• {match["jd_skill"]}' for match in analysis['skills_matched'][:10]]) if analysis['skills_matched'] else '• Focus on adding key skills from the job description'}
@@ -336,13 +339,14 @@ Based on your CV analysis against the job description:
 """
         return linkedin_improvements
     
-    def generate_motivation_letter(self, cv_text: str, job_description: str, linkedin_url: str = "") -> str:
+    def generate_motivation_letter(self, cv_text: str, job_description: str, linkedin_url: str = "",
+                                   context: Optional[AnalysisContext] = None) -> str:
         """Generate motivation letter using actual analysis"""
-        analysis = self.analyze_cv_vs_jd(cv_text, job_description)
-        requirements = self.analyze_job_requirements(job_description)
+        context = context or self.analyze(cv_text, job_description)
+        analysis = context.cv_match
         
-        company_name = self._extract_company_name(job_description)
-        position_name = self._extract_position_name(job_description)
+        company_name = context.company_name
+        position_name = context.position_name
         
         # Use actual matched skills
         matched_skills = [match['jd_skill'] for match in analysis['skills_matched'][:5]]
@@ -378,10 +382,11 @@ Sincerely,
 """
         return motivation_letter
     
-    def generate_interview_preparation(self, job_description: str, cv_text: str) -> str:
+    def generate_interview_preparation(self, job_description: str, cv_text: str,
+                                       context: Optional[AnalysisContext] = None) -> str:
         """Generate interview preparation guide based on CV analysis"""
-        requirements = self.analyze_job_requirements(job_description)
-        analysis = self.analyze_cv_content(cv_text, requirements)
+        context = context or self.analyze(cv_text, job_description)
+        analysis = context.cv_content
         
         interview_prep = f"""PERSONALIZED INTERVIEW PREPARATION GUIDE
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}
@@ -410,16 +415,16 @@ Based on your CV analysis, focus on these areas:
 ✅ FINAL PREPARATION:
 • Review your CV highlights: {', '.join(analysis['skills_found'][:3])}
 • Practice explaining: {analysis['achievements_found'][0] if analysis['achievements_found'] else 'your key projects'}
-• Research: {self._extract_company_name(job_description)}'s recent initiatives
+• Research: {context.company_name}'s recent initiatives
 """
         return interview_prep
     
     # ===== SUPPORT METHODS =====
     
-    def _extract_all_skills_from_cv(self, cv_text: str) -> List[str]:
+    def _extract_all_skills_from_cv(self, cv_text: str, parsed_cv: Optional[ParsedCV] = None) -> List[str]:
         """Extract ALL skills from CV"""
-        cv_sections = self.file_processor.parse_cv_sections(cv_text)
-        skills_section = cv_sections.get('skills', '')
+        parsed_cv = parsed_cv or self.file_processor.parse_cv(cv_text)
+        skills_section = parsed_cv.section('skills')
         
         # Comprehensive skill extraction
         all_skills = []
@@ -427,6 +432,7 @@ Based on your CV analysis, focus on these areas:
         # Extract from skills section
         if skills_section:
             # Split by common separators
+            metrics.count('regex.evaluations')
             skills = re.split(r'[,•\-\n|]', skills_section)
             for skill in skills:
                 skill_clean = skill.strip()
@@ -441,13 +447,13 @@ Based on your CV analysis, focus on these areas:
             'postgresql', 'mysql', 'redis', 'linux', 'unix', 'bash', 'shell'
         ]
         
-        cv_lower = cv_text.lower()
+        cv_lower = parsed_cv.lowered
         for keyword in technical_keywords:
             if keyword in cv_lower:
                 all_skills.append(keyword)
         
-        # Remove duplicates and return
-        return list(set(all_skills))
+        # Remove duplicates, keeping first-seen order so matching is deterministic
+        return list(dict.fromkeys(all_skills))
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from any text (LinkedIn About, etc.)"""
@@ -468,12 +474,11 @@ Based on your CV analysis, focus on these areas:
             if keyword in text_lower:
                 found_skills.append(keyword)
         
-        return list(set(found_skills))
+        return list(dict.fromkeys(found_skills))
     
-    def _generate_linkedin_headlines(self, cv_analysis: Dict, linkedin_analysis: Dict, job_description: str) -> List[str]:
+    def _generate_linkedin_headlines(self, cv_analysis: Dict, linkedin_analysis: Dict, requirements: Dict) -> List[str]:
         """Generate LinkedIn headline suggestions"""
         headlines = []
-        requirements = self.analyze_job_requirements(job_description)
         
         # Get top matched skills
         top_skills = []
@@ -498,30 +503,19 @@ Based on your CV analysis, focus on these areas:
     
     def _skill_exists_in_cv(self, skill: str, cv_text: str) -> bool:
         """Check if skill exists in CV with context"""
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        return bool(re.search(pattern, cv_text.lower()))
+        return self.skill_matcher.contains(skill, cv_text)
     
     def _skill_is_strong_in_cv(self, skill: str, cv_text: str) -> bool:
         """Check if skill is strongly represented in CV"""
-        cv_sections = self.file_processor.parse_cv_sections(cv_text)
-        skills_section = cv_sections.get('skills', '').lower()
-        experience_section = cv_sections.get('experience', '').lower()
-        
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        
-        in_skills = bool(re.search(pattern, skills_section))
-        in_experience = bool(re.search(pattern, experience_section))
-        multiple_mentions = len(re.findall(pattern, cv_text.lower())) > 1
-        
-        return in_skills and (in_experience or multiple_mentions)
+        return index_cv(cv_text).is_strong(skill)
     
     def _analyze_experience_alignment(self, experience_text: str, requirements: Dict) -> List[str]:
         """Analyze how well experience matches requirements"""
         alignment = []
-        exp_lower = experience_text.lower()
+        exp_skills = self.skill_matcher.find_terms(experience_text)
         
         for skill in requirements['skills'][:5]:
-            if re.search(r'\b' + re.escape(skill) + r'\b', exp_lower):
+            if skill in exp_skills:
                 alignment.append(f"✅ Experience with {skill} is well-documented")
         
         return alignment if alignment else ["✅ Experience section shows good alignment with requirements"]
@@ -529,10 +523,10 @@ Based on your CV analysis, focus on these areas:
     def _analyze_summary_alignment(self, summary_text: str, requirements: Dict) -> List[str]:
         """Analyze summary alignment with job requirements"""
         alignment = []
-        summary_lower = summary_text.lower() if summary_text else ""
+        summary_skills = self.skill_matcher.find_terms(summary_text or "")
         
         for skill in requirements['skills'][:3]:
-            if re.search(r'\b' + re.escape(skill) + r'\b', summary_lower):
+            if skill in summary_skills:
                 alignment.append(f"✅ {skill} mentioned in summary")
         
         return alignment if alignment else ["✅ Summary is well-structured"]
@@ -569,27 +563,7 @@ Based on your CV analysis, focus on these areas:
     
     def extract_achievements_from_cv(self, cv_text: str) -> List[str]:
         """Extract quantifiable achievements from CV"""
-        achievements = []
-        patterns = [
-            r'increased\s+[^.]*\s+by\s+(\d+%|\$\d+)',
-            r'reduced\s+[^.]*\s+by\s+(\d+%|\$\d+)',
-            r'improved\s+[^.]*\s+by\s+(\d+%)',
-            r'saved\s+[^.]*\s+(\d+%|\$\d+)',
-            r'achieved\s+[^.]*\s+(\d+%)',
-            r'led\s+[^.]*\s+team',
-            r'managed\s+[^.]*\s+project',
-            r'developed\s+[^.]*\s+system',
-            r'implemented\s+[^.]*\s+solution'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, cv_text.lower())
-            for match in matches:
-                achievement = match.group(0).capitalize()
-                if achievement not in achievements:
-                    achievements.append(achievement)
-        
-        return achievements[:10]
+        return extract_achievements(cv_text)
     
     def _extract_company_name(self, job_description: str) -> str:
         """Extract company name from job description"""
@@ -600,6 +574,7 @@ Based on your CV analysis, focus on these areas:
         ]
         
         for pattern in patterns:
+            metrics.count('regex.evaluations')
             match = re.search(pattern, job_description, re.IGNORECASE)
             if match:
                 company = match.group(1).strip()
@@ -618,35 +593,15 @@ Based on your CV analysis, focus on these areas:
             return first_line
         return "[Position Name]"
     
-    def save_as_txt(self, content: str, filename: str) -> str:
-        """Save content as text file"""
-        os.makedirs('generated_files', exist_ok=True)
-        filepath = os.path.join('generated_files', filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return filepath
+    def save_as_txt(self, content: str, filename: str, session_id: Optional[str] = None) -> str:
+        """Save content as text file in the output store; files are named by content hash, not filename"""
+        store = get_output_store()
+        return store.path(store.put(content.encode('utf-8'), 'txt', session_id))
     
-    def save_as_pdf(self, content: str, filename: str) -> str:
-        """Save content as PDF file"""
+    def save_as_pdf(self, content: str, filename: str, session_id: Optional[str] = None) -> str:
+        """Save content as PDF file in the output store"""
         try:
-            os.makedirs('generated_files', exist_ok=True)
-            filepath = os.path.join('generated_files', filename)
-            
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_font("Helvetica", size=10)
-            
-            clean_content = content.replace('•', '-').replace('✓', '[X]')
-            
-            lines = clean_content.split('\n')
-            for line in lines:
-                if pdf.get_string_width(line) > 190:
-                    pdf.multi_cell(0, 5, line)
-                else:
-                    pdf.cell(0, 5, line, ln=True)
-            
-            pdf.output(filepath)
-            return filepath
-            
+            store = get_output_store()
+            return store.path(store.put(self.pdf_generator.render(content), 'pdf', session_id))
         except Exception as e:
-            return self.save_as_txt(content, filename.replace('.pdf', '.txt'))
\ No newline at end of file
+            return self.save_as_txt(content, filename.replace('.pdf', '.txt'), session_id)
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""Persistent cache of job requirement and CV match analyses.
+
+Usage (from the project root):
+    python -m utils.analysis_cache warmup --jds jds/ --cvs cvs/
+    python -m utils.analysis_cache stats
+    python -m utils.analysis_cache evict --max-mb 32
+    python -m utils.analysis_cache clear
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional
+
+from .extraction_cache import content_hash
+from .instrumentation import metrics
+from .skill_matcher import TAXONOMY_VERSION
+from .sqlite_store import SQLiteStore
+
+# Database file and size budget of the cache the application uses (JOB_ASSISTANT_ANALYSIS_CACHE_PATH / _MAX_MB)
+ANALYSIS_CACHE_PATH = os.environ.get('JOB_ASSISTANT_ANALYSIS_CACHE_PATH', os.path.join('analysis_cache', 'analysis.sqlite3'))
+DEFAULT_MAX_BYTES = int(os.environ.get('JOB_ASSISTANT_ANALYSIS_CACHE_MAX_MB', '64')) * 1024 * 1024
+
+# Modules whose code decides what analyze_job_requirements and analyze_cv_vs_jd return
+ENGINE_MODULES = ('ai_helpers.py', 'cv_parser.py', 'experience.py', 'skill_index.py', 'skill_matcher.py')
+
+# Entries read again within this many seconds keep their recorded access time, saving a write per hit
+ACCESS_RESOLUTION_SECONDS = 60
+
+# Size is checked against the budget after this many writes from one process
+EVICT_EVERY = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analysis_accessed ON analysis (accessed);
+"""
+
+
+@lru_cache(maxsize=1)
+def engine_version() -> str:
+    """Hash of the analysis code and the taxonomy, so cached results never outlive either"""
+    digest = hashlib.sha256(TAXONOMY_VERSION.encode('utf-8'))
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in ENGINE_MODULES:
+        with open(os.path.join(directory, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class AnalysisCache(SQLiteStore):
+    """SQLite cache of analysis results keyed by content hash and engine version.
+
+    Several Streamlit or batch worker processes can share one database
+    file. Values are stored as JSON, so tuples come back as lists. Once the
+    stored values exceed max_bytes, the least recently read entries are
+    removed first.
+    """
+
+    schema = _SCHEMA
+
+    def __init__(self, path: str = ANALYSIS_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        # Writes by every thread of this process, counted under the lock
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+    @staticmethod
+    def key(kind: str, parts: Iterable[str]) -> str:
+        """Return the cache key of an analysis of the given inputs"""
+        hashes = [content_hash(part.encode('utf-8')) for part in parts]
+        return content_hash('\0'.join([kind, engine_version()] + hashes).encode('utf-8'))
+
+    def get(self, key: str) -> Optional[object]:
+        """Return the cached value for key, or None on a miss"""
+        connection = self._connection()
+        row = connection.execute("SELECT value, accessed FROM analysis WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            metrics.count('analysis_cache.misses')
+            return None
+        now = time.time()
+        if now - row[1] > ACCESS_RESOLUTION_SECONDS:
+            connection.execute("UPDATE analysis SET accessed = ? WHERE key = ?", (now, key))
+        metrics.count('analysis_cache.hits')
+        return json.loads(row[0])
+
+    def put(self, key: str, kind: str, value: object):
+        """Store a JSON-serializable value under key"""
+        self._put_data(key, kind, json.dumps(value))
+
+    def _put_data(self, key: str, kind: str, data: str):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO analysis (key, kind, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, kind, data, len(data), time.time()))
+        with self._writes_lock:
+            self._writes += 1
+            due = self._writes % EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def get_or_compute(self, kind: str, parts: Iterable[str], compute: Callable[[], object]) -> object:
+        """Return the cached analysis of parts, computing and storing it on a miss.
+
+        A database that cannot be opened or written never fails the analysis;
+        the result is computed and returned uncached instead.
+        """
+        try:
+            key = self.key(kind, parts)
+            value = self.get(key)
+        except (sqlite3.Error, OSError):
+            metrics.count('analysis_cache.errors')
+            return compute()
+        if value is not None:
+            return value
+
+        # A miss returns the JSON round trip a later hit reads back, so tuples are lists either way
+        data = json.dumps(compute())
+        try:
+            self._put_data(key, kind, data)
+        except (sqlite3.Error, OSError):
+            metrics.count('analysis_cache.errors')
+        return json.loads(data)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Remove least recently read entries until the cache fits max_bytes; returns entries removed"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            excess = connection.execute("SELECT total(size) FROM analysis").fetchone()[0] - max_bytes
+            removed = 0
+            if excess > 0:
+                keys = []
+                for key, size in connection.execute("SELECT key, size FROM analysis ORDER BY accessed"):
+                    keys.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                connection.executemany("DELETE FROM analysis WHERE key = ?", keys)
+                removed = len(keys)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if removed:
+            metrics.count('analysis_cache.evictions', removed)
+        return removed
+
+    def clear(self):
+        """Remove every entry"""
+        self._connection().execute("DELETE FROM analysis")
+
+    def stats(self) -> Dict:
+        """Return entry counts per kind and the stored size"""
+        connection = self._connection()
+        counts = dict(connection.execute("SELECT kind, count(*) FROM analysis GROUP BY kind"))
+        size = connection.execute("SELECT total(size) FROM analysis").fetchone()[0]
+        return {
+            'entries': sum(counts.values()),
+            'entries_by_kind': counts,
+            'current_bytes': int(size),
+            'max_bytes': self.max_bytes,
+            'engine_version': engine_version(),
+            'path': self.path
+        }
+
+
+# Cache the application's assistant reads analyses from; nothing touches the database until the first analysis
+analysis_cache = AnalysisCache()
+
+
+def warmup(cache: AnalysisCache, jd_folder: str, cv_folder: Optional[str] = None) -> Dict[str, int]:
+    """Analyze every job description, and every CV against each of them, into the cache"""
+    from .ai_helpers import AIJobAssistant
+    from .batch_scoring import list_documents
+    from .file_processor import FileProcessor
+
+    assistant = AIJobAssistant(analysis_cache=cache)
+    jd_texts = [FileProcessor.process_file_path(path) for path in list_documents(jd_folder)]
+    cv_texts = [FileProcessor.process_file_path(path) for path in list_documents(cv_folder)] if cv_folder else []
+
+    for jd_text in jd_texts:
+        assistant.analyze_job_requirements(jd_text)
+    for cv_text in cv_texts:
+        for jd_text in jd_texts:
+            assistant.analyze_cv_vs_jd(cv_text, jd_text)
+    cache.evict()
+    return {'jds': len(jd_texts), 'cvs': len(cv_texts), 'pairs': len(jd_texts) * len(cv_texts)}
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Manage the persistent analysis cache")
+    parser.add_argument('--path', default=ANALYSIS_CACHE_PATH, help="cache database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+    warm = commands.add_parser('warmup', help="analyze job descriptions (and CVs against them) ahead of time")
+    warm.add_argument('--jds', required=True, help="folder of job descriptions (PDF, DOCX, TXT)")
+    warm.add_argument('--cvs', help="folder of CVs to match against every job description")
+    commands.add_parser('stats', help="show entry counts and size")
+    evict = commands.add_parser('evict', help="shrink the cache to a size budget")
+    evict.add_argument('--max-mb', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024))
+    commands.add_parser('clear', help="remove every entry")
+    args = parser.parse_args(argv)
+
+    cache = AnalysisCache(args.path)
+    if args.command == 'warmup':
+        started = time.perf_counter()
+        counts = warmup(cache, args.jds, args.cvs)
+        print(f"Cached {counts['jds']} job descriptions and {counts['pairs']} CV matches "
+              f"in {time.perf_counter() - started:.1f}s")
+    elif args.command == 'evict':
+        print(f"Removed {cache.evict(int(args.max_mb * 1024 * 1024))} entries")
+    elif args.command == 'clear':
+        cache.clear()
+        print("Cleared the analysis cache")
+    print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import threading
+from typing import Dict, List, Optional
+
+from .cv_parser import ParsedCV
+from .instrumentation import metrics
+from .term_index import CVTermIndex
+
+# Marks a value that has not been computed yet
+_MISSING = object()
+
+
+class AnalysisContext:
+    """Per-request analysis of one CV and job description.
+
+    Every value is computed on first access and then reused, so the generators
+    behind a single "Generate" click parse the JD and CV only once. Each value
+    has its own lock, so threads sharing a context only wait for each other
+    when they need the same value.
+    """
+
+    def __init__(self, assistant, cv_text: str, job_description: str, linkedin_about: str = "",
+                 requirements: Optional[Dict[str, List]] = None):
+        self.assistant = assistant
+        self.cv_text = cv_text or ""
+        self.job_description = job_description or ""
+        self.linkedin_about = linkedin_about or ""
+        self._values = {}
+        # Value name -> lock held while it is computed; _lock guards creating them
+        self._value_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        # Requirements may be supplied when they were already computed elsewhere
+        if requirements is not None:
+            self._values['requirements'] = requirements
+
+    def _get(self, name: str, factory):
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING:
+            with self._lock:
+                value_lock = self._value_locks.setdefault(name, threading.Lock())
+            with value_lock:
+                value = self._values.get(name, _MISSING)
+                if value is _MISSING:
+                    with metrics.stage(f"analysis.{name}"):
+                        value = self._values[name] = factory()
+                    return value
+        metrics.count('analysis_context.hits')
+        return value
+
+    @property
+    def requirements(self) -> Dict[str, List]:
+        """Job requirements extracted from the job description"""
+        return self._get('requirements', lambda: self.assistant.analyze_job_requirements(self.job_description))
+
+    @property
+    def parsed_cv(self) -> ParsedCV:
+        """CV parsed once into section spans"""
+        return self._get('parsed_cv', lambda: self.assistant.file_processor.parse_cv(self.cv_text))
+
+    @property
+    def term_index(self) -> CVTermIndex:
+        """Frequency index of taxonomy terms in the CV"""
+        return self._get('term_index', lambda: CVTermIndex(self.parsed_cv, self.assistant.skill_matcher))
+
+    @property
+    def cv_sections(self) -> Dict[str, str]:
+        """CV split into its structured sections"""
+        return self._get('cv_sections', lambda: self.parsed_cv.as_dict())
+
+    @property
+    def cv_skills(self) -> List[str]:
+        """Every skill found in the CV"""
+        return self._get('cv_skills', lambda: self.assistant._extract_all_skills_from_cv(self.cv_text, self.parsed_cv))
+
+    @property
+    def linkedin_skills(self) -> List[str]:
+        """Skills found in the LinkedIn About section"""
+        return self._get('linkedin_skills', lambda: self.assistant._extract_skills_from_text(self.linkedin_about))
+
+    @property
+    def cv_match(self) -> Dict:
+        """CV vs JD skill match, as returned by analyze_cv_vs_jd"""
+        return self._get('cv_match', self._compute_cv_match)
+
+    def _compute_cv_match(self) -> Dict:
+        # The match only depends on the CV and the required skills, so it is keyed on those
+        required = '\n'.join(self.requirements['all_detected_skills'])
+        return self.assistant.cached_analysis(
+            'cv_match', (self.cv_text, required),
+            lambda: self.assistant._match_cv_skills(self.requirements, self.cv_skills))
+
+    @property
+    def text_similarity(self) -> int:
+        """TF-IDF similarity of the CV and job description, beyond taxonomy skills"""
+        return self._get('text_similarity', lambda: self.assistant.text_similarity(self.cv_text, self.job_description))
+
+    @property
+    def linkedin_match(self) -> Dict:
+        """LinkedIn About vs JD skill match, as returned by analyze_linkedin_vs_jd"""
+        return self._get('linkedin_match', lambda: self.assistant._match_linkedin_skills(self.requirements, self.linkedin_skills))
+
+    @property
+    def achievements(self) -> List[str]:
+        """Quantifiable achievements found in the CV"""
+        return self._get('achievements', lambda: self.assistant.extract_achievements_from_cv(self.cv_text))
+
+    @property
+    def cv_content(self) -> Dict:
+        """CV content analysis, as returned by analyze_cv_content"""
+        return self._get('cv_content', lambda: self.assistant._analyze_cv_content(self))
+
+    @property
+    def company_name(self) -> str:
+        return self._get('company_name', lambda: self.assistant._extract_company_name(self.job_description))
+
+    @property
+    def position_name(self) -> str:
+        return self._get('position_name', lambda: self.assistant._extract_position_name(self.job_description))
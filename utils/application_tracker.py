@@ -0,0 +1,235 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .extraction_cache import content_hash
+from .sqlite_store import SQLiteStore
+
+# Database file of the tracker behind the Applications tab; set JOB_ASSISTANT_TRACKER_PATH to keep it elsewhere
+TRACKER_PATH = os.environ.get('JOB_ASSISTANT_TRACKER_PATH', os.path.join('application_tracker', 'applications.sqlite3'))
+
+# Applications returned per page unless a caller asks for another size
+DEFAULT_PAGE_SIZE = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    jd_hash TEXT NOT NULL,
+    company TEXT NOT NULL COLLATE NOCASE,
+    position TEXT NOT NULL,
+    match_percentage INTEGER NOT NULL,
+    missing_skills TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_created ON applications (created, id);
+CREATE INDEX IF NOT EXISTS applications_company ON applications (company, created, id);
+CREATE INDEX IF NOT EXISTS applications_jd_hash ON applications (jd_hash);
+CREATE TABLE IF NOT EXISTS application_skills (
+    skill TEXT NOT NULL COLLATE NOCASE,
+    created REAL NOT NULL,
+    application_id INTEGER NOT NULL REFERENCES applications (id) ON DELETE CASCADE,
+    PRIMARY KEY (skill, created, application_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS application_skills_application ON application_skills (application_id);
+CREATE TABLE IF NOT EXISTS application_files (
+    application_id INTEGER NOT NULL REFERENCES applications (id) ON DELETE CASCADE,
+    document TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    file_id TEXT NOT NULL,
+    PRIMARY KEY (application_id, document, extension)
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = "a.id, a.created, a.jd_hash, a.company, a.position, a.match_percentage, a.missing_skills"
+
+# (created, id) of the last application on a page; the next page starts after it
+Cursor = Tuple[float, int]
+
+
+class ApplicationTracker(SQLiteStore):
+    """SQLite record of every generated application.
+
+    Each application keeps the hash of its job description, the company and
+    position, the match percentage, the missing skills and the output store
+    ids of its saved files. Pages are read newest first with keyset
+    pagination: a page continues from the (created, id) of the previous
+    page's last row, so every page costs one index range scan however deep
+    it is. Company and missing-skill filters have their own indexes that
+    are ordered by date as well.
+    """
+
+    schema = _SCHEMA
+    # Deleting an application deletes its skill and file rows too
+    pragmas = ('foreign_keys=ON',)
+
+    def __init__(self, path: str = TRACKER_PATH):
+        super().__init__(path)
+
+    def record(self, job_description: str, company: str, position: str, match_percentage: int,
+               missing_skills: List[str], file_ids: Optional[Dict[str, Dict[str, str]]] = None,
+               created: Optional[float] = None) -> int:
+        """Record one generated application and return its id"""
+        return self.record_many([{
+            'job_description': job_description,
+            'company': company,
+            'position': position,
+            'match_percentage': match_percentage,
+            'missing_skills': missing_skills,
+            'file_ids': file_ids,
+            'created': created
+        }])[0]
+
+    def record_many(self, applications: Iterable[Dict]) -> List[int]:
+        """Record several applications in one transaction; takes the keyword arguments of record as dicts"""
+        connection = self._connection()
+        ids = []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for application in applications:
+                created = application.get('created') or time.time()
+                missing_skills = list(dict.fromkeys(application['missing_skills']))
+                cursor = connection.execute(
+                    "INSERT INTO applications (created, jd_hash, company, position, match_percentage, missing_skills) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (created, content_hash(application['job_description'].encode('utf-8')), application['company'],
+                     application['position'], int(application['match_percentage']), json.dumps(missing_skills)))
+                application_id = cursor.lastrowid
+                connection.executemany(
+                    "INSERT OR IGNORE INTO application_skills (skill, created, application_id) VALUES (?, ?, ?)",
+                    [(skill, created, application_id) for skill in missing_skills])
+                self._insert_files(connection, application_id, application.get('file_ids'))
+                ids.append(application_id)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return ids
+
+    @staticmethod
+    def _insert_files(connection: sqlite3.Connection, application_id: int,
+                      file_ids: Optional[Dict[str, Dict[str, str]]]):
+        rows = [
+            (application_id, document, extension, file_id)
+            for document, by_extension in (file_ids or {}).items()
+            for extension, file_id in by_extension.items()
+        ]
+        connection.executemany(
+            "INSERT OR REPLACE INTO application_files (application_id, document, extension, file_id) "
+            "VALUES (?, ?, ?, ?)", rows)
+
+    def attach_files(self, application_id: int, file_ids: Dict[str, Dict[str, str]]):
+        """Link output store files, by document and format, to a recorded application"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._insert_files(connection, application_id, file_ids)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def page(self, company: Optional[str] = None, skill: Optional[str] = None, since: Optional[float] = None,
+             until: Optional[float] = None, min_match: Optional[int] = None, after: Optional[Cursor] = None,
+             limit: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """Return one page of applications, newest first, and the cursor of the next page.
+
+        company and skill match case-insensitively; skill filters on missing
+        skills. since and until bound the creation time (unix seconds, until
+        exclusive). Pass the returned next_cursor as after to continue.
+        """
+        if skill:
+            query = (f"SELECT {_COLUMNS} FROM application_skills s CROSS JOIN applications a ON a.id = s.application_id "
+                     "WHERE s.skill = ?")
+            params: list = [skill]
+            created, row_id = 's.created', 's.application_id'
+        else:
+            query = f"SELECT {_COLUMNS} FROM applications a WHERE 1"
+            params = []
+            created, row_id = 'a.created', 'a.id'
+        if company:
+            query += " AND a.company = ?"
+            params.append(company)
+        if since is not None:
+            query += f" AND {created} >= ?"
+            params.append(since)
+        if until is not None:
+            query += f" AND {created} < ?"
+            params.append(until)
+        if min_match is not None:
+            query += " AND a.match_percentage >= ?"
+            params.append(min_match)
+        if after is not None:
+            query += f" AND ({created}, {row_id}) < (?, ?)"
+            params.extend(after)
+        # One extra row tells whether another page follows
+        query += f" ORDER BY {created} DESC, {row_id} DESC LIMIT ?"
+        params.append(limit + 1)
+
+        connection = self._connection()
+        rows = connection.execute(query, params).fetchall()
+        applications = [self._application(row) for row in rows[:limit]]
+        self._load_files(connection, applications)
+        next_cursor = (applications[-1]['created'], applications[-1]['id']) if len(rows) > limit else None
+        return {'applications': applications, 'next_cursor': next_cursor}
+
+    @staticmethod
+    def _application(row: tuple) -> Dict:
+        return {
+            'id': row[0],
+            'created': row[1],
+            'jd_hash': row[2],
+            'company': row[3],
+            'position': row[4],
+            'match_percentage': row[5],
+            'missing_skills': json.loads(row[6]),
+            'file_ids': {}
+        }
+
+    @staticmethod
+    def _load_files(connection: sqlite3.Connection, applications: List[Dict]):
+        """Fill in file_ids for a page of applications with one query"""
+        if not applications:
+            return
+        by_id = {application['id']: application for application in applications}
+        placeholders = ','.join('?' * len(by_id))
+        for application_id, document, extension, file_id in connection.execute(
+                f"SELECT application_id, document, extension, file_id FROM application_files "
+                f"WHERE application_id IN ({placeholders})", list(by_id)):
+            by_id[application_id]['file_ids'].setdefault(document, {})[extension] = file_id
+
+    def get(self, application_id: int) -> Optional[Dict]:
+        """Return one application, or None if it does not exist"""
+        connection = self._connection()
+        row = connection.execute(
+            f"SELECT {_COLUMNS} FROM applications a WHERE a.id = ?", (application_id,)).fetchone()
+        if row is None:
+            return None
+        application = self._application(row)
+        self._load_files(connection, [application])
+        return application
+
+    def delete(self, application_id: int) -> bool:
+        """Remove an application with its skills and file links; stored files are left to the output store"""
+        cursor = self._connection().execute("DELETE FROM applications WHERE id = ?", (application_id,))
+        return cursor.rowcount > 0
+
+    def clear(self):
+        """Remove every application"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for table in ('application_files', 'application_skills', 'applications'):
+                connection.execute(f"DELETE FROM {table}")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT count(*) FROM applications").fetchone()[0]
+
+
+# Tracker the app records each generated application into and pages through
+application_tracker = ApplicationTracker()
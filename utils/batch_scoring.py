@@ -0,0 +1,286 @@
+"""Score a folder of CVs against a folder of job descriptions.
+
+Usage (from the project root):
+    python -m utils.batch_scoring --cvs cvs/ --jds jds/ --output results.jsonl
+    python -m utils.batch_scoring --cvs cvs/ --jds jds/ --output results.csv --resume
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from .ai_helpers import AIJobAssistant
+from .analysis_cache import ANALYSIS_CACHE_PATH, AnalysisCache
+from .file_processor import FILE_TYPES_BY_EXTENSION, FileProcessor
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+    from .skill_vectors import JobSkillVectors, SkillVocabulary
+    from .tfidf import TfidfModel
+
+OUTPUT_FIELDS = ['cv', 'jd', 'match_percentage', 'text_similarity', 'skills_matched', 'skills_partial_match',
+                 'skills_missing_count', 'skills_missing']
+
+# Per-worker state, set once by the pool initializer
+_worker_assistant: Optional[AIJobAssistant] = None
+_worker_jobs: Dict[str, Dict] = {}
+_worker_tfidf: Optional['TfidfModel'] = None
+_worker_jd_vectors: Optional['csr_matrix'] = None
+_worker_jd_rows: Dict[str, int] = {}
+_worker_vocabulary: Optional['SkillVocabulary'] = None
+_worker_job_skills: Optional['JobSkillVectors'] = None
+
+
+def list_documents(folder: str) -> List[str]:
+    """Return the supported documents in a folder, sorted by name"""
+    return sorted(
+        os.path.join(folder, name) for name in os.listdir(folder)
+        if os.path.splitext(name)[1].lower() in FILE_TYPES_BY_EXTENSION
+        and os.path.isfile(os.path.join(folder, name))
+    )
+
+
+def _extract(path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Extract one document, returning (path, text, error)"""
+    try:
+        # Documents are already spread over the pool, so pages are read serially
+        return path, FileProcessor.process_file_path(path, parallel=False), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def extract_all(paths: List[str], executor: ProcessPoolExecutor) -> Dict[str, str]:
+    """Extract every document in parallel, reporting unreadable ones on stderr"""
+    texts = {}
+    for path, text, error in executor.map(_extract, paths, chunksize=8):
+        if error:
+            print(f"Skipping {path}: {error}", file=sys.stderr)
+        else:
+            texts[path] = text
+    return texts
+
+
+@lru_cache(maxsize=None)
+def _open_analysis_cache(path: str) -> AnalysisCache:
+    """One cache, and so one connection, per worker process"""
+    return AnalysisCache(path)
+
+
+def _analyze_job(item: Tuple[str, str], cache_path: Optional[str] = None) -> Tuple[str, Dict]:
+    jd_id, jd_text = item
+    assistant = AIJobAssistant(analysis_cache=_open_analysis_cache(cache_path) if cache_path else None)
+    return jd_id, assistant.analyze_job_requirements(jd_text)
+
+
+def _init_worker(jobs: Dict[str, Dict], tfidf: 'TfidfModel', jd_vectors: 'csr_matrix', jd_ids: List[str]):
+    global _worker_assistant, _worker_jobs, _worker_tfidf, _worker_jd_vectors, _worker_jd_rows
+    global _worker_vocabulary, _worker_job_skills
+    from .skill_vectors import SkillVocabulary
+    
+    _worker_assistant = AIJobAssistant()
+    _worker_jobs = jobs
+    _worker_tfidf = tfidf
+    _worker_jd_vectors = jd_vectors
+    _worker_jd_rows = {jd_id: row for row, jd_id in enumerate(jd_ids)}
+    _worker_vocabulary = SkillVocabulary(_worker_assistant.skill_matcher)
+    _worker_job_skills = _worker_vocabulary.encode_jobs([jobs[jd_id] for jd_id in jd_ids])
+
+
+def _score_cv(cv_id: str, cv_text: str, jd_ids: List[str]) -> List[Dict]:
+    """Score one CV against the given jobs; CV skills are extracted once"""
+    from .tfidf import TfidfModel, similarity_percentage
+    
+    cv_skills = _worker_assistant._extract_all_skills_from_cv(cv_text)
+    # Skill counts and text similarity against every job, each in one vectorized product
+    cv_vectors = _worker_vocabulary.encode_cvs([cv_skills])
+    matches = _worker_vocabulary.match_matrix(cv_vectors, _worker_job_skills)
+    similarities = TfidfModel.similarities(_worker_tfidf.transform([cv_text]), _worker_jd_vectors)[0]
+    rows = []
+    for jd_id in jd_ids:
+        column = _worker_jd_rows[jd_id]
+        rows.append({
+            'cv': cv_id,
+            'jd': jd_id,
+            'match_percentage': int(matches['match_percentage'][0, column]),
+            'text_similarity': similarity_percentage(similarities[column]),
+            'skills_matched': int(matches['exact'][0, column]),
+            'skills_partial_match': int(matches['partial'][0, column]),
+            'skills_missing_count': int(matches['missing'][0, column]),
+            'skills_missing': _worker_vocabulary.missing_skills(_worker_jobs[jd_id], cv_vectors, 0)
+        })
+    return rows
+
+
+class ResultWriter:
+    """Append-only CSV or JSONL writer that can list the pairs already written"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+        self._file = None
+        self._csv = None
+
+    def completed_pairs(self) -> Set[Tuple[str, str]]:
+        """Return the (cv, jd) pairs present in an existing output file.
+
+        A trailing line left unfinished by an interrupted run is removed
+        first, so its pair is scored again rather than counted as done.
+        """
+        if not os.path.exists(self.path):
+            return set()
+        self._drop_partial_line()
+        pairs = set()
+        with open(self.path, newline='', encoding='utf-8') as f:
+            if self.format == 'csv':
+                rows = csv.DictReader(f)
+            else:
+                rows = (json.loads(line) for line in f if line.strip())
+            try:
+                for row in rows:
+                    # DictReader fills the fields of a short row with None instead of failing
+                    if None in row.values():
+                        continue
+                    pairs.add((row['cv'], row['jd']))
+            except (ValueError, KeyError):
+                pass
+        return pairs
+
+    def _drop_partial_line(self):
+        """Truncate a trailing line left unfinished by an interrupted run"""
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def open(self, append: bool):
+        if append and os.path.exists(self.path):
+            self._drop_partial_line()
+        exists = append and os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if exists and self.format == 'csv':
+            with open(self.path, newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), [])
+            if header != OUTPUT_FIELDS:
+                raise Exception(f"Error resuming {self.path}: it was written with other columns; "
+                                f"start a new output file")
+        self._file = open(self.path, 'a' if append else 'w', newline='', encoding='utf-8')
+        if self.format == 'csv':
+            self._csv = csv.DictWriter(self._file, fieldnames=OUTPUT_FIELDS)
+            if not exists:
+                self._csv.writeheader()
+
+    def write(self, rows: List[Dict]):
+        for row in rows:
+            if self._csv:
+                self._csv.writerow(dict(row, skills_missing='; '.join(row['skills_missing'])))
+            else:
+                self._file.write(json.dumps(row) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+def run_batch(cv_folder: str, jd_folder: str, output: str, workers: Optional[int] = None,
+              resume: bool = False, analysis_cache_path: Optional[str] = None,
+              tfidf_model_path: Optional[str] = None) -> Dict:
+    """Score every CV against every JD and write one row per pair; returns run statistics.
+
+    Text similarity uses the TF-IDF model at tfidf_model_path (by default
+    the one the application loads), so batch and interactive scores agree.
+    """
+    workers = workers or os.cpu_count() or 1
+    writer = ResultWriter(output)
+    done = writer.completed_pairs() if resume else set()
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        cv_texts = extract_all(list_documents(cv_folder), executor)
+        jd_texts = extract_all(list_documents(jd_folder), executor)
+        # Identify documents by file name so output stays stable across machines
+        cv_texts = {os.path.basename(path): text for path, text in cv_texts.items()}
+        jd_texts = {os.path.basename(path): text for path, text in jd_texts.items()}
+        jobs = dict(executor.map(partial(_analyze_job, cache_path=analysis_cache_path), jd_texts.items()))
+    
+    from .tfidf import TFIDF_MODEL_PATH, TfidfModel, load_default_model
+    # Every job in one fixed order: the rows of jd_vectors and of the workers' skill vectors
+    all_jd_ids = list(jobs)
+    tfidf = load_default_model(tfidf_model_path or TFIDF_MODEL_PATH)
+    if tfidf is None:
+        if tfidf_model_path:
+            raise Exception(f"Error loading TF-IDF model: {tfidf_model_path} does not exist")
+        print(f"Warning: no TF-IDF model at {TFIDF_MODEL_PATH}; fitting one over the job descriptions of this run, "
+              f"so text similarities will differ from the application's", file=sys.stderr)
+        tfidf = TfidfModel.fit(jd_texts[jd_id] for jd_id in all_jd_ids)
+    jd_vectors = tfidf.transform(jd_texts[jd_id] for jd_id in all_jd_ids)
+    extracted = time.perf_counter()
+
+    # Only the pairs that are not in the output yet
+    pending = {}
+    for cv_id in cv_texts:
+        pending_jd_ids = [jd_id for jd_id in all_jd_ids if (cv_id, jd_id) not in done]
+        if pending_jd_ids:
+            pending[cv_id] = pending_jd_ids
+    total_pairs = sum(len(pending_jd_ids) for pending_jd_ids in pending.values())
+    skipped = len(cv_texts) * len(all_jd_ids) - total_pairs
+
+    scored = 0
+    writer.open(append=resume)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(jobs, tfidf, jd_vectors, all_jd_ids)) as executor:
+            futures = [executor.submit(_score_cv, cv_id, cv_texts[cv_id], pending_jd_ids)
+                       for cv_id, pending_jd_ids in pending.items()]
+            for future in as_completed(futures):
+                rows = future.result()
+                writer.write(rows)
+                scored += len(rows)
+                elapsed = time.perf_counter() - extracted
+                print(f"\rScored {scored}/{total_pairs} pairs ({scored / elapsed if elapsed else 0:.0f} pairs/s)",
+                      end='', file=sys.stderr)
+    finally:
+        writer.close()
+    if total_pairs:
+        print(file=sys.stderr)
+
+    finished = time.perf_counter()
+    return {
+        'cvs': len(cv_texts),
+        'jds': len(jobs),
+        'pairs_scored': scored,
+        'pairs_skipped': skipped,
+        'workers': workers,
+        'extraction_seconds': round(extracted - started, 3),
+        'scoring_seconds': round(finished - extracted, 3),
+        'pairs_per_second': round(scored / (finished - extracted), 1) if finished > extracted else 0.0
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Score a folder of CVs against a folder of job descriptions")
+    parser.add_argument('--cvs', required=True, help="folder of CVs (PDF, DOCX, TXT)")
+    parser.add_argument('--jds', required=True, help="folder of job descriptions (PDF, DOCX, TXT)")
+    parser.add_argument('--output', required=True, help="results file, .csv or .jsonl")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--resume', action='store_true', help="skip pairs already in the output file")
+    parser.add_argument('--analysis-cache', metavar='PATH',
+                        help="reuse job requirement analyses from this SQLite cache, e.g. " + ANALYSIS_CACHE_PATH)
+    parser.add_argument('--tfidf-model', metavar='PATH',
+                        help="TF-IDF model for text similarity (default: the application's model)")
+    args = parser.parse_args(argv)
+
+    stats = run_batch(args.cvs, args.jds, args.output, workers=args.workers, resume=args.resume,
+                      analysis_cache_path=args.analysis_cache, tfidf_model_path=args.tfidf_model)
+    print(f"Scored {stats['pairs_scored']} pairs ({stats['pairs_skipped']} already done) "
+          f"for {stats['cvs']} CVs x {stats['jds']} JDs on {stats['workers']} workers")
+    print(f"Extraction: {stats['extraction_seconds']}s, scoring: {stats['scoring_seconds']}s, "
+          f"{stats['pairs_per_second']} pairs/s")
+
+
+if __name__ == "__main__":
+    main()
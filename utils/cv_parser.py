@@ -0,0 +1,100 @@
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .instrumentation import metrics
+
+SECTION_NAMES = ('personal_info', 'summary', 'experience', 'education', 'skills', 'projects', 'certifications')
+
+# Header keywords per section, checked in this order
+SECTION_KEYWORDS = [
+    ('experience', ['experience', 'work history', 'employment']),
+    ('education', ['education', 'academic']),
+    ('skills', ['skills', 'technical', 'technologies']),
+    ('projects', ['projects', 'portfolio']),
+    ('certifications', ['certifications', 'certificate']),
+    ('summary', ['summary', 'objective', 'about']),
+]
+
+
+def _detect_section(lower_line: str):
+    for section, keywords in SECTION_KEYWORDS:
+        if any(keyword in lower_line for keyword in keywords):
+            return section
+    return None
+
+
+class ParsedCV:
+    """CV split into sections, each stored as a (start, end) span of one buffer.
+
+    The buffer holds every non-empty, stripped line of the CV joined by newlines,
+    header lines included, in original case (``text``) and lowered (``lowered``).
+    Section content is the run of lines after its header, so slicing the buffer
+    gives the same strings the line-by-line parser used to rebuild.
+    """
+
+    __slots__ = ('text', 'lowered', 'spans', 'lowered_spans')
+
+    def __init__(self, cv_text: str):
+        metrics.count('cv.section_parses')
+        text_parts: List[str] = []
+        lowered_parts: List[str] = []
+        text_pos = 0
+        lowered_pos = 0
+        self.spans: Dict[str, Tuple[int, int]] = {}
+        self.lowered_spans: Dict[str, Tuple[int, int]] = {}
+
+        current_section = 'personal_info'
+        run_start = None
+        run_end = None
+
+        for line in cv_text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            lower_line = line.lower()
+            section = _detect_section(lower_line)
+            if section:
+                # Close the run of content lines that belongs to the previous section
+                if run_start is not None:
+                    self.spans[current_section] = (run_start[0], run_end[0])
+                    self.lowered_spans[current_section] = (run_start[1], run_end[1])
+                current_section = section
+                run_start = None
+            else:
+                if run_start is None:
+                    run_start = (text_pos, lowered_pos)
+                run_end = (text_pos + len(line), lowered_pos + len(lower_line))
+
+            text_parts.append(line)
+            lowered_parts.append(lower_line)
+            text_pos += len(line) + 1
+            lowered_pos += len(lower_line) + 1
+
+        # Add the last section
+        if run_start is not None:
+            self.spans[current_section] = (run_start[0], run_end[0])
+            self.lowered_spans[current_section] = (run_start[1], run_end[1])
+
+        self.text = '\n'.join(text_parts)
+        self.lowered = '\n'.join(lowered_parts)
+
+    def section(self, name: str) -> str:
+        """Return a section in original case, or an empty string"""
+        span = self.spans.get(name)
+        return self.text[span[0]:span[1]] if span else ''
+
+    def section_lower(self, name: str) -> str:
+        """Return a lowered section, or an empty string"""
+        span = self.lowered_spans.get(name)
+        return self.lowered[span[0]:span[1]] if span else ''
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return every section as a string, as parse_cv_sections used to"""
+        return {name: self.section(name) for name in SECTION_NAMES}
+
+
+@lru_cache(maxsize=32)
+def parse_cv(cv_text: str) -> ParsedCV:
+    """Parse a CV once; repeated calls with the same text return the cached result"""
+    return ParsedCV(cv_text)
@@ -0,0 +1,130 @@
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator, List, Optional, Tuple
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+BODY = _W + 'body'
+PARAGRAPH = _W + 'p'
+RUN = _W + 'r'
+HYPERLINK = _W + 'hyperlink'
+TEXT = _W + 't'
+TABLE = _W + 'tbl'
+ROW = _W + 'tr'
+CELL = _W + 'tc'
+GRID_SPAN = _W + 'gridSpan'
+VERTICAL_MERGE = _W + 'vMerge'
+VAL = _W + 'val'
+TYPE = _W + 'type'
+
+# Run children that python-docx renders as characters
+_RUN_CHARACTERS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+_BREAK = _W + 'br'
+
+
+def _in_run(stack: List[str]) -> bool:
+    """Whether the element on top of the stack is a direct child of a paragraph run"""
+    if len(stack) < 3 or stack[-2] != RUN:
+        return False
+    return stack[-3] == PARAGRAPH or (stack[-3] == HYPERLINK and len(stack) >= 4 and stack[-4] == PARAGRAPH)
+
+
+def iter_docx_blocks(file) -> Iterator[Tuple[str, object]]:
+    """Stream the body of a DOCX file in document order.
+
+    Yields ('paragraph', text) for body paragraphs, ('row', [cell texts]) for
+    the rows of body-level tables and ('table_end', None) after each table.
+    Text follows python-docx: runs and hyperlinks only, tabs and breaks as
+    characters, cell text as its paragraphs joined by newlines, and merged
+    cells repeated once per grid column they cover.
+    """
+    with zipfile.ZipFile(file) as archive, archive.open('word/document.xml') as document:
+        stack: List[str] = []
+        paragraph_parts: List[str] = []
+        cell_paragraphs: List[str] = []
+        row_cells: List[Tuple[str, int, bool]] = []
+        cell_span = 1
+        cell_continues = False
+        previous_row: List[str] = []
+
+        for event, element in ET.iterparse(document, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                stack.append(tag)
+                continue
+
+            # Only body-level tables are read; nested tables are skipped like python-docx does
+            table_depth = stack.count(TABLE)
+            if tag == TEXT and _in_run(stack):
+                paragraph_parts.append(element.text or '')
+            elif tag in _RUN_CHARACTERS and _in_run(stack):
+                paragraph_parts.append(_RUN_CHARACTERS[tag])
+            elif tag == _BREAK and _in_run(stack):
+                if element.get(TYPE, 'textWrapping') == 'textWrapping':
+                    paragraph_parts.append('\n')
+            elif tag == GRID_SPAN and table_depth == 1:
+                cell_span = int(element.get(VAL, '1'))
+            elif tag == VERTICAL_MERGE and table_depth == 1:
+                cell_continues = element.get(VAL, 'continue') == 'continue'
+            elif tag == PARAGRAPH:
+                parent = stack[-2] if len(stack) > 1 else None
+                text = ''.join(paragraph_parts)
+                paragraph_parts = []
+                if parent == BODY:
+                    yield 'paragraph', text
+                    element.clear()
+                elif parent == CELL and table_depth == 1:
+                    cell_paragraphs.append(text)
+            elif tag == CELL and table_depth == 1:
+                row_cells.append(('\n'.join(cell_paragraphs), cell_span, cell_continues))
+                cell_paragraphs = []
+                cell_span = 1
+                cell_continues = False
+            elif tag == ROW and table_depth == 1:
+                cells = []
+                for text, span, continues in row_cells:
+                    for _ in range(span):
+                        # A vertically merged cell repeats the text of the cell above it
+                        if continues and len(cells) < len(previous_row):
+                            cells.append(previous_row[len(cells)])
+                        else:
+                            cells.append(text)
+                row_cells = []
+                previous_row = cells
+                yield 'row', cells
+            elif tag == TABLE and table_depth == 1:
+                previous_row = []
+                yield 'table_end', None
+                element.clear()
+
+            stack.pop()
+
+
+def extract_docx_text(file, max_chars: Optional[int] = None) -> str:
+    """Extract paragraphs and table rows of a DOCX file in document order"""
+    lines = []
+    length = 0
+    for kind, value in iter_docx_blocks(file):
+        if kind == 'paragraph':
+            if not value.strip():
+                continue
+            line = value + "\n"
+        elif kind == 'row':
+            row_text = [cell.strip() for cell in value if cell.strip()]
+            if not row_text:
+                continue
+            line = " | ".join(row_text) + "\n"
+        else:
+            line = "\n"
+        lines.append(line)
+        length += len(line)
+        # Stop once the stripped text is longer than the limit, so the cut matches the full text's prefix
+        if max_chars is not None and length > max_chars and len(''.join(lines).strip()) > max_chars:
+            break
+    text = ''.join(lines).strip()
+    return text[:max_chars] if max_chars is not None else text
@@ -0,0 +1,80 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from .instrumentation import metrics
+from .skill_matcher import get_default_matcher
+
+# "5 years", "5+ years", "3-5 years", "3 to 5 years", "minimum of 5 years", "at least 5 years"
+EXPERIENCE_PATTERN = re.compile(
+    r'(?:(?:minimum\s+of|at\s+least)\s+)?'
+    r'(?P<min>\d+)(?:(?:[-+]?\s*to|\s*-)\s*(?P<max>\d+)|\+)?'
+    r'\s*years?'
+)
+
+# Ends the clause a requirement's skill is looked up in; a full stop only
+# counts before whitespace, so "node.js" stays one clause
+_CLAUSE_BREAK = re.compile(r'[;\n]|\.(?=\s|$)')
+
+
+def _context_skill(span: Tuple[int, int], hit_starts: List[int], hit_ends: List[int], hit_terms: List[str],
+                   breaks: List[int]) -> Optional[str]:
+    """Return the first skill after the span in its clause, else the last one before it"""
+    start, end = span
+    position = bisect_left(breaks, end)
+    clause_end = breaks[position] if position < len(breaks) else None
+    position = bisect_right(breaks, start) - 1
+    clause_start = breaks[position] if position >= 0 else -1
+
+    # "5+ years of python"
+    after = bisect_left(hit_starts, end)
+    if after < len(hit_starts) and (clause_end is None or hit_starts[after] < clause_end):
+        return hit_terms[after]
+    # "Python: 5+ years"
+    before = after - 1
+    while before >= 0 and hit_ends[before] > start:
+        before -= 1
+    if before >= 0 and hit_starts[before] > clause_start:
+        return hit_terms[before]
+    return None
+
+
+def extract_experience_requirements(text: str, skill_hits: Optional[List[Tuple]] = None) -> List[Dict]:
+    """Return structured years-of-experience requirements in the order they appear.
+
+    Each requirement has min_years, max_years (None when open-ended), the
+    taxonomy skill it refers to, its span in text.lower() and the matched
+    text. One scan finds every phrasing; requirements with the same years
+    and skill are reported once. skill_hits takes the (term, entry ids,
+    start, end) tuples of a matcher pass over the same text, if one ran.
+    """
+    text_lower = text.lower()
+    if skill_hits is None:
+        skill_hits = list(get_default_matcher().iter_matches(text_lower))
+    hit_starts = [hit[2] for hit in skill_hits]
+    hit_ends = [hit[3] for hit in skill_hits]
+    hit_terms = [hit[0] for hit in skill_hits]
+    breaks = [match.start() for match in _CLAUSE_BREAK.finditer(text_lower)]
+    metrics.count('regex.evaluations', 2)
+
+    requirements = []
+    seen = set()
+    for match in EXPERIENCE_PATTERN.finditer(text_lower):
+        low = int(match.group('min'))
+        high = int(match.group('max')) if match.group('max') else None
+        if high is not None and high < low:
+            low, high = high, low
+        skill = _context_skill(match.span(), hit_starts, hit_ends, hit_terms, breaks)
+
+        key = (low, high, skill)
+        if key in seen:
+            continue
+        seen.add(key)
+        requirements.append({
+            'min_years': low,
+            'max_years': high,
+            'skill': skill,
+            'span': match.span(),
+            'text': match.group(0)
+        })
+    return requirements
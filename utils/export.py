@@ -0,0 +1,47 @@
+import io
+import zipfile
+from datetime import datetime
+from typing import Dict, Optional
+
+from .pdf_generator import UnicodePDFGenerator
+
+EXPORT_FORMATS = ('txt', 'pdf')
+
+MIME_TYPES = {
+    'txt': "text/plain",
+    'pdf': "application/pdf",
+    'zip': "application/zip",
+}
+
+
+class DocumentExporter:
+    """Render generated documents to in-memory files for download, without touching disk"""
+
+    def __init__(self, pdf_generator: Optional[UnicodePDFGenerator] = None):
+        self.pdf_generator = pdf_generator or UnicodePDFGenerator()
+
+    @staticmethod
+    def export_filename(name: str, extension: str, timestamp: Optional[datetime] = None) -> str:
+        """Return the file name used for a document export"""
+        return f"{name}_{(timestamp or datetime.now()).strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+    def to_bytes(self, content: str, extension: str) -> bytes:
+        """Render one document in the given format"""
+        if extension == 'txt':
+            return content.encode('utf-8')
+        if extension == 'pdf':
+            return self.pdf_generator.render(content)
+        raise Exception(f"Unsupported export format: {extension}")
+
+    def to_zip(self, documents: Dict[str, str], timestamp: Optional[datetime] = None) -> bytes:
+        """Bundle every document in every export format into one zip archive"""
+        try:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                for name, content in documents.items():
+                    for extension in EXPORT_FORMATS:
+                        archive.writestr(self.export_filename(name, extension, timestamp),
+                                         self.to_bytes(content, extension))
+            return buffer.getvalue()
+        except Exception as e:
+            raise Exception(f"Error building export bundle: {str(e)}")
@@ -0,0 +1,83 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .instrumentation import metrics
+
+# Default memory budget for extracted upload text
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hex digest used to key cached uploads"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExtractionCache:
+    """Thread-safe LRU cache of extracted text, bounded by total size in bytes"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text for key, or None on a miss"""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                metrics.count('extraction_cache.misses')
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            metrics.count('extraction_cache.hits')
+            return text
+
+    def put(self, key: str, text: str):
+        """Store text under key, evicting least recently used entries to stay in budget"""
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._sizes[key]
+                del self._entries[key]
+            self._entries[key] = text
+            self._sizes[key] = size
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self.current_bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current usage"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -1,54 +1,182 @@
-import PyPDF2
-from docx import Document
-import pandas as pd
-from typing import List, Dict
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+import io
+import os
 import re
+from .cv_parser import ParsedCV, parse_cv
+from .docx_stream import extract_docx_text
+from .instrumentation import metrics
+from .extraction_cache import ExtractionCache, content_hash
+
+# Extracted text shared by every session of this process
+extraction_cache = ExtractionCache()
+
+# MIME types of the supported formats, as reported by Streamlit uploads
+FILE_TYPES_BY_EXTENSION = {
+    '.pdf': "application/pdf",
+    '.docx': "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    '.txt': "text/plain",
+}
+
+# Opt-in parallel PDF extraction, and the page count below which it falls back to serial
+PARALLEL_PDF_EXTRACTION = os.environ.get('JOB_ASSISTANT_PARALLEL_PDF', '') == '1'
+PARALLEL_PAGE_THRESHOLD = 16
+
+# DOCX extraction backend: 'stream' reads word/document.xml incrementally, 'python-docx' builds the object model
+DOCX_BACKENDS = ('stream', 'python-docx')
+DOCX_BACKEND = os.environ.get('JOB_ASSISTANT_DOCX_BACKEND', 'stream')
+
+
+def _pdf_reader(file):
+    """Open a PDF; PyPDF2 is imported on first use to keep startup fast"""
+    import PyPDF2
+    return PyPDF2.PdfReader(file)
+
+
+def _extract_pdf_page_range(data: bytes, start: int, stop: int) -> List[str]:
+    """Extract pages [start, stop) of a PDF; runs in a worker process"""
+    pdf_reader = _pdf_reader(io.BytesIO(data))
+    pages = []
+    for page_num in range(start, stop):
+        page_text = FileProcessor._format_pdf_page(page_num, pdf_reader.pages[page_num])
+        if page_text:
+            pages.append(page_text)
+    return pages
+
+
+@lru_cache(maxsize=None)
+def _pdf_pool(workers: int):
+    """Process pool shared by every parallel extraction with this many workers, started on first use"""
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers)
+
 
 class FileProcessor:
     @staticmethod
-    def extract_text_from_pdf(file) -> str:
-        """Extract complete text from PDF file with better parsing"""
+    def _format_pdf_page(page_num: int, page) -> Optional[str]:
+        """Return the cleaned text of one PDF page with its page marker, or None if it has no text"""
+        page_text = page.extract_text()
+        if not page_text:
+            return None
+        # Clean up the text
+        metrics.count('regex.evaluations')
+        page_text = re.sub(r'\s+', ' ', page_text)  # Replace multiple spaces
+        page_text = page_text.strip()
+        return f"--- Page {page_num + 1} ---\n{page_text}\n\n"
+    
+    @staticmethod
+    def iter_pdf_pages(file, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Yield the cleaned text of each PDF page with its page marker, one page at a time"""
+        return FileProcessor._iter_reader_pages(_pdf_reader(file), max_pages)
+    
+    @staticmethod
+    def _iter_reader_pages(pdf_reader, max_pages: Optional[int]) -> Iterator[str]:
+        for page_num, page in enumerate(pdf_reader.pages):
+            if max_pages is not None and page_num >= max_pages:
+                break
+            page_text = FileProcessor._format_pdf_page(page_num, page)
+            if page_text:
+                yield page_text
+    
+    @staticmethod
+    def extract_text_from_pdf(file, max_chars: Optional[int] = None, max_pages: Optional[int] = None,
+                              parallel: Optional[bool] = None, workers: Optional[int] = None) -> str:
+        """Extract text from PDF file, stopping early once max_chars or max_pages is reached.
+        
+        With parallel=True, documents of at least PARALLEL_PAGE_THRESHOLD pages are split into page
+        ranges extracted on a process pool; previews limited by max_chars always run serially.
+        """
+        if parallel is None:
+            parallel = PARALLEL_PDF_EXTRACTION
         try:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    # Clean up the text
-                    page_text = re.sub(r'\s+', ' ', page_text)  # Replace multiple spaces
-                    page_text = page_text.strip()
-                    text += f"--- Page {page_num + 1} ---\n{page_text}\n\n"
-            return text.strip()
+            pdf_reader = _pdf_reader(file)
+            if parallel and max_chars is None:
+                text = FileProcessor._extract_pdf_in_parallel(file, pdf_reader, max_pages, workers)
+                if text is not None:
+                    return text
+            
+            pages = []
+            length = 0
+            for page_text in FileProcessor._iter_reader_pages(pdf_reader, max_pages):
+                pages.append(page_text)
+                length += len(page_text)
+                if max_chars is not None and length >= max_chars:
+                    break
+            text = ''.join(pages).strip()
+            return text[:max_chars] if max_chars is not None else text
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
     @staticmethod
-    def extract_text_from_docx(file) -> str:
-        """Extract complete text from DOCX file including tables"""
+    def _extract_pdf_in_parallel(file, pdf_reader, max_pages: Optional[int], workers: Optional[int]) -> Optional[str]:
+        """Extract page ranges on a process pool; returns None when the document is too short to benefit"""
+        page_count = len(pdf_reader.pages)
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+        workers = min(workers or os.cpu_count() or 1, page_count)
+        if page_count < PARALLEL_PAGE_THRESHOLD or workers < 2:
+            return None
+        
+        from concurrent.futures.process import BrokenProcessPool
+        
+        file.seek(0)
+        data = file.read()
+        # One range per worker: the document is sent to and parsed by each worker only once
+        range_size = -(-page_count // workers)
+        starts = list(range(0, page_count, range_size))
+        stops = [min(start + range_size, page_count) for start in starts]
         try:
-            doc = Document(file)
-            text = ""
-            
-            # Extract paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-            
-            # Extract tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        text += " | ".join(row_text) + "\n"
-                text += "\n"
-            
-            return text.strip()
+            ranges = _pdf_pool(workers).map(_extract_pdf_page_range, [data] * len(starts), starts, stops)
+            return ''.join(page_text for page_range in ranges for page_text in page_range).strip()
+        except BrokenProcessPool:
+            # A worker died; start a new pool next time and extract this document serially
+            _pdf_pool.cache_clear()
+            return None
+    
+    @staticmethod
+    def extract_text_from_docx(file, backend: Optional[str] = None, max_chars: Optional[int] = None) -> str:
+        """Extract complete text from DOCX file including tables.
+        
+        The default 'stream' backend keeps paragraphs and table rows in document order;
+        'python-docx' lists all paragraphs before all tables.
+        """
+        backend = backend or DOCX_BACKEND
+        if backend not in DOCX_BACKENDS:
+            raise Exception(f"Unknown DOCX backend: {backend}")
+        try:
+            if backend == 'stream':
+                return extract_docx_text(file, max_chars=max_chars)
+            text = FileProcessor._extract_text_from_docx_model(file)
+            return text[:max_chars] if max_chars is not None else text
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
     
+    @staticmethod
+    def _extract_text_from_docx_model(file) -> str:
+        """Extract DOCX text through the python-docx object model"""
+        from docx import Document
+        
+        doc = Document(file)
+        parts = []
+        
+        # Extract paragraphs
+        for paragraph in doc.paragraphs:
+            if paragraph.text.strip():
+                parts.append(paragraph.text + "\n")
+        
+        # Extract tables
+        for table in doc.tables:
+            for row in table.rows:
+                row_text = []
+                for cell in row.cells:
+                    if cell.text.strip():
+                        row_text.append(cell.text.strip())
+                if row_text:
+                    parts.append(" | ".join(row_text) + "\n")
+            parts.append("\n")
+        
+        return ''.join(parts).strip()
+    
     @staticmethod
     def extract_text_from_txt(file) -> str:
         """Extract text from TXT file"""
@@ -59,78 +187,88 @@ class FileProcessor:
             raise Exception(f"Error reading text file: {str(e)}")
     
     @staticmethod
-    def process_uploaded_file(file) -> str:
-        """Process uploaded file based on its type"""
+    def process_uploaded_file(file, use_cache: bool = True, max_chars: Optional[int] = None,
+                              max_pages: Optional[int] = None) -> str:
+        """Process uploaded file based on its type, reusing text already extracted from the same content.
+        
+        max_chars and max_pages limit extraction for previews; PDFs stop reading pages once enough text exists.
+        """
         file_type = file.type if hasattr(file, 'type') else None
+        limited = max_chars is not None or max_pages is not None
+        if not use_cache:
+            return FileProcessor._extract_text(file, file_type, max_chars, max_pages)
+        
+        # Key the cache by a hash of the upload's bytes
+        data = FileProcessor._read_bytes(file)
+        key = f"{file_type}:{content_hash(data)}"
+        
+        if not limited:
+            text = extraction_cache.get(key)
+            if text is None:
+                text = FileProcessor._extract_text(file, file_type)
+                extraction_cache.put(key, text)
+            return text
+        
+        preview_key = f"{key}:{max_chars}:{max_pages}"
+        text = extraction_cache.get(preview_key)
+        if text is not None:
+            return text
+        
+        # A character-limited preview can be cut from full text that was already extracted
+        full_text = extraction_cache.get(key) if max_pages is None else None
+        if full_text is not None:
+            return full_text[:max_chars]
+        
+        text = FileProcessor._extract_text(file, file_type, max_chars, max_pages)
+        extraction_cache.put(preview_key, text)
+        return text
+    
+    @staticmethod
+    def process_file_path(path: str, parallel: Optional[bool] = None) -> str:
+        """Process a file on disk based on its extension"""
+        extension = os.path.splitext(path)[1].lower()
+        file_type = FILE_TYPES_BY_EXTENSION.get(extension)
+        if file_type is None:
+            raise Exception(f"Unsupported file extension: {extension}")
+        with open(path, 'rb') as file:
+            return FileProcessor._extract_text(file, file_type, parallel=parallel)
+    
+    @staticmethod
+    def _read_bytes(file) -> bytes:
+        """Return the full content of an uploaded file and rewind it"""
+        if hasattr(file, 'getvalue'):
+            return file.getvalue()
+        file.seek(0)
+        data = file.read()
+        file.seek(0)
+        return data
+    
+    @staticmethod
+    def _extract_text(file, file_type: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None,
+                      parallel: Optional[bool] = None) -> str:
+        """Extract text from an uploaded file based on its type"""
+        if hasattr(file, 'seek'):
+            file.seek(0)
         
         if file_type == "application/pdf":
-            return FileProcessor.extract_text_from_pdf(file)
+            with metrics.stage('extraction.pdf'):
+                return FileProcessor.extract_text_from_pdf(file, max_chars=max_chars, max_pages=max_pages, parallel=parallel)
         elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            return FileProcessor.extract_text_from_docx(file)
+            with metrics.stage('extraction.docx'):
+                return FileProcessor.extract_text_from_docx(file, max_chars=max_chars)
         elif file_type == "text/plain":
-            return FileProcessor.extract_text_from_txt(file)
+            with metrics.stage('extraction.txt'):
+                text = FileProcessor.extract_text_from_txt(file)
         else:
             raise Exception(f"Unsupported file type: {file_type}")
+        return text[:max_chars] if max_chars is not None else text
+    
+    @staticmethod
+    def parse_cv(cv_text: str) -> ParsedCV:
+        """Parse CV into a memoized, span-based representation"""
+        return parse_cv(cv_text)
     
     @staticmethod
     def parse_cv_sections(cv_text: str) -> Dict[str, str]:
         """Parse CV into structured sections"""
-        sections = {
-            'personal_info': '',
-            'summary': '',
-            'experience': '',
-            'education': '',
-            'skills': '',
-            'projects': '',
-            'certifications': ''
-        }
-        
-        lines = cv_text.split('\n')
-        current_section = 'personal_info'
-        section_content = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Detect section headers
-            lower_line = line.lower()
-            if any(keyword in lower_line for keyword in ['experience', 'work history', 'employment']):
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                current_section = 'experience'
-                section_content = []
-            elif any(keyword in lower_line for keyword in ['education', 'academic']):
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                current_section = 'education'
-                section_content = []
-            elif any(keyword in lower_line for keyword in ['skills', 'technical', 'technologies']):
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                current_section = 'skills'
-                section_content = []
-            elif any(keyword in lower_line for keyword in ['projects', 'portfolio']):
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                current_section = 'projects'
-                section_content = []
-            elif any(keyword in lower_line for keyword in ['certifications', 'certificate']):
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                current_section = 'certifications'
-                section_content = []
-            elif any(keyword in lower_line for keyword in ['summary', 'objective', 'about']):
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                current_section = 'summary'
-                section_content = []
-            else:
-                section_content.append(line)
-        
-        # Add the last section
-        if section_content:
-            sections[current_section] = '\n'.join(section_content)
-            
-        return sections
\ No newline at end of file
+        return parse_cv(cv_text).as_dict()
@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, NamedTuple, Optional
+
+from .ai_helpers import AIJobAssistant
+from .analysis_context import AnalysisContext
+from .instrumentation import metrics
+
+# Generated documents, in the order they are shown
+DOCUMENTS = ('cv_improvements', 'linkedin_suggestions', 'motivation_letter', 'interview_preparation')
+
+DOCUMENT_TITLES = {
+    'cv_improvements': "CV Improvements",
+    'linkedin_suggestions': "LinkedIn Suggestions",
+    'motivation_letter': "Motivation Letter",
+    'interview_preparation': "Interview Prep"
+}
+
+
+class DocumentResult(NamedTuple):
+    name: str
+    content: str
+    seconds: float
+    error: Optional[str] = None
+
+
+def document_tasks(assistant: AIJobAssistant, context: AnalysisContext, linkedin_url: str = "") -> Dict[str, Callable[[], str]]:
+    """Return one generator callable per document, all sharing the same analysis context"""
+    cv_text = context.cv_text
+    jd_text = context.job_description
+    linkedin_about = context.linkedin_about
+
+    # Generate LinkedIn suggestions from the About section when it is provided
+    if linkedin_about:
+        linkedin = lambda: assistant.generate_linkedin_suggestions(linkedin_about, jd_text, cv_text, context=context)
+    else:
+        linkedin = lambda: assistant.generate_linkedin_improvements(cv_text, jd_text, linkedin_url, context=context)
+
+    return {
+        'cv_improvements': lambda: assistant.generate_cv_improvements(cv_text, jd_text, linkedin_url, context=context),
+        'linkedin_suggestions': linkedin,
+        'motivation_letter': lambda: assistant.generate_motivation_letter(cv_text, jd_text, linkedin_url, context=context),
+        'interview_preparation': lambda: assistant.generate_interview_preparation(jd_text, cv_text, context=context)
+    }
+
+
+class GenerationPipeline:
+    """Run document generators concurrently and yield each one as soon as it finishes.
+
+    Every document gets its own worker thread, so a slow generator (for example
+    a local LLM backend swapped into the task dict) only delays its own result.
+    The shared AnalysisContext is thread-safe, so each analysis still runs once.
+    A failing generator is reported in its result instead of failing the rest.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_initializer: Optional[Callable[[], None]] = None):
+        self.max_workers = max_workers
+        self.thread_initializer = thread_initializer
+
+    @staticmethod
+    def _timed(name: str, task: Callable[[], str]) -> DocumentResult:
+        start = time.perf_counter()
+        try:
+            content = task()
+        except Exception as e:
+            metrics.count(f"generate.{name}.errors")
+            return DocumentResult(name, "", time.perf_counter() - start, str(e))
+        seconds = time.perf_counter() - start
+        metrics.record(f"generate.{name}", seconds)
+        return DocumentResult(name, content, seconds)
+
+    def run(self, tasks: Dict[str, Callable[[], str]]) -> Iterator[DocumentResult]:
+        """Yield a DocumentResult per task in completion order"""
+        if not tasks:
+            return
+        workers = self.max_workers or len(tasks)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="generation",
+                                initializer=self.thread_initializer) as executor:
+            futures = [executor.submit(self._timed, name, task) for name, task in tasks.items()]
+            for future in as_completed(futures):
+                yield future.result()
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict
+
+# Instrumentation is off unless this is set, or it is switched on at runtime
+INSTRUMENTATION_ENABLED = os.environ.get('JOB_ASSISTANT_INSTRUMENTATION', '') == '1'
+
+METRIC_PREFIX = 'job_assistant'
+
+
+class _NullStage:
+    """Stage timer used while instrumentation is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics: 'Instrumentation', name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Instrumentation:
+    """Process-wide stage timers and event counters.
+
+    While disabled, stage() returns a shared no-op context manager and
+    count() returns immediately, so instrumented code pays one attribute
+    check per call.
+    """
+
+    def __init__(self, enabled: bool = INSTRUMENTATION_ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # Stage -> calls, total, max and last seconds
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._counters: Dict[str, int] = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def stage(self, name: str):
+        """Context manager that records the wall time of a stage"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def timed(self, name: str) -> Callable:
+        """Decorator recording every call of a function as a stage"""
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Stage(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, seconds: float):
+        """Add one timed call of a stage"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'last_seconds': 0.0}
+            stage['calls'] += 1
+            stage['total_seconds'] += seconds
+            stage['last_seconds'] = seconds
+            if seconds > stage['max_seconds']:
+                stage['max_seconds'] = seconds
+
+    def count(self, name: str, amount: int = 1):
+        """Increase an event counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def reset(self):
+        """Drop every recorded stage and counter"""
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict:
+        """Return a copy of the recorded stages and counters"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'stages': {name: dict(stage) for name, stage in sorted(self._stages.items())},
+                'counters': dict(sorted(self._counters.items()))
+            }
+
+    def to_json(self) -> str:
+        """Export the snapshot as JSON"""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = METRIC_PREFIX) -> str:
+        """Export the snapshot in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+        stage_metrics = [
+            ('stage_calls_total', 'counter', 'calls', "Timed calls per stage"),
+            ('stage_seconds_total', 'counter', 'total_seconds', "Total wall time per stage"),
+            ('stage_seconds_max', 'gauge', 'max_seconds', "Slowest call per stage"),
+            ('stage_seconds_last', 'gauge', 'last_seconds', "Most recent call per stage"),
+        ]
+        for metric, metric_type, field, description in stage_metrics:
+            lines.append(f"# HELP {prefix}_{metric} {description}")
+            lines.append(f"# TYPE {prefix}_{metric} {metric_type}")
+            for name, stage in snapshot['stages'].items():
+                lines.append(f'{prefix}_{metric}{{stage="{_escape_label(name)}"}} {stage[field]}')
+        lines.append(f"# HELP {prefix}_events_total Event counters")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in snapshot['counters'].items():
+            lines.append(f'{prefix}_events_total{{event="{_escape_label(name)}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Metrics shared by every session of this process
+metrics = Instrumentation()
@@ -0,0 +1,182 @@
+import heapq
+import json
+import os
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional
+
+from .ai_helpers import AIJobAssistant
+from .file_processor import FileProcessor
+from .skill_index import SkillIndex
+
+# File the Job Search tab saves the index to, moved with JOB_ASSISTANT_JOB_INDEX_PATH
+JOB_INDEX_PATH = os.environ.get('JOB_ASSISTANT_JOB_INDEX_PATH', os.path.join('job_index', 'index.json'))
+
+# Rebuild postings once this share of indexed jobs has been removed
+COMPACTION_RATIO = 0.25
+
+
+class JobIndex:
+    """Inverted index from taxonomy skill to stored job descriptions.
+
+    Each posting is analyzed once when it is added. A query matches the CV
+    against the taxonomy, walks the postings of the skills it covers and
+    ranks jobs by the same match percentage analyze_cv_vs_jd would report,
+    without running the full comparison against every stored posting.
+    """
+
+    def __init__(self, assistant: Optional[AIJobAssistant] = None):
+        self.assistant = assistant or AIJobAssistant()
+        # Skill -> sorted internal ids of the jobs requiring it
+        self._postings: Dict[str, array] = {}
+        # Internal id -> job metadata and required skills
+        self._jobs: Dict[int, Dict] = {}
+        self._ids_by_job: Dict[str, int] = {}
+        self._next_id = 0
+        self._removed = 0
+        self._lock = threading.RLock()
+
+        # A skill listed in several taxonomy categories is counted once per category
+        self._skill_weights = Counter(term for _, term in self.assistant.skill_matcher.entries)
+
+    def __len__(self) -> int:
+        return len(self._ids_by_job)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._ids_by_job
+
+    def add(self, job_id: str, job_description: str, title: Optional[str] = None,
+            company: Optional[str] = None) -> Dict:
+        """Analyze a job description and index it, replacing any posting with the same id"""
+        requirements = self.assistant.analyze_job_requirements(job_description)
+        job = {
+            'job_id': job_id,
+            'title': title or self.assistant._extract_position_name(job_description),
+            'company': company or self.assistant._extract_company_name(job_description),
+            'skills': list(dict.fromkeys(requirements['all_detected_skills'])),
+            'total_skills': len(requirements['all_detected_skills'])
+        }
+
+        with self._lock:
+            if job_id in self._ids_by_job:
+                self.remove(job_id)
+            internal_id = self._next_id
+            self._next_id += 1
+            self._jobs[internal_id] = job
+            self._ids_by_job[job_id] = internal_id
+            for skill in job['skills']:
+                # Ids only grow, so appending keeps every postings list sorted
+                self._postings.setdefault(skill, array('I')).append(internal_id)
+        return job
+
+    def add_folder(self, folder: str) -> int:
+        """Index every supported document in a folder, keyed by file name"""
+        added = 0
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            try:
+                text = FileProcessor.process_file_path(path)
+            except Exception:
+                continue
+            self.add(name, text)
+            added += 1
+        return added
+
+    def remove(self, job_id: str) -> bool:
+        """Remove a posting; its postings entries are dropped at the next compaction"""
+        with self._lock:
+            internal_id = self._ids_by_job.pop(job_id, None)
+            if internal_id is None:
+                return False
+            del self._jobs[internal_id]
+            self._removed += 1
+            if self._removed > COMPACTION_RATIO * max(len(self._jobs), 1):
+                self.compact()
+            return True
+
+    def compact(self):
+        """Drop removed jobs from every postings list"""
+        with self._lock:
+            live = self._jobs
+            postings = {}
+            for skill, ids in self._postings.items():
+                kept = array('I', (internal_id for internal_id in ids if internal_id in live))
+                if kept:
+                    postings[skill] = kept
+            self._postings = postings
+            self._removed = 0
+
+    def cv_skills_covered(self, cv_text: str) -> List[str]:
+        """Taxonomy skills the CV matches exactly or partially, as analyze_cv_vs_jd counts them"""
+        cv_index = SkillIndex(self.assistant._extract_all_skills_from_cv(cv_text))
+        # add() and compact() change the postings under the lock; match against a snapshot of its skills
+        with self._lock:
+            skills = list(self._postings)
+        return [skill for skill in skills if cv_index.first_match(skill) is not None]
+
+    def query(self, cv_text: str, top_k: int = 10) -> List[Dict]:
+        """Return the top_k jobs ranked by skill match percentage for a CV"""
+        covered = self.cv_skills_covered(cv_text)
+        weights = self._skill_weights
+
+        with self._lock:
+            scores: Dict[int, int] = {}
+            for skill in covered:
+                weight = weights.get(skill, 1)
+                for internal_id in self._postings.get(skill, ()):
+                    scores[internal_id] = scores.get(internal_id, 0) + weight
+
+            jobs = self._jobs
+            ranked = heapq.nlargest(
+                top_k,
+                ((score / jobs[internal_id]['total_skills'], internal_id)
+                 for internal_id, score in scores.items() if internal_id in jobs),
+            )
+            covered_set = set(covered)
+            results = []
+            for ratio, internal_id in ranked:
+                job = jobs[internal_id]
+                results.append({
+                    'job_id': job['job_id'],
+                    'title': job['title'],
+                    'company': job['company'],
+                    'match_percentage': int(ratio * 100),
+                    'skills_matched': [skill for skill in job['skills'] if skill in covered_set],
+                    'skills_missing': [skill for skill in job['skills'] if skill not in covered_set]
+                })
+        return results
+
+    def jobs(self) -> List[Dict]:
+        """Return the metadata of every indexed job"""
+        with self._lock:
+            return [dict(job) for job in self._jobs.values()]
+
+    def save(self, path: str = JOB_INDEX_PATH):
+        """Write the index to disk atomically"""
+        with self._lock:
+            self.compact()
+            data = {
+                'next_id': self._next_id,
+                'jobs': {str(internal_id): job for internal_id, job in self._jobs.items()},
+                'postings': {skill: ids.tolist() for skill, ids in self._postings.items()}
+            }
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str = JOB_INDEX_PATH, assistant: Optional[AIJobAssistant] = None) -> 'JobIndex':
+        """Load a saved index, or return an empty one if the file does not exist"""
+        index = cls(assistant)
+        if not os.path.exists(path):
+            return index
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        index._next_id = data['next_id']
+        index._jobs = {int(internal_id): job for internal_id, job in data['jobs'].items()}
+        index._ids_by_job = {job['job_id']: internal_id for internal_id, job in index._jobs.items()}
+        index._postings = {skill: array('I', ids) for skill, ids in data['postings'].items()}
+        return index
@@ -0,0 +1,235 @@
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Set
+
+from .extraction_cache import content_hash
+from .instrumentation import metrics
+
+# Directory of saved documents
+OUTPUT_DIR = 'generated_files'
+
+# Eviction limits of the default store, overridable from the environment
+DEFAULT_MAX_BYTES = int(os.environ.get('JOB_ASSISTANT_OUTPUT_MAX_MB', '256')) * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = int(os.environ.get('JOB_ASSISTANT_OUTPUT_MAX_AGE_HOURS', '168')) * 3600
+DEFAULT_SESSION_QUOTA_BYTES = int(os.environ.get('JOB_ASSISTANT_OUTPUT_SESSION_QUOTA_MB', '32')) * 1024 * 1024
+
+_TEMP_PREFIX = '.tmp-'
+# Temp files younger than this may be another process's write in progress
+TEMP_FILE_GRACE_SECONDS = 3600
+
+
+class OutputStore:
+    """Content-addressed store for saved documents.
+
+    Files are named by the sha256 of their content plus the extension, so
+    identical outputs are written once and concurrent saves never overwrite
+    each other. Writes go to a temp file that is renamed into place. Files
+    expire after max_age_seconds, the least recently saved go first once the
+    store exceeds max_bytes, and each session's oldest files are dropped when
+    it goes over its quota. The age and size limits apply to the whole
+    directory, including files saved by other processes sharing it. A file shared by several sessions is only deleted
+    when no session owns it any more.
+    """
+
+    def __init__(self, root: str = OUTPUT_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+                 session_quota_bytes: int = DEFAULT_SESSION_QUOTA_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.session_quota_bytes = session_quota_bytes
+        self._lock = threading.Lock()
+        # File id -> (size, last save time), oldest first
+        self._files: "OrderedDict[str, tuple]" = OrderedDict()
+        # Session id -> file id -> size, oldest first; file id -> owning sessions
+        self._session_files: Dict[str, "OrderedDict[str, int]"] = {}
+        self._owners: Dict[str, Set[str]] = {}
+        self.current_bytes = 0
+        self.writes = 0
+        self.dedup_hits = 0
+        self.evictions = 0
+        self._scan()
+
+    def _scan(self):
+        """Rebuild the index from the files on disk, whichever process saved them.
+
+        Temp files left by interrupted writes are removed, and sessions stop
+        owning files another process deleted.
+        """
+        found = []
+        if os.path.isdir(self.root):
+            stale = time.time() - TEMP_FILE_GRACE_SECONDS
+            for entry in os.scandir(self.root):
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if entry.name.startswith(_TEMP_PREFIX):
+                        if stat.st_mtime < stale:
+                            os.remove(entry.path)
+                        continue
+                except FileNotFoundError:
+                    # Renamed or evicted by another process while scanning
+                    continue
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+
+        self._files = OrderedDict((file_id, (size, mtime)) for mtime, file_id, size in sorted(found))
+        self.current_bytes = sum(size for _, _, size in found)
+        for file_id in [file_id for file_id in self._owners if file_id not in self._files]:
+            for session_id in self._owners.pop(file_id):
+                self._session_files.get(session_id, {}).pop(file_id, None)
+
+    def path(self, file_id: str) -> str:
+        """Return the path of a stored file"""
+        return os.path.join(self.root, os.path.basename(file_id))
+
+    def __contains__(self, file_id: str) -> bool:
+        return file_id in self._files
+
+    def put(self, data: bytes, extension: str, session_id: Optional[str] = None) -> str:
+        """Store data and return its file id; identical content is only written once"""
+        size = len(data)
+        if session_id is not None and size > self.session_quota_bytes:
+            raise Exception(f"Error saving file: {size} bytes exceeds the per-session quota")
+        file_id = f"{content_hash(data)}.{extension.lstrip('.')}"
+        now = time.time()
+
+        with self._lock:
+            if file_id in self._files:
+                self.dedup_hits += 1
+                metrics.count('output_store.dedup_hits')
+                self._files.move_to_end(file_id)
+                self._files[file_id] = (size, now)
+                try:
+                    os.utime(self.path(file_id), (now, now))
+                except FileNotFoundError:
+                    # Evicted by another process sharing the directory
+                    self._write(file_id, data)
+            else:
+                self._write(file_id, data)
+                self._files[file_id] = (size, now)
+                self.current_bytes += size
+                self.writes += 1
+
+            if session_id is not None:
+                self._claim(session_id, file_id, size)
+            self._evict(now, keep=file_id)
+        return file_id
+
+    def _write(self, file_id: str, data: bytes):
+        """Write atomically: a temp file in the same directory, then a rename"""
+        os.makedirs(self.root, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=self.root)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.path(file_id))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _claim(self, session_id: str, file_id: str, size: int):
+        """Record session ownership, dropping the session's oldest files to stay within its quota"""
+        files = self._session_files.setdefault(session_id, OrderedDict())
+        if file_id in files:
+            files.move_to_end(file_id)
+            return
+        files[file_id] = size
+        self._owners.setdefault(file_id, set()).add(session_id)
+        while sum(files.values()) > self.session_quota_bytes:
+            oldest = next(iter(files))
+            self._release(session_id, oldest)
+
+    def _release(self, session_id: str, file_id: str, evicted: bool = True):
+        """Drop one session's ownership of a file and delete it if nobody else owns it"""
+        self._session_files.get(session_id, {}).pop(file_id, None)
+        owners = self._owners.get(file_id)
+        if owners is not None:
+            owners.discard(session_id)
+            if not owners:
+                del self._owners[file_id]
+                self._remove(file_id, evicted)
+
+    def _remove(self, file_id: str, evicted: bool = True):
+        entry = self._files.pop(file_id, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry[0]
+        if evicted:
+            self.evictions += 1
+        for files in self._session_files.values():
+            files.pop(file_id, None)
+        self._owners.pop(file_id, None)
+        try:
+            os.remove(self.path(file_id))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, now: float, keep: Optional[str] = None):
+        """Remove expired files, then the least recently saved ones until the store fits max_bytes.
+
+        Sizes and save times are read from the directory first, so files saved
+        by other processes sharing it count towards the limits too.
+        """
+        self._scan()
+        cutoff = now - self.max_age_seconds
+        for file_id, (_, saved_at) in list(self._files.items()):
+            if saved_at >= cutoff:
+                break
+            self._remove(file_id)
+        while self.current_bytes > self.max_bytes and len(self._files) > 1:
+            oldest = next(iter(self._files))
+            if oldest == keep:
+                break
+            self._remove(oldest)
+
+    def evict(self):
+        """Apply the age and size limits now"""
+        with self._lock:
+            self._evict(time.time())
+
+    def get(self, file_id: str) -> bytes:
+        """Return the content of a stored file"""
+        with open(self.path(file_id), 'rb') as f:
+            return f.read()
+
+    def clear_session(self, session_id: str) -> int:
+        """Delete the files only this session owns and forget its ownership of shared ones"""
+        with self._lock:
+            file_ids = list(self._session_files.get(session_id, {}))
+            for file_id in file_ids:
+                self._release(session_id, file_id, evicted=False)
+            self._session_files.pop(session_id, None)
+            return len(file_ids)
+
+    def session_bytes(self, session_id: str) -> int:
+        with self._lock:
+            self._scan()
+            return sum(self._session_files.get(session_id, {}).values())
+
+    def stats(self) -> Dict[str, int]:
+        """Return usage, limits and write/dedup/eviction counters"""
+        with self._lock:
+            self._scan()
+            return {
+                'files': len(self._files),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'max_age_seconds': self.max_age_seconds,
+                'session_quota_bytes': self.session_quota_bytes,
+                'sessions': len(self._session_files),
+                'writes': self.writes,
+                'dedup_hits': self.dedup_hits,
+                'evictions': self.evictions
+            }
+
+
+@lru_cache(maxsize=1)
+def get_output_store() -> OutputStore:
+    """The store shared by every session of this process, created on first save"""
+    return OutputStore()
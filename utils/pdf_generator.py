@@ -1,100 +1,159 @@
-from fpdf import FPDF
-import os
+import threading
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from .instrumentation import metrics
+from .output_store import get_output_store
+
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
+# Unicode characters with ASCII stand-ins; anything else outside latin-1 becomes '?'
+PDF_REPLACEMENTS = str.maketrans({
+    '•': '-',
+    '✓': '[X]',
+    '→': '->',
+    '—': '-',
+    '–': '-',
+    '“': '"',
+    '”': '"',
+    '‘': "'",
+    '’': "'",
+    '…': '...',
+})
+
+SEPARATOR_PREFIXES = ('---', '===', '***')
+HEADING_PREFIXES = ('SECTION', 'COMPREHENSIVE')
+BULLET_PREFIXES = ('•', '-')
+
+# Text width of an A4 page with the default 10 mm margins, and the bullet indent
+LINE_WIDTH = 190
+BULLET_INDENT = 10
+
+# Distinct words whose widths are kept per font; a full cache starts over empty
+WORD_WIDTH_CACHE_SIZE = 4096
+
 
 class UnicodePDFGenerator:
-    def __init__(self):
-        self.pdf = FPDF()
+    """Single PDF engine for generated documents.
+
+    Word widths are measured once per font and reused, up to
+    WORD_WIDTH_CACHE_SIZE words per font, and each paragraph is broken into
+    lines in one pass by summing cached widths.
+    """
+
+    def __init__(self, font_family: str = "Helvetica", font_size: int = 10):
+        self.font_family = font_family
+        self.font_size = font_size
+        # (family and style, size) -> word -> width; the lock guards adding a font
+        self._word_widths: Dict[Tuple[str, float], Dict[str, float]] = {}
+        self._word_widths_lock = threading.Lock()
+
+    @metrics.timed('pdf.render')
+    def render(self, content: str) -> bytes:
+        """Render content to PDF bytes"""
+        # fpdf2 and its font tooling are imported on first render to keep startup fast
+        from fpdf import FPDF
         
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font(self.font_family, size=self.font_size)
+
+        # Clean content for PDF compatibility
+        clean_content = self.clean_content_for_pdf(content)
+
+        # Add content with proper formatting
+        for line in clean_content.split('\n'):
+            stripped = line.strip()
+            if not stripped:
+                pdf.ln(4)
+                continue
+
+            # Handle different line types
+            if stripped.startswith(SEPARATOR_PREFIXES):
+                # Separator line
+                pdf.set_draw_color(0, 0, 0)
+                pdf.line(10, pdf.get_y(), 200, pdf.get_y())
+                pdf.ln(6)
+            elif stripped.startswith(HEADING_PREFIXES):
+                # Header line
+                pdf.set_font(self.font_family, 'B', 12)
+                self.add_wrapped_text(pdf, stripped, LINE_WIDTH, height=8)
+                pdf.set_font(self.font_family, size=self.font_size)
+                pdf.ln(2)
+            elif stripped.startswith(BULLET_PREFIXES):
+                # Bullet point, wrapped under its own indent
+                self.add_wrapped_text(pdf, stripped[2:], LINE_WIDTH - BULLET_INDENT, indent=BULLET_INDENT)
+            else:
+                # Regular text with word wrap
+                self.add_wrapped_text(pdf, line, LINE_WIDTH)
+
+            pdf.ln(4)
+
+        return bytes(pdf.output())
+
     def generate_pdf(self, content: str, filename: str) -> str:
-        """Generate PDF with proper Unicode support"""
+        """Render content into the output store and return the stored file's path"""
         try:
-            os.makedirs('generated_files', exist_ok=True)
-            filepath = os.path.join('generated_files', filename)
-            
-            # Create PDF
-            pdf = FPDF()
-            pdf.add_page()
-            
-            # Use Helvetica which handles basic characters well
-            pdf.set_font("Helvetica", size=10)
-            
-            # Clean content for PDF compatibility
-            clean_content = self.clean_content_for_pdf(content)
-            
-            # Add content with proper formatting
-            lines = clean_content.split('\n')
-            for line in lines:
-                if not line.strip():
-                    pdf.ln(4)
-                    continue
-                
-                # Handle different line types
-                if any(line.strip().startswith(prefix) for prefix in ['---', '===', '***']):
-                    # Separator line
-                    pdf.set_draw_color(0, 0, 0)
-                    pdf.line(10, pdf.get_y(), 200, pdf.get_y())
-                    pdf.ln(6)
-                elif line.strip().startswith('SECTION') or line.strip().startswith('COMPREHENSIVE'):
-                    # Header line
-                    pdf.set_font("Helvetica", 'B', 12)
-                    pdf.cell(200, 8, txt=line.strip(), ln=True)
-                    pdf.set_font("Helvetica", size=10)
-                    pdf.ln(2)
-                elif line.strip().startswith('•') or line.strip().startswith('-'):
-                    # Bullet point
-                    pdf.cell(10, 5, txt="", ln=0)
-                    pdf.cell(190, 5, txt=line.strip()[2:], ln=True)
-                else:
-                    # Regular text with word wrap
-                    self.add_wrapped_text(pdf, line, 190)
-                
-                pdf.ln(4)
-            
-            pdf.output(filepath)
-            return filepath
-            
+            store = get_output_store()
+            return store.path(store.put(self.render(content), 'pdf'))
+
         except Exception as e:
             print(f"PDF generation error: {e}")
             raise
-    
-    def clean_content_for_pdf(self, content: str) -> str:
-        """Clean content for PDF compatibility"""
-        # Replace Unicode characters with ASCII equivalents
-        replacements = {
-            '•': '-',
-            '✓': '[X]',
-            '→': '->',
-            '—': '-',
-            '–': '-',
-            '“': '"',
-            '”': '"',
-            '‘': "'",
-            '’': "'",
-            '…': '...',
-        }
-        
-        clean_content = content
-        for unicode_char, ascii_char in replacements.items():
-            clean_content = clean_content.replace(unicode_char, ascii_char)
-        
-        return clean_content
-    
-    def add_wrapped_text(self, pdf, text: str, max_width: int):
-        """Add text with word wrapping"""
-        words = text.split(' ')
-        current_line = ""
-        
-        for word in words:
+
+    @staticmethod
+    def clean_content_for_pdf(content: str) -> str:
+        """Replace common Unicode punctuation and drop what the core fonts cannot encode"""
+        return content.translate(PDF_REPLACEMENTS).encode('latin-1', 'replace').decode('latin-1')
+
+    def _widths(self, pdf: 'FPDF') -> Dict[str, float]:
+        """Return the word width cache for the current font"""
+        key = (pdf.font_family + pdf.font_style, pdf.font_size_pt)
+        with self._word_widths_lock:
+            widths = self._word_widths.get(key)
+            if widths is None:
+                widths = self._word_widths[key] = {}
+            return widths
+
+    def wrap_text(self, pdf: 'FPDF', text: str, max_width: float) -> List[str]:
+        """Break text into lines narrower than max_width in one pass over its words"""
+        widths = self._widths(pdf)
+        space_width = widths.get(' ')
+        if space_width is None:
+            space_width = widths[' '] = pdf.get_string_width(' ')
+
+        lines = []
+        current_words: List[str] = []
+        current_width = 0.0
+        for word in text.split(' '):
+            # Repeated spaces at the start of a line are dropped
+            if not word and not current_words:
+                continue
+            word_width = widths.get(word)
+            if word_width is None:
+                if len(widths) >= WORD_WIDTH_CACHE_SIZE:
+                    widths.clear()
+                word_width = widths[word] = pdf.get_string_width(word)
+
             # Check if adding the word exceeds the width
-            test_line = current_line + ' ' + word if current_line else word
-            if pdf.get_string_width(test_line) < max_width:
-                current_line = test_line
+            test_width = current_width + space_width + word_width if current_words else word_width
+            if test_width < max_width:
+                current_words.append(word)
+                current_width = test_width
             else:
                 # Output the current line and start a new one
-                if current_line:
-                    pdf.cell(200, 5, txt=current_line, ln=True)
-                current_line = word
-        
+                if current_words:
+                    lines.append(' '.join(current_words))
+                current_words = [word] if word else []
+                current_width = word_width
+
         # Output the last line
-        if current_line:
-            pdf.cell(200, 5, txt=current_line, ln=True)
\ No newline at end of file
+        if current_words:
+            lines.append(' '.join(current_words))
+        return lines
+
+    def add_wrapped_text(self, pdf: 'FPDF', text: str, max_width: float, height: float = 5, indent: float = 0):
+        """Add text with word wrapping"""
+        for line in self.wrap_text(pdf, text, max_width):
+            if indent:
+                pdf.cell(indent, height, txt="")
+            pdf.cell(max_width, height, txt=line, new_x="LMARGIN", new_y="NEXT")
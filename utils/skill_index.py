@@ -0,0 +1,66 @@
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+# Joins lowered skills into one buffer; never appears inside a skill
+_SEPARATOR = '\x00'
+
+
+@lru_cache(maxsize=4096)
+def substrings(text: str) -> frozenset:
+    """Every substring of text, empty string included"""
+    return frozenset(text[start:end] for start in range(len(text) + 1) for end in range(start, len(text) + 1))
+
+
+class SkillIndex:
+    """Normalized index over a list of skills for exact and containment lookups.
+
+    ``first_match`` returns the same skill the old pairwise loop picked: the
+    earliest skill in list order that equals the query, contains it, or is
+    contained in it. Exact matches are a dict lookup, "skill contains query"
+    is one substring search over a joined buffer, and "query contains skill"
+    looks up the query's (cached) substrings in the index.
+    """
+
+    def __init__(self, skills: List[str]):
+        self.skills = list(skills)
+        self.lowered = [skill.lower() for skill in self.skills]
+
+        # First position of every distinct lowered skill (built back to front so the first one wins)
+        self._first_by_value = dict(zip(reversed(self.lowered), range(len(self.lowered) - 1, -1, -1)))
+
+        # Start offset of every skill inside the joined buffer
+        self._joined = _SEPARATOR.join(self.lowered)
+        self._offsets = list(accumulate((len(value) + 1 for value in self.lowered), initial=0))
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def first_exact(self, query: str) -> Optional[int]:
+        """Position of the first skill equal to query"""
+        return self._first_by_value.get(query.lower())
+
+    def first_containing(self, query: str) -> Optional[int]:
+        """Position of the first skill that contains query"""
+        if not self.skills:
+            return None
+        found = self._joined.find(query.lower())
+        if found < 0:
+            return None
+        return bisect_right(self._offsets, found) - 1
+
+    def first_contained_in(self, query: str) -> Optional[int]:
+        """Position of the first skill that is a substring of query"""
+        first_by_value = self._first_by_value
+        query_substrings = substrings(query.lower())
+        return min(map(first_by_value.__getitem__, filter(first_by_value.__contains__, query_substrings)), default=None)
+
+    def first_match(self, query: str) -> Optional[Tuple[int, bool]]:
+        """Return (position, is_exact) of the first skill matching query either way"""
+        candidates = [position for position in (self.first_containing(query), self.first_contained_in(query))
+                      if position is not None]
+        if not candidates:
+            return None
+        position = min(candidates)
+        return position, self.lowered[position] == query.lower()
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from .instrumentation import metrics
+
+# Skill taxonomy used for job description analysis
+SKILL_CATEGORIES = {
+    'programming': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin', 'php', 'ruby', 'scala'],
+    'web_frontend': ['html', 'css', 'react', 'angular', 'vue', 'svelte', 'bootstrap', 'tailwind', 'jquery', 'next.js', 'nuxt.js'],
+    'web_backend': ['node.js', 'django', 'flask', 'spring', 'express', 'laravel', 'ruby on rails', 'asp.net', 'fastapi', 'graphql'],
+    'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'dynamodb', 'cassandra', 'cosmos db', 'firebase'],
+    'cloud': ['aws', 'azure', 'google cloud', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'ci/cd', 'devops', 'serverless'],
+    'data_science': ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'r', 'matplotlib', 'tableau', 'power bi', 'spark'],
+    'mobile': ['android', 'ios', 'react native', 'flutter', 'swift', 'kotlin', 'xamarin'],
+    'tools': ['git', 'jira', 'confluence', 'slack', 'teams', 'docker', 'jenkins', 'ansible', 'puppet', 'chef', 'github', 'gitlab'],
+    'methodologies': ['agile', 'scrum', 'kanban', 'waterfall', 'devops', 'cicd', 'tdd', 'bdd']
+}
+
+SOFT_SKILLS = ['leadership', 'communication', 'teamwork', 'problem-solving', 'critical thinking',
+               'adaptability', 'time management', 'creativity', 'collaboration', 'analytical',
+               'project management', 'stakeholder management', 'mentoring', 'presentation']
+
+SOFT_SKILLS_CATEGORY = 'soft_skills'
+
+_WORD_RUN = re.compile(r'\w+')
+_WORD_CHAR = re.compile(r'\w')
+
+
+class SkillMatch(NamedTuple):
+    term: str
+    category: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    return bool(_WORD_CHAR.match(char))
+
+
+class SkillMatcher:
+    """Find every taxonomy term in a text with a single pass over its words.
+
+    Terms are indexed by their leading word, so each word of the text costs one
+    dictionary lookup no matter how large the taxonomy is. Matching follows the
+    same rules as ``re.search(r'\\b' + re.escape(term) + r'\\b', text.lower())``.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        # Ordered (category, term) entries, duplicates across categories included
+        self.entries: List[Tuple[str, str]] = []
+        # Leading word -> list of (term, entry ids)
+        self._by_first_word: Dict[str, List[Tuple[str, List[int]]]] = {}
+        term_entries: Dict[str, List[int]] = {}
+
+        for category, terms in taxonomy.items():
+            for term in terms:
+                term = term.lower()
+                term_entries.setdefault(term, []).append(len(self.entries))
+                self.entries.append((category, term))
+
+        for term, entry_ids in term_entries.items():
+            first_word = _WORD_RUN.match(term)
+            if not first_word:
+                raise ValueError(f"Skill term must start with a word character: {term!r}")
+            self._by_first_word.setdefault(first_word.group(0), []).append((term, entry_ids))
+
+        # Longest terms first so overlapping hits are reported in a stable order
+        for candidates in self._by_first_word.values():
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+
+        self._ends_with_word = {term: _is_word_char(term[-1]) for term in term_entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, term: str) -> bool:
+        return term.lower() in self._ends_with_word
+
+    def iter_matches(self, text: str):
+        """Yield (term, entry ids, start, end) for every hit in already-lowered text"""
+        metrics.count('skill_matcher.scans')
+        by_first_word = self._by_first_word
+        ends_with_word = self._ends_with_word
+        text_length = len(text)
+
+        for word in _WORD_RUN.finditer(text):
+            candidates = by_first_word.get(word.group(0))
+            if not candidates:
+                continue
+            start = word.start()
+            for term, entry_ids in candidates:
+                end = start + len(term)
+                if end > text_length or not text.startswith(term, start):
+                    continue
+                # Emulate the trailing \b of the regex based matcher
+                next_is_word = end < text_length and _is_word_char(text[end])
+                if next_is_word != ends_with_word[term]:
+                    yield term, entry_ids, start, end
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """Return every taxonomy hit with its category and offsets in text.lower()"""
+        matches = []
+        for term, entry_ids, start, end in self.iter_matches(text.lower()):
+            for entry_id in entry_ids:
+                matches.append(SkillMatch(term, self.entries[entry_id][0], start, end))
+        return matches
+
+    def find_terms(self, text: str) -> Set[str]:
+        """Return the set of taxonomy terms present in text"""
+        return set(_find_terms_cached(self, text))
+
+    def find_entries(self, text: str) -> List[Tuple[str, str]]:
+        """Return matched (category, term) entries in taxonomy order"""
+        return self.entries_from_hits(self.iter_matches(text.lower()))
+
+    def entries_from_hits(self, hits: Iterable[Tuple]) -> List[Tuple[str, str]]:
+        """Return the (category, term) entries of iter_matches hits in taxonomy order"""
+        found = set()
+        for _, entry_ids, _, _ in hits:
+            found.update(entry_ids)
+        return [self.entries[entry_id] for entry_id in sorted(found)]
+
+    def contains(self, term: str, text: str) -> bool:
+        """Check whether a term appears in text as a whole word"""
+        term = term.lower()
+        if term not in self:
+            # Not part of the taxonomy, fall back to a one-off regex
+            metrics.count('regex.evaluations')
+            return bool(re.search(r'\b' + re.escape(term) + r'\b', text.lower()))
+        return term in _find_terms_cached(self, text)
+
+
+@lru_cache(maxsize=64)
+def _find_terms_cached(matcher: SkillMatcher, text: str) -> frozenset:
+    return frozenset(term for term, _, _, _ in matcher.iter_matches(text.lower()))
+
+
+def build_taxonomy() -> Dict[str, List[str]]:
+    """Return the built-in taxonomy with soft skills as their own category"""
+    taxonomy = dict(SKILL_CATEGORIES)
+    taxonomy[SOFT_SKILLS_CATEGORY] = SOFT_SKILLS
+    return taxonomy
+
+
+# Changes whenever the built-in taxonomy does, so caches of taxonomy-dependent results can key on it
+TAXONOMY_VERSION = hashlib.sha256(json.dumps(build_taxonomy()).encode('utf-8')).hexdigest()[:12]
+
+
+@lru_cache(maxsize=1)
+def get_default_matcher() -> SkillMatcher:
+    """Build the matcher for the built-in taxonomy once per process"""
+    return SkillMatcher(build_taxonomy())
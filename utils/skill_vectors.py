@@ -0,0 +1,182 @@
+"""Taxonomy skills as bit vectors, for matching many CVs against many jobs at once.
+
+Every taxonomy term gets an integer id. A job is a bit row of the terms it
+requires; a CV is a bit row of the terms it covers (exactly or partially,
+as analyze_cv_vs_jd decides) plus a bit row of the exact matches. Rows
+are stored packed, one bit per term, and a whole CV x JD match matrix is
+one matrix product of the unpacked 0/1 rows: the dot product of two bit
+rows is the popcount of their AND.
+"""
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .skill_index import SkillIndex, substrings
+from .skill_matcher import SkillMatcher, get_default_matcher
+
+# CV rows unpacked per matrix product, bounding the float temporaries of large matches
+MATCH_BLOCK_ROWS = 4096
+
+
+class JobSkillVectors:
+    """Packed required-skill bits of several jobs, one row per job"""
+
+    def __init__(self, bits: np.ndarray, totals: np.ndarray):
+        self.bits = bits
+        # len(all_detected_skills) of each job, the match percentage denominator
+        self.totals = totals
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+
+class CVSkillVectors:
+    """Packed covered and exact-match bits of several CVs, one row per CV"""
+
+    def __init__(self, covered: np.ndarray, exact: np.ndarray, positions: np.ndarray):
+        self.covered = covered
+        self.exact = exact
+        # Position in the CV's skill list of the skill matching each term, -1 for none
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+class SkillVocabulary:
+    """Integer ids of the taxonomy terms, with encoders and the vectorized matcher.
+
+    Jobs are encoded from analyze_job_requirements results, whose
+    all_detected_skills list a term once per taxonomy category it belongs
+    to, so each term is weighted by that count. Results equal
+    AIJobAssistant._match_cv_skills for every pair.
+    """
+
+    def __init__(self, matcher: Optional[SkillMatcher] = None):
+        matcher = matcher or get_default_matcher()
+        weights = Counter(term for _, term in matcher.entries)
+        self.terms: List[str] = list(weights)
+        self.ids: Dict[str, int] = {term: term_id for term_id, term in enumerate(self.terms)}
+        self.weights = np.array([weights[term] for term in self.terms], dtype=np.float32)
+
+        # Every substring of every term -> ids of the terms containing it, for "CV skill inside term" lookups
+        self._terms_containing: Dict[str, List[int]] = {}
+        for term_id, term in enumerate(self.terms):
+            for substring in substrings(term):
+                self._terms_containing.setdefault(substring, []).append(term_id)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _pack(self, rows: np.ndarray) -> np.ndarray:
+        return np.packbits(rows, axis=1)
+
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        return np.unpackbits(packed, axis=1, count=len(self.terms)).astype(np.float32)
+
+    def encode_jobs(self, requirements: List[Dict]) -> JobSkillVectors:
+        """Encode analyze_job_requirements results as packed bit rows"""
+        rows = np.zeros((len(requirements), len(self.terms)), dtype=np.uint8)
+        totals = np.zeros(len(requirements), dtype=np.int32)
+        for row, job in enumerate(requirements):
+            skills = job['all_detected_skills']
+            try:
+                rows[row, [self.ids[skill] for skill in skills]] = 1
+            except KeyError as e:
+                raise Exception(f"Error encoding job requirements: {e} is not a taxonomy skill")
+            totals[row] = len(skills)
+        return JobSkillVectors(self._pack(rows), totals)
+
+    def encode_cvs(self, cv_skills: List[List[str]]) -> CVSkillVectors:
+        """Encode the skill lists of several CVs (as _extract_all_skills_from_cv returns them)"""
+        positions = np.full((len(cv_skills), len(self.terms)), -1, dtype=np.int32)
+        exact = np.zeros(positions.shape, dtype=np.uint8)
+        for row, skills in enumerate(cv_skills):
+            self._encode_cv(skills, positions[row], exact[row])
+        return CVSkillVectors(self._pack(positions >= 0), self._pack(exact), positions)
+
+    def _encode_cv(self, skills: List[str], positions: np.ndarray, exact: np.ndarray):
+        """Fill one CV's rows with the skill SkillIndex.first_match picks for every term"""
+        index = SkillIndex(skills)
+        lowered = index.lowered
+
+        # Earliest CV skill that is a substring of each term
+        contained: Dict[int, int] = {}
+        for position, value in enumerate(lowered):
+            for term_id in self._terms_containing.get(value, ()):
+                contained.setdefault(term_id, position)
+
+        for term_id, term in enumerate(self.terms):
+            containing = index.first_containing(term)
+            inside = contained.get(term_id)
+            if containing is None:
+                if inside is None:
+                    continue
+                position = inside
+            else:
+                position = containing if inside is None else min(containing, inside)
+            positions[term_id] = position
+            exact[term_id] = lowered[position] == term
+
+    def match_matrix(self, cvs: CVSkillVectors, jobs: JobSkillVectors) -> Dict[str, np.ndarray]:
+        """Match every CV against every job; returns (CVs x jobs) arrays.
+
+        'exact', 'partial' and 'missing' count skills the way
+        _match_cv_skills lists them, and 'match_percentage' is its score.
+        """
+        weighted = (self._unpack(jobs.bits) * self.weights).T
+        matched = np.empty((len(cvs), len(jobs)), dtype=np.int16)
+        exact = np.empty(matched.shape, dtype=np.int16)
+        for start in range(0, len(cvs), MATCH_BLOCK_ROWS):
+            stop = start + MATCH_BLOCK_ROWS
+            # Counts are small integers, so the float32 products are exact
+            matched[start:stop] = self._unpack(cvs.covered[start:stop]) @ weighted
+            exact[start:stop] = self._unpack(cvs.exact[start:stop]) @ weighted
+
+        totals = jobs.totals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentage = np.where(totals > 0, np.floor(matched / totals * 100), 0).astype(np.int16)
+        return {
+            'exact': exact,
+            'partial': matched - exact,
+            'missing': (totals - matched).astype(np.int16),
+            'match_percentage': percentage
+        }
+
+    def missing_skills(self, requirements: Dict, cvs: CVSkillVectors, row: int) -> List[str]:
+        """Required skills a CV lacks, in the order _match_cv_skills lists them"""
+        positions = cvs.positions[row]
+        ids = self.ids
+        return [skill for skill in requirements['all_detected_skills'] if positions[ids[skill]] < 0]
+
+    def to_match_result(self, requirements: Dict, cv_skills: List[str], cvs: CVSkillVectors, row: int) -> Dict:
+        """Convert one CV's vectors back to the dict _match_cv_skills returns for a job"""
+        positions = cvs.positions[row]
+        exact = np.unpackbits(cvs.exact[row], count=len(self.terms))
+        analysis = {
+            'total_jd_skills': len(requirements['all_detected_skills']),
+            'skills_matched': [],
+            'skills_missing': [],
+            'skills_partial_match': [],
+            'match_percentage': 0,
+            'cv_skills_found': cv_skills,
+            'jd_skills_required': requirements['all_detected_skills'],
+            'detailed_analysis': []
+        }
+        for jd_skill in requirements['all_detected_skills']:
+            term_id = self.ids[jd_skill]
+            position = positions[term_id]
+            if position < 0:
+                analysis['skills_missing'].append(jd_skill)
+            elif exact[term_id]:
+                analysis['skills_matched'].append(
+                    {'jd_skill': jd_skill, 'cv_skill': cv_skills[position], 'match_type': 'exact'})
+            else:
+                analysis['skills_partial_match'].append(
+                    {'jd_skill': jd_skill, 'cv_skill': cv_skills[position], 'match_type': 'partial'})
+
+        total_matched = len(analysis['skills_matched']) + len(analysis['skills_partial_match'])
+        if requirements['all_detected_skills']:
+            analysis['match_percentage'] = int((total_matched / len(requirements['all_detected_skills'])) * 100)
+        return analysis
@@ -0,0 +1,46 @@
+import os
+import sqlite3
+import threading
+from typing import Tuple
+
+
+class SQLiteStore:
+    """Base of the stores kept in a SQLite database file.
+
+    Each thread of each process gets its own connection, opened on first
+    use and again after a fork, since a connection cannot cross either.
+    The database runs in WAL mode, so readers never block the single writer
+    and several processes can share one file. Subclasses set the schema
+    created on connect and any pragmas of their own.
+    """
+
+    schema = ""
+    pragmas: Tuple[str, ...] = ()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening a new one after a fork"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        for pragma in ('journal_mode=WAL', 'synchronous=NORMAL') + self.pragmas:
+            connection.execute(f"PRAGMA {pragma}")
+        connection.executescript(self.schema)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def close(self):
+        """Close this thread's connection"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
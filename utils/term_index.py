@@ -0,0 +1,94 @@
+import re
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Optional
+
+from .cv_parser import ParsedCV, parse_cv
+from .instrumentation import metrics
+from .skill_matcher import SkillMatcher, get_default_matcher
+
+# Weight of a mention in each section when scoring skill emphasis
+SECTION_WEIGHTS = {
+    'experience': 2.0,
+    'projects': 1.5,
+    'summary': 1.0,
+    'skills': 0.5,
+}
+
+
+class CVTermIndex:
+    """Per-CV frequency index of taxonomy terms, with per-section counts.
+
+    Built with one matcher pass over the parsed CV buffer, after which counts,
+    section presence and first-occurrence lookups are dictionary reads.
+    """
+
+    def __init__(self, parsed_cv: ParsedCV, matcher: SkillMatcher):
+        self.parsed_cv = parsed_cv
+        self.matcher = matcher
+        self.counts: Counter = Counter()
+        self.section_counts: Dict[str, Counter] = {}
+        self.first_positions: Dict[str, int] = {}
+
+        # Section spans sorted by start, to place each hit with a binary search
+        spans = sorted((span[0], span[1], name) for name, span in parsed_cv.lowered_spans.items())
+        starts = [span[0] for span in spans]
+
+        for term, _, start, end in matcher.iter_matches(parsed_cv.lowered):
+            self.counts[term] += 1
+            self.first_positions.setdefault(term, start)
+
+            position = bisect_right(starts, start) - 1
+            if position >= 0 and end <= spans[position][1]:
+                section = spans[position][2]
+                self.section_counts.setdefault(section, Counter())[term] += 1
+
+    def count(self, term: str, section: Optional[str] = None) -> int:
+        """Return the mentions of a term in the whole CV or in one section"""
+        term = term.lower()
+        if term not in self.matcher:
+            return self._count_with_regex(term, section)
+        if section is None:
+            return self.counts[term]
+        return self.section_counts.get(section, Counter())[term]
+
+    def _count_with_regex(self, term: str, section: Optional[str]) -> int:
+        """Count a term outside the taxonomy the slow way"""
+        text = self.parsed_cv.lowered if section is None else self.parsed_cv.section_lower(section)
+        metrics.count('regex.evaluations')
+        return len(re.findall(r'\b' + re.escape(term) + r'\b', text))
+
+    def is_strong(self, term: str) -> bool:
+        """Listed under skills and backed by experience or repeated mentions"""
+        in_skills = self.count(term, 'skills') > 0
+        in_experience = self.count(term, 'experience') > 0
+        return in_skills and (in_experience or self.count(term) > 1)
+
+    def emphasis(self, term: str) -> Dict:
+        """Return mention counts per section, first occurrence and an emphasis score"""
+        term = term.lower()
+        mentions = self.count(term)
+        sections = {name: counts[term] for name, counts in self.section_counts.items() if counts[term]}
+        first_position = self.first_positions.get(term)
+        # Relative position of the first mention, 0.0 = top of the CV
+        first_relative = first_position / max(len(self.parsed_cv.lowered), 1) if first_position is not None else 1.0
+
+        # Weighted section mentions, mentions outside any section, and a bonus for appearing early
+        score = sum(SECTION_WEIGHTS.get(name, 1.0) * count for name, count in sections.items())
+        score += mentions - sum(sections.values())
+        score += 1.0 - first_relative if mentions else 0.0
+
+        return {
+            'mentions': mentions,
+            'sections': sections,
+            'first_position': first_position,
+            'first_position_relative': round(first_relative, 3),
+            'score': round(score, 3)
+        }
+
+
+@lru_cache(maxsize=32)
+def index_cv(cv_text: str) -> CVTermIndex:
+    """Build the term index of a CV once per text"""
+    return CVTermIndex(parse_cv(cv_text), get_default_matcher())
@@ -0,0 +1,187 @@
+"""TF-IDF text similarity between CVs and job descriptions.
+
+The vocabulary and inverse document frequencies are fitted over a local
+corpus of job descriptions, so the score covers every word the postings
+use rather than only taxonomy skills. NumPy and SciPy load when this
+module is first imported; the application imports it on first use.
+
+Usage (from the project root):
+    python -m utils.tfidf fit --jds jds/
+"""
+import argparse
+import json
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# Default location of the fitted model, overridable from the environment
+TFIDF_MODEL_PATH = os.environ.get('JOB_ASSISTANT_TFIDF_MODEL_PATH', os.path.join('tfidf_model', 'model.json'))
+
+# Words with dots, pluses and hashes inside stay whole: "node.js", "c++", "c#"
+TOKEN_PATTERN = re.compile(r'[a-z][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*')
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does doing
+during each etc for from further had has have having he her here his how i if in into is it its itself
+just more most must my no nor not of off on once only or other our ours out over own per same she should
+so some such than that the their theirs them then there these they this those through to too under until
+up very via was we were what when where which while who whom why will with within without would you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of text, stop words removed"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+class TfidfModel:
+    """Vocabulary and inverse document frequencies of a job description corpus.
+
+    Documents become L2-normalized sparse rows of sublinear term frequency
+    (1 + log tf) times idf, so the dot product of two rows is their cosine
+    similarity. Words outside the vocabulary are dropped, as the job
+    descriptions never contain them. Scoring one CV against many jobs is a
+    single sparse matrix product.
+    """
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, documents: int = 0):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.documents = documents
+
+    @classmethod
+    def fit(cls, documents: Iterable[str], min_df: int = 1, use_idf: bool = True) -> 'TfidfModel':
+        """Fit the vocabulary over a corpus, keeping words found in at least min_df documents.
+
+        use_idf=False weights every word equally, which suits a corpus too
+        small for document frequencies to mean anything.
+        """
+        document_frequency = Counter()
+        count = 0
+        for document in documents:
+            document_frequency.update(set(tokenize(document)))
+            count += 1
+        terms = sorted(term for term, frequency in document_frequency.items() if frequency >= min_df)
+        vocabulary = {term: position for position, term in enumerate(terms)}
+        if use_idf:
+            # Smoothed as if one extra document contained every word, so no weight is zero
+            frequencies = np.array([document_frequency[term] for term in terms], dtype=np.float64)
+            idf = np.log((1 + count) / (1 + frequencies)) + 1
+        else:
+            idf = np.ones(len(terms))
+        return cls(vocabulary, idf, count)
+
+    def transform(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """Return one L2-normalized TF-IDF row per text"""
+        vocabulary = self.vocabulary
+        indices: List[int] = []
+        counts: List[int] = []
+        indptr = [0]
+        for text in texts:
+            terms = Counter(vocabulary[token] for token in tokenize(text) if token in vocabulary)
+            indices.extend(terms)
+            counts.extend(terms.values())
+            indptr.append(len(indices))
+
+        indices_array = np.array(indices, dtype=np.int32)
+        data = (1 + np.log(np.array(counts, dtype=np.float64))) * self.idf[indices_array]
+        matrix = sparse.csr_matrix((data, indices_array, np.array(indptr, dtype=np.int64)),
+                                   shape=(len(indptr) - 1, len(vocabulary)))
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix)
+
+    @staticmethod
+    def similarities(cv_vectors: sparse.csr_matrix, jd_vectors: sparse.csr_matrix) -> np.ndarray:
+        """Cosine similarity of every CV row against every JD row, as a dense (CVs x JDs) array"""
+        return (cv_vectors @ jd_vectors.T).toarray()
+
+    def score(self, cv_text: str, jd_text: str) -> int:
+        """Cosine similarity of one CV and one job description as a percentage"""
+        vectors = self.transform([cv_text, jd_text])
+        return similarity_percentage(vectors[0].multiply(vectors[1]).sum())
+
+    def save(self, path: str = TFIDF_MODEL_PATH):
+        """Write the model to disk atomically"""
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        data = {'documents': self.documents, 'terms': terms, 'idf': self.idf.tolist()}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str = TFIDF_MODEL_PATH) -> 'TfidfModel':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        vocabulary = {term: position for position, term in enumerate(data['terms'])}
+        return cls(vocabulary, np.array(data['idf'], dtype=np.float64), data['documents'])
+
+
+def similarity_percentage(similarity: float) -> int:
+    """Cosine similarity as an integer percentage, like match_percentage"""
+    return int(round(min(max(float(similarity), 0.0), 1.0) * 100))
+
+
+# Model file path -> (modification time, model) of the models already loaded
+_loaded_models: Dict[str, Tuple[int, TfidfModel]] = {}
+
+
+def load_default_model(path: str = TFIDF_MODEL_PATH) -> Optional[TfidfModel]:
+    """The model fitted with `python -m utils.tfidf fit`, or None if there is none.
+
+    The file is read again whenever it changes, so a model fitted while
+    the application is running is used from the next comparison on.
+    """
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    loaded = _loaded_models.get(path)
+    if loaded is None or loaded[0] != modified:
+        loaded = _loaded_models[path] = (modified, TfidfModel.load(path))
+    return loaded[1]
+
+
+def text_similarity(cv_text: str, jd_text: str, model: Optional[TfidfModel] = None) -> int:
+    """TF-IDF similarity of a CV and a job description as a percentage.
+
+    Without a fitted model the two texts are compared by term frequency
+    alone, since one job description says nothing about how rare a word is.
+    """
+    model = model or load_default_model()
+    if model is None:
+        model = TfidfModel.fit([cv_text, jd_text], use_idf=False)
+    return model.score(cv_text, jd_text)
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Fit the TF-IDF similarity model over job descriptions")
+    commands = parser.add_subparsers(dest='command', required=True)
+    fit = commands.add_parser('fit', help="fit the vocabulary over a folder of job descriptions")
+    fit.add_argument('--jds', required=True, help="folder of job descriptions (PDF, DOCX, TXT)")
+    fit.add_argument('--min-df', type=int, default=1, help="drop words found in fewer job descriptions")
+    fit.add_argument('--output', default=TFIDF_MODEL_PATH, help="model file")
+    args = parser.parse_args(argv)
+
+    from .batch_scoring import list_documents
+    from .file_processor import FileProcessor
+
+    texts = []
+    for path in list_documents(args.jds):
+        try:
+            texts.append(FileProcessor.process_file_path(path))
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+    model = TfidfModel.fit(texts, min_df=args.min_df)
+    model.save(args.output)
+    print(f"Fitted {len(model.vocabulary)} terms over {model.documents} job descriptions into {args.output}")
+
+
+if __name__ == "__main__":
+    main()